@@ -57,8 +57,8 @@ def stock():
 @click.option("--interval", "-i", default=10, help="Refresh interval in seconds (default: 10)")
 @click.option("--detailed", "-d", is_flag=True, help="Show detailed quote information")
 @click.option("--debug", is_flag=True, help="Enable debug output")
-@click.option("--export", type=click.Choice(['json', 'csv', 'both'], case_sensitive=False),
-              help="Export quotes to file format")
+@click.option("--export", type=click.Choice(['json', 'csv', 'both', 'parquet'], case_sensitive=False),
+              help="Export quotes to file format (parquet requires pyarrow)")
 @click.option("--output-dir", type=click.Path(file_okay=False),
               help="Directory to save exported files (default: project's exports directory)")
 @click.option("--use-home-dir", is_flag=True,
@@ -110,6 +110,8 @@ def quote(symbols: List[str], refresh: bool, interval: int, detailed: bool, debu
         export_formats = ['csv']
     elif export == 'both':
         export_formats = ['json', 'csv']
+    elif export == 'parquet':
+        export_formats = ['parquet']
 
     # Handle output directory
     export_output_dir = None
@@ -160,8 +162,8 @@ def stop():
 
 
 @stock.command()
-@click.option("--format", "-f", type=click.Choice(['json', 'csv', 'both'], case_sensitive=False),
-              default='both', help="Export format (default: both)")
+@click.option("--format", "-f", type=click.Choice(['json', 'csv', 'both', 'parquet'], case_sensitive=False),
+              default='both', help="Export format (default: both; parquet requires pyarrow)")
 @click.option("--output-dir", "-o", type=click.Path(file_okay=False),
               help="Directory to save exported files (default: project's exports directory)")
 @click.option("--use-home-dir", is_flag=True,
@@ -198,6 +200,8 @@ def export_last(format: str, output_dir: Optional[str], use_home_dir: bool):
         export_formats = ['csv']
     elif format == 'both':
         export_formats = ['json', 'csv']
+    elif format == 'parquet':
+        export_formats = ['parquet']
 
     # Handle output directory
     export_output_dir = None
@@ -2772,8 +2776,8 @@ def search_symbols(query, limit, type, exchange, country, export, output_dir, us
               help="Include extended hours data (pre/post market) for stocks")
 @click.option("--limit", "-l", type=int, default=10,
               help="Maximum number of data points to display (default: 10, 0 for all)")
-@click.option("--export", type=click.Choice(['json', 'csv', 'both'], case_sensitive=False),
-              help="Export results to file format")
+@click.option("--export", type=click.Choice(['json', 'csv', 'both', 'parquet'], case_sensitive=False),
+              help="Export results to file format (parquet requires pyarrow)")
 @click.option("--output-dir", type=click.Path(file_okay=False),
               help="Directory to save exported files")
 @click.option("--use-home-dir", is_flag=True,
@@ -2804,7 +2808,7 @@ def get_time_series(symbol, interval, outputsize, start_date, end_date, order, i
     stockcli stock time-series AAPL --export csv
     """
     from app.utils.display import display_time_series_response, create_progress_spinner
-    from app.utils.export import export_to_json, export_time_series_to_csv, get_default_export_dir, get_home_export_dir
+    from app.utils.export import export_to_json, export_time_series_to_csv, export_time_series_to_parquet, get_default_export_dir, get_home_export_dir
     from app.models.stock import TimeSeries
     from pathlib import Path
 
@@ -2839,6 +2843,8 @@ def get_time_series(symbol, interval, outputsize, start_date, end_date, order, i
                 export_formats = ['json']
             elif export == 'csv':
                 export_formats = ['csv']
+            elif export == 'parquet':
+                export_formats = ['parquet']
             else:  # both
                 export_formats = ['json', 'csv']
 
@@ -2870,6 +2876,11 @@ def get_time_series(symbol, interval, outputsize, start_date, end_date, order, i
                 export_time_series_to_csv(time_series, csv_path)
                 export_results['csv'] = csv_path
 
+            if 'parquet' in export_formats:
+                parquet_path = export_dir / f"{filename_prefix}.parquet"
+                if export_time_series_to_parquet(time_series, parquet_path):
+                    export_results['parquet'] = parquet_path
+
             if export_results:
                 click.echo("\nExported time series data to:")
                 for fmt, path in export_results.items():
@@ -4532,8 +4543,8 @@ def compare_stock_splits_command(symbols: List[str], years: int,
               default='calendar', help="View mode (default: calendar)")
 @click.option("--forward-only", is_flag=True, help="Show only forward splits")
 @click.option("--reverse-only", is_flag=True, help="Show only reverse splits")
-@click.option("--export", type=click.Choice(['json', 'csv', 'both'], case_sensitive=False),
-              help="Export splits calendar to file format")
+@click.option("--export", type=click.Choice(['json', 'csv', 'both', 'parquet'], case_sensitive=False),
+              help="Export splits calendar to file format (parquet requires pyarrow)")
 @click.option("--output-dir", type=click.Path(file_okay=False),
               help="Directory to save exported files")
 @click.option("--use-home-dir", is_flag=True,
@@ -4671,6 +4682,8 @@ def splits_calendar_command(start_date: Optional[str], end_date: Optional[str],
                     export_formats = ['csv']
                 elif export == 'both':
                     export_formats = ['json', 'csv']
+                elif export == 'parquet':
+                    export_formats = ['parquet']
                 
                 # Determine output directory
                 if output_dir:
@@ -4788,8 +4801,8 @@ def get_income_statement_command(symbol, period, count, detailed, export, output
               help="Number of periods to compare (default: 4, max: 20)")
 @click.option("--expenses", "-e", is_flag=True, 
               help="Focus on expense breakdown comparison")
-@click.option("--export", type=click.Choice(['json', 'csv', 'both'], case_sensitive=False),
-              help="Export comparison data to file format")
+@click.option("--export", type=click.Choice(['json', 'csv', 'both', 'arrow'], case_sensitive=False),
+              help="Export comparison data to file format (arrow requires pyarrow)")
 @click.option("--output-dir", type=click.Path(file_okay=False),
               help="Directory to save exported files")
 @click.option("--use-home-dir", is_flag=True,
@@ -4842,6 +4855,8 @@ def compare_income_statements_command(symbol, period, count, expenses, export, o
             export_formats = ['csv']
         elif export == 'both':
             export_formats = ['json', 'csv']
+        elif export == 'arrow':
+            export_formats = ['arrow']
             
         # Determine output directory
         if output_dir:
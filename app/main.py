@@ -51,8 +51,8 @@ def version():
 @click.option("--interval", "-i", default=10, help="Refresh interval in seconds (default: 10)")
 @click.option("--detailed", "-d", is_flag=True, help="Show detailed quote information")
 @click.option("--debug", is_flag=True, help="Enable debug output")
-@click.option("--export", type=click.Choice(['json', 'csv', 'both'], case_sensitive=False),
-              help="Export quotes to file format")
+@click.option("--export", type=click.Choice(['json', 'csv', 'both', 'parquet'], case_sensitive=False),
+              help="Export quotes to file format (parquet requires pyarrow)")
 @click.option("--output-dir", type=click.Path(file_okay=False),
               help="Directory to save exported files (default: project's exports directory)")
 @click.option("--use-home-dir", is_flag=True,
@@ -73,6 +73,8 @@ def quote_shortcut(symbols, refresh, interval, detailed, debug, export, output_d
         export_formats = ['csv']
     elif export == 'both':
         export_formats = ['json', 'csv']
+    elif export == 'parquet':
+        export_formats = ['parquet']
 
     # Handle output directory
     export_output_dir = None
@@ -109,8 +111,8 @@ def quote_shortcut(symbols, refresh, interval, detailed, debug, export, output_d
 
 
 @cli.command(name="export-last")
-@click.option("--format", "-f", type=click.Choice(['json', 'csv', 'both'], case_sensitive=False),
-              default='both', help="Export format (default: both)")
+@click.option("--format", "-f", type=click.Choice(['json', 'csv', 'both', 'parquet'], case_sensitive=False),
+              default='both', help="Export format (default: both; parquet requires pyarrow)")
 @click.option("--output-dir", "-o", type=click.Path(file_okay=False),
               help="Directory to save exported files (default: project's exports directory)")
 @click.option("--use-home-dir", is_flag=True,
@@ -1044,8 +1046,8 @@ def search_shortcut(query, limit, type, exchange, country, export, output_dir, u
               help="Include extended hours data (pre/post market) for stocks")
 @click.option("--limit", "-l", type=int, default=10,
               help="Maximum number of data points to display (default: 10, 0 for all)")
-@click.option("--export", type=click.Choice(['json', 'csv', 'both'], case_sensitive=False),
-              help="Export results to file format")
+@click.option("--export", type=click.Choice(['json', 'csv', 'both', 'parquet'], case_sensitive=False),
+              help="Export results to file format (parquet requires pyarrow)")
 @click.option("--output-dir", type=click.Path(file_okay=False),
               help="Directory to save exported files")
 @click.option("--use-home-dir", is_flag=True,
@@ -1530,8 +1532,8 @@ def compare_stock_splits_shortcut(symbols, years, export, output_dir, use_home_d
               default='calendar', help="View mode (default: calendar)")
 @click.option("--forward-only", is_flag=True, help="Show only forward splits")
 @click.option("--reverse-only", is_flag=True, help="Show only reverse splits")
-@click.option("--export", type=click.Choice(['json', 'csv', 'both'], case_sensitive=False),
-              help="Export splits calendar to file format")
+@click.option("--export", type=click.Choice(['json', 'csv', 'both', 'parquet'], case_sensitive=False),
+              help="Export splits calendar to file format (parquet requires pyarrow)")
 @click.option("--output-dir", type=click.Path(file_okay=False),
               help="Directory to save exported files")
 @click.option("--use-home-dir", is_flag=True,
@@ -1601,8 +1603,8 @@ def get_income_statement_shortcut(symbol, period, count, detailed, export, outpu
               help="Number of periods to compare (default: 4, max: 20)")
 @click.option("--expenses", "-e", is_flag=True,
               help="Focus on expense breakdown comparison")
-@click.option("--export", type=click.Choice(['json', 'csv', 'both'], case_sensitive=False),
-              help="Export comparison data to file format")
+@click.option("--export", type=click.Choice(['json', 'csv', 'both', 'arrow'], case_sensitive=False),
+              help="Export comparison data to file format (arrow requires pyarrow)")
 @click.option("--output-dir", type=click.Path(file_okay=False),
               help="Directory to save exported files")
 @click.option("--use-home-dir", is_flag=True,
@@ -1740,8 +1742,8 @@ def get_balance_sheet_command(symbol, period, count, detailed, export, output_di
               help="Number of periods to compare (default: 4, max: 20)")
 @click.option("--focus", "-f", type=click.Choice(['full', 'assets', 'liabilities', 'equity', 'ratios']),
               default='full', help="Focus on specific section (default: full balance sheet)")
-@click.option("--export", type=click.Choice(['json', 'csv', 'both'], case_sensitive=False),
-              help="Export comparison data to file format")
+@click.option("--export", type=click.Choice(['json', 'csv', 'both', 'arrow'], case_sensitive=False),
+              help="Export comparison data to file format (arrow requires pyarrow)")
 @click.option("--output-dir", type=click.Path(file_okay=False),
               help="Directory to save exported files")
 @click.option("--use-home-dir", is_flag=True,
@@ -1794,6 +1796,8 @@ def compare_balance_sheets_command(symbol, period, count, focus, export, output_
             export_formats = ['csv']
         elif export == 'both':
             export_formats = ['json', 'csv']
+        elif export == 'arrow':
+            export_formats = ['arrow']
 
         # Determine output directory
         if output_dir:
@@ -1955,8 +1959,8 @@ def get_balance_sheet_shortcut(symbol, period, count, detailed, export, output_d
               help="Number of periods to compare (default: 4, max: 20)")
 @click.option("--focus", "-f", type=click.Choice(['full', 'assets', 'liabilities', 'equity', 'ratios']),
               default='full', help="Focus on specific section (default: full balance sheet)")
-@click.option("--export", type=click.Choice(['json', 'csv', 'both'], case_sensitive=False),
-              help="Export comparison data to file format")
+@click.option("--export", type=click.Choice(['json', 'csv', 'both', 'arrow'], case_sensitive=False),
+              help="Export comparison data to file format (arrow requires pyarrow)")
 @click.option("--output-dir", type=click.Path(file_okay=False),
               help="Directory to save exported files")
 @click.option("--use-home-dir", is_flag=True,
@@ -2106,8 +2110,8 @@ def get_consolidated_balance_sheet_command(symbol, period, count, detailed, expo
               help="Number of periods to compare (default: 4, max: 20)")
 @click.option("--focus", "-f", type=click.Choice(['full', 'assets', 'liabilities', 'equity', 'ratios']),
               default='full', help="Focus on specific section (default: full balance sheet)")
-@click.option("--export", type=click.Choice(['json', 'csv', 'both'], case_sensitive=False),
-              help="Export comparison data to file format")
+@click.option("--export", type=click.Choice(['json', 'csv', 'both', 'arrow'], case_sensitive=False),
+              help="Export comparison data to file format (arrow requires pyarrow)")
 @click.option("--output-dir", type=click.Path(file_okay=False),
               help="Directory to save exported files")
 @click.option("--use-home-dir", is_flag=True,
@@ -2164,6 +2168,8 @@ def compare_consolidated_balance_sheets_command(symbol, period, count, focus, ex
             export_formats = ['csv']
         elif export == 'both':
             export_formats = ['json', 'csv']
+        elif export == 'arrow':
+            export_formats = ['arrow']
 
         # Determine output directory
         if output_dir:
@@ -2345,8 +2351,8 @@ def get_consolidated_balance_sheet_shortcut(symbol, period, count, detailed, exp
               help="Number of periods to compare (default: 4, max: 20)")
 @click.option("--focus", "-f", type=click.Choice(['full', 'assets', 'liabilities', 'equity', 'ratios']),
               default='full', help="Focus on specific section (default: full balance sheet)")
-@click.option("--export", type=click.Choice(['json', 'csv', 'both'], case_sensitive=False),
-              help="Export comparison data to file format")
+@click.option("--export", type=click.Choice(['json', 'csv', 'both', 'arrow'], case_sensitive=False),
+              help="Export comparison data to file format (arrow requires pyarrow)")
 @click.option("--output-dir", type=click.Path(file_okay=False),
               help="Directory to save exported files")
 @click.option("--use-home-dir", is_flag=True,
@@ -2,13 +2,15 @@
 Model for company analyst estimates data from the TwelveData API.
 """
 from datetime import datetime
-from typing import Dict, List, Union, Optional, Any
+from typing import Dict, List, Union, Optional, Any, ClassVar, Tuple
 
 
 class EpsEstimate:
     """
     Represents an EPS estimate for a particular period (quarterly or annual).
     """
+    _CSV_HEADER: ClassVar[Tuple[str, ...]] = ("Period", "Estimated EPS", "Analyst Count", "Actual EPS", "Surprise")
+
     def __init__(self, period: str, period_end_date: str, 
                  estimate_value: float, estimate_count: int,
                  actual_value: Optional[float] = None,
@@ -87,24 +89,30 @@ class EpsEstimate:
             "surprise_percent": self.surprise_percent
         }
     
-    def to_csv_row(self) -> Dict[str, str]:
-        """Format for CSV export"""
+    def to_csv_tuple(self) -> Tuple[str, ...]:
+        """Format for CSV export as a row ordered like the CSV header"""
         actual_str = f"{self.actual_value:.2f}" if self.actual_value is not None else "Not reported"
         surprise_str = f"{self.surprise_value:.2f} ({self.surprise_percent:.2f}%)" if self.surprise_value is not None else "N/A"
         
-        return {
-            "Period": self.period_str,
-            "Estimated EPS": f"{self.estimate_value:.2f}",
-            "Analyst Count": str(self.estimate_count),
-            "Actual EPS": actual_str,
-            "Surprise": surprise_str
-        }
+        return (
+            self.period_str,
+            f"{self.estimate_value:.2f}",
+            str(self.estimate_count),
+            actual_str,
+            surprise_str
+        )
+    
+    def to_csv_row(self) -> Dict[str, str]:
+        """Format for CSV export"""
+        return dict(zip(self._CSV_HEADER, self.to_csv_tuple()))
 
 
 class RevenueEstimate:
     """
     Represents a revenue estimate for a particular period (quarterly or annual).
     """
+    _CSV_HEADER: ClassVar[Tuple[str, ...]] = ("Period", "Estimated Revenue", "Analyst Count", "Actual Revenue", "Surprise")
+
     def __init__(self, period: str, period_end_date: str, 
                  estimate_value: float, estimate_count: int,
                  actual_value: Optional[float] = None,
@@ -183,19 +191,23 @@ class RevenueEstimate:
             "surprise_percent": self.surprise_percent
         }
     
-    def to_csv_row(self) -> Dict[str, str]:
-        """Format for CSV export"""
+    def to_csv_tuple(self) -> Tuple[str, ...]:
+        """Format for CSV export as a row ordered like the CSV header"""
         estimate_str = f"${self.estimate_value:,.2f}M" if self.estimate_value is not None else "N/A"
         actual_str = f"${self.actual_value:,.2f}M" if self.actual_value is not None else "Not reported"
         surprise_str = f"${self.surprise_value:,.2f}M ({self.surprise_percent:.2f}%)" if self.surprise_value is not None else "N/A"
         
-        return {
-            "Period": self.period_str,
-            "Estimated Revenue": estimate_str,
-            "Analyst Count": str(self.estimate_count),
-            "Actual Revenue": actual_str,
-            "Surprise": surprise_str
-        }
+        return (
+            self.period_str,
+            estimate_str,
+            str(self.estimate_count),
+            actual_str,
+            surprise_str
+        )
+    
+    def to_csv_row(self) -> Dict[str, str]:
+        """Format for CSV export"""
+        return dict(zip(self._CSV_HEADER, self.to_csv_tuple()))
 
 
 class AnalystTarget:
@@ -289,6 +301,12 @@ class RecommendationTrend:
     """
     Represents analyst recommendation trends for a stock.
     """
+
+    _CSV_HEADER: ClassVar[Tuple[str, ...]] = (
+        "Period", "Strong Buy", "Buy", "Hold", "Sell", "Strong Sell",
+        "Total Analysts", "Average Score", "Recommendation"
+    )
+
     def __init__(self, 
                  period: str,
                  strong_buy: int = 0,
@@ -352,22 +370,23 @@ class RecommendationTrend:
             "score": self.score
         }
     
+    def to_csv_tuple(self) -> Tuple[str, ...]:
+        """Format for CSV export as a row ordered like the CSV header"""
+        return (
+            self.period,
+            str(self.strong_buy),
+            str(self.buy),
+            str(self.hold),
+            str(self.sell),
+            str(self.strong_sell),
+            str(self.total_analysts),
+            f"{self.score:.2f}",
+            self._get_recommendation_str()
+        )
+    
     def to_csv_row(self) -> Dict[str, str]:
         """Format for CSV export"""
-        # Get recommendation string
-        rec_str = self._get_recommendation_str()
-        
-        return {
-            "Period": self.period,
-            "Strong Buy": str(self.strong_buy),
-            "Buy": str(self.buy),
-            "Hold": str(self.hold),
-            "Sell": str(self.sell),
-            "Strong Sell": str(self.strong_sell),
-            "Total Analysts": str(self.total_analysts),
-            "Average Score": f"{self.score:.2f}",
-            "Recommendation": rec_str
-        }
+        return dict(zip(self._CSV_HEADER, self.to_csv_tuple()))
     
     def _get_recommendation_str(self) -> str:
         """Convert score to a recommendation string"""
@@ -530,65 +549,60 @@ class AnalystEstimates:
             
         return result
     
-    def get_csv_rows_eps_estimates(self) -> List[Dict[str, str]]:
-        """Format EPS estimates for CSV export"""
+    @staticmethod
+    def _csv_row_tuples(label: str, quarterly_estimates: List[Any],
+                        annual_estimates: List[Any]) -> List[Tuple[str, ...]]:
+        """Lay out quarterly and annual estimates as CSV rows under section titles"""
         rows = []
         
-        # Add quarterly EPS estimates
-        if self.quarterly_eps_estimates:
-            rows.append({"Period": "QUARTERLY EPS ESTIMATES", "Estimated EPS": "", "Analyst Count": "", "Actual EPS": "", "Surprise": ""})
-            for estimate in self.quarterly_eps_estimates:
-                rows.append(estimate.to_csv_row())
+        # Add quarterly estimates
+        if quarterly_estimates:
+            rows.append((f"QUARTERLY {label} ESTIMATES", "", "", "", ""))
+            rows.extend(estimate.to_csv_tuple() for estimate in quarterly_estimates)
         
         # Add a separator
-        if self.quarterly_eps_estimates and self.annual_eps_estimates:
-            rows.append({"Period": "", "Estimated EPS": "", "Analyst Count": "", "Actual EPS": "", "Surprise": ""})
+        if quarterly_estimates and annual_estimates:
+            rows.append(("", "", "", "", ""))
         
-        # Add annual EPS estimates
-        if self.annual_eps_estimates:
-            rows.append({"Period": "ANNUAL EPS ESTIMATES", "Estimated EPS": "", "Analyst Count": "", "Actual EPS": "", "Surprise": ""})
-            for estimate in self.annual_eps_estimates:
-                rows.append(estimate.to_csv_row())
+        # Add annual estimates
+        if annual_estimates:
+            rows.append((f"ANNUAL {label} ESTIMATES", "", "", "", ""))
+            rows.extend(estimate.to_csv_tuple() for estimate in annual_estimates)
                 
         return rows
     
+    def get_csv_row_tuples_eps_estimates(self) -> List[Tuple[str, ...]]:
+        """Format EPS estimates for CSV export as rows ordered like get_csv_headers_eps()"""
+        return self._csv_row_tuples("EPS", self.quarterly_eps_estimates, self.annual_eps_estimates)
+    
+    def get_csv_row_tuples_revenue_estimates(self) -> List[Tuple[str, ...]]:
+        """Format revenue estimates for CSV export as rows ordered like get_csv_headers_revenue()"""
+        return self._csv_row_tuples("REVENUE", self.quarterly_revenue_estimates, self.annual_revenue_estimates)
+    
+    def get_csv_rows_eps_estimates(self) -> List[Dict[str, str]]:
+        """Format EPS estimates for CSV export"""
+        header = self.get_csv_headers_eps()
+        return [dict(zip(header, row)) for row in self.get_csv_row_tuples_eps_estimates()]
+    
     def get_csv_rows_revenue_estimates(self) -> List[Dict[str, str]]:
         """Format revenue estimates for CSV export"""
-        rows = []
-        
-        # Add quarterly revenue estimates
-        if self.quarterly_revenue_estimates:
-            rows.append({"Period": "QUARTERLY REVENUE ESTIMATES", "Estimated Revenue": "", "Analyst Count": "", "Actual Revenue": "", "Surprise": ""})
-            for estimate in self.quarterly_revenue_estimates:
-                rows.append(estimate.to_csv_row())
-        
-        # Add a separator
-        if self.quarterly_revenue_estimates and self.annual_revenue_estimates:
-            rows.append({"Period": "", "Estimated Revenue": "", "Analyst Count": "", "Actual Revenue": "", "Surprise": ""})
-        
-        # Add annual revenue estimates
-        if self.annual_revenue_estimates:
-            rows.append({"Period": "ANNUAL REVENUE ESTIMATES", "Estimated Revenue": "", "Analyst Count": "", "Actual Revenue": "", "Surprise": ""})
-            for estimate in self.annual_revenue_estimates:
-                rows.append(estimate.to_csv_row())
-                
-        return rows
+        header = self.get_csv_headers_revenue()
+        return [dict(zip(header, row)) for row in self.get_csv_row_tuples_revenue_estimates()]
     
     @staticmethod
     def get_csv_headers_eps() -> List[str]:
         """Get headers for EPS estimates CSV export"""
-        return ["Period", "Estimated EPS", "Analyst Count", "Actual EPS", "Surprise"]
+        return list(EpsEstimate._CSV_HEADER)
     
     @staticmethod
     def get_csv_headers_revenue() -> List[str]:
         """Get headers for revenue estimates CSV export"""
-        return ["Period", "Estimated Revenue", "Analyst Count", "Actual Revenue", "Surprise"]
+        return list(RevenueEstimate._CSV_HEADER)
     
     @staticmethod
     def get_csv_headers_recommendations() -> List[str]:
         """Get headers for recommendations CSV export"""
-        return ["Period", "Strong Buy", "Buy", "Hold", "Sell", "Strong Sell", 
-                "Total Analysts", "Average Score", "Recommendation"]
+        return list(RecommendationTrend._CSV_HEADER)
     
     def get_eps_estimate_history(self, period: str) -> Optional[Dict[str, Any]]:
         """
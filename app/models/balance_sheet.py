@@ -2,13 +2,16 @@
 Model for company balance sheet data from the TwelveData API.
 """
 from datetime import datetime
-from typing import Dict, List, Union, Optional, Any
+from typing import Dict, List, Union, Optional, Any, ClassVar, Tuple
 
 
 class BalanceSheetItem:
     """
     Represents an individual line item in a balance sheet.
     """
+
+    _CSV_HEADER: ClassVar[Tuple[str, ...]] = ("Item", "Value", "Percentage")
+
     def __init__(self, name: str, value: Union[float, int], percentage: Optional[float] = None,
                  value_str: Optional[str] = None, percentage_str: Optional[str] = None):
         self.name = name
@@ -49,11 +52,11 @@ class BalanceSheetItem:
         
     def to_csv_row(self) -> Dict[str, str]:
         """Format for CSV export"""
-        return {
-            "Item": self.name,
-            "Value": self.value_str,
-            "Percentage": self.percentage_str
-        }
+        return dict(zip(self._CSV_HEADER, self.to_csv_tuple()))
+
+    def to_csv_tuple(self) -> Tuple[str, ...]:
+        """Format for CSV export as a tuple ordered like the CSV header"""
+        return (self.name, self.value_str, self.percentage_str)
 
 
 class BalanceSheetSection:
@@ -86,18 +89,23 @@ class BalanceSheetSection:
         
     def get_csv_rows(self) -> List[Dict[str, str]]:
         """Format section for CSV export"""
+        header = BalanceSheetItem._CSV_HEADER
+        return [dict(zip(header, row)) for row in self.get_csv_tuples()]
+
+    def get_csv_tuples(self) -> List[Tuple[str, ...]]:
+        """Format section for CSV export as tuples ordered like the CSV header"""
         rows = []
         
         # Add section header
-        rows.append({"Item": f"--- {self.name} ---", "Value": "", "Percentage": ""})
+        rows.append((f"--- {self.name} ---", "", ""))
         
         # Add items
         for item in self.items:
-            rows.append(item.to_csv_row())
+            rows.append(item.to_csv_tuple())
             
         # Add total if available
         if self.total:
-            rows.append(self.total.to_csv_row())
+            rows.append(self.total.to_csv_tuple())
             
         return rows
 
@@ -106,6 +114,9 @@ class BalanceSheet:
     """
     Represents a company's balance sheet for a specific period.
     """
+
+    _CSV_HEADER: ClassVar[Tuple[str, ...]] = BalanceSheetItem._CSV_HEADER
+
     def __init__(self, 
                  symbol: str,
                  fiscal_date: str,
@@ -397,49 +408,55 @@ class BalanceSheet:
         
     def get_csv_rows(self) -> List[Dict[str, str]]:
         """Create rows for CSV export"""
+        header = self._CSV_HEADER
+        return [dict(zip(header, row)) for row in self.get_csv_tuples()]
+    
+    def get_csv_tuples(self) -> List[Tuple[str, ...]]:
+        """Create CSV rows as tuples ordered like get_csv_headers()"""
         rows = []
+        separator = ("", "", "")  # Empty row as separator
         
         # Basic info
-        rows.append({"Item": "Symbol", "Value": self.symbol, "Percentage": ""})
-        rows.append({"Item": "Fiscal Date", "Value": self.fiscal_date, "Percentage": ""})
-        rows.append({"Item": "Fiscal Period", "Value": self.fiscal_period, "Percentage": ""})
-        rows.append({"Item": "Currency", "Value": self.currency, "Percentage": ""})
-        rows.append({"Item": "", "Value": "", "Percentage": ""})  # Empty row as separator
+        rows.append(("Symbol", self.symbol, ""))
+        rows.append(("Fiscal Date", self.fiscal_date, ""))
+        rows.append(("Fiscal Period", self.fiscal_period, ""))
+        rows.append(("Currency", self.currency, ""))
+        rows.append(separator)
         
         # Assets section
-        rows.append({"Item": "ASSETS", "Value": "", "Percentage": ""})
-        rows.extend(self.current_assets.get_csv_rows())
-        rows.extend(self.non_current_assets.get_csv_rows())
-        rows.append({"Item": "", "Value": "", "Percentage": ""})  # Empty row as separator
-        rows.append(self.total_assets.to_csv_row())
-        rows.append({"Item": "", "Value": "", "Percentage": ""})  # Empty row as separator
+        rows.append(("ASSETS", "", ""))
+        rows.extend(self.current_assets.get_csv_tuples())
+        rows.extend(self.non_current_assets.get_csv_tuples())
+        rows.append(separator)
+        rows.append(self.total_assets.to_csv_tuple())
+        rows.append(separator)
         
         # Liabilities section
-        rows.append({"Item": "LIABILITIES", "Value": "", "Percentage": ""})
-        rows.extend(self.current_liabilities.get_csv_rows())
-        rows.extend(self.non_current_liabilities.get_csv_rows())
-        rows.append({"Item": "", "Value": "", "Percentage": ""})  # Empty row as separator
-        rows.append(self.total_liabilities.to_csv_row())
-        rows.append({"Item": "", "Value": "", "Percentage": ""})  # Empty row as separator
+        rows.append(("LIABILITIES", "", ""))
+        rows.extend(self.current_liabilities.get_csv_tuples())
+        rows.extend(self.non_current_liabilities.get_csv_tuples())
+        rows.append(separator)
+        rows.append(self.total_liabilities.to_csv_tuple())
+        rows.append(separator)
         
         # Shareholders' Equity section
-        rows.append({"Item": "SHAREHOLDERS' EQUITY", "Value": "", "Percentage": ""})
-        rows.extend(self.shareholders_equity.get_csv_rows())
-        rows.append({"Item": "", "Value": "", "Percentage": ""})  # Empty row as separator
+        rows.append(("SHAREHOLDERS' EQUITY", "", ""))
+        rows.extend(self.shareholders_equity.get_csv_tuples())
+        rows.append(separator)
         
         # Total Liabilities and Equity
-        rows.append(self.total_liabilities_and_equity.to_csv_row())
-        rows.append({"Item": "", "Value": "", "Percentage": ""})  # Empty row as separator
+        rows.append(self.total_liabilities_and_equity.to_csv_tuple())
+        rows.append(separator)
         
         # Ratios
-        rows.append({"Item": "KEY FINANCIAL RATIOS", "Value": "", "Percentage": ""})
-        rows.append(self.current_ratio.to_csv_row())
-        rows.append(self.debt_to_equity.to_csv_row())
-        rows.append(self.debt_ratio.to_csv_row())
+        rows.append(("KEY FINANCIAL RATIOS", "", ""))
+        rows.append(self.current_ratio.to_csv_tuple())
+        rows.append(self.debt_to_equity.to_csv_tuple())
+        rows.append(self.debt_ratio.to_csv_tuple())
         
         return rows
     
-    @staticmethod
-    def get_csv_headers() -> List[str]:
+    @classmethod
+    def get_csv_headers(cls) -> Tuple[str, ...]:
         """Get headers for CSV export"""
-        return ["Item", "Value", "Percentage"]
\ No newline at end of file
+        return cls._CSV_HEADER
\ No newline at end of file
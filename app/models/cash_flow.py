@@ -2,13 +2,16 @@
 Model for company cash flow data from the TwelveData API.
 """
 from datetime import datetime
-from typing import Dict, List, Union, Optional, Any
+from typing import Dict, List, Union, Optional, Any, ClassVar, Tuple
 
 
 class CashFlowItem:
     """
     Represents an individual line item in a cash flow statement.
     """
+
+    _CSV_HEADER: ClassVar[Tuple[str, ...]] = ("Item", "Value", "Flow Type")
+
     def __init__(self, name: str, value: Union[float, int], value_str: Optional[str] = None):
         self.name = name
         self.value = value
@@ -47,11 +50,11 @@ class CashFlowItem:
         
     def to_csv_row(self) -> Dict[str, str]:
         """Format for CSV export"""
-        return {
-            "Item": self.name,
-            "Value": self.value_str,
-            "Flow Type": self.flow_type.capitalize()
-        }
+        return dict(zip(self._CSV_HEADER, self.to_csv_tuple()))
+
+    def to_csv_tuple(self) -> Tuple[str, ...]:
+        """Format for CSV export as a tuple ordered like the CSV header"""
+        return (self.name, self.value_str, self.flow_type.capitalize())
 
 
 class CashFlowSection:
@@ -84,18 +87,23 @@ class CashFlowSection:
         
     def get_csv_rows(self) -> List[Dict[str, str]]:
         """Format section for CSV export"""
+        header = CashFlowItem._CSV_HEADER
+        return [dict(zip(header, row)) for row in self.get_csv_tuples()]
+
+    def get_csv_tuples(self) -> List[Tuple[str, ...]]:
+        """Format section for CSV export as tuples ordered like the CSV header"""
         rows = []
         
         # Add section header
-        rows.append({"Item": f"--- {self.name} ---", "Value": "", "Flow Type": ""})
+        rows.append((f"--- {self.name} ---", "", ""))
         
         # Add items
         for item in self.items:
-            rows.append(item.to_csv_row())
+            rows.append(item.to_csv_tuple())
             
         # Add total if available
         if self.total:
-            rows.append(self.total.to_csv_row())
+            rows.append(self.total.to_csv_tuple())
             
         return rows
 
@@ -104,6 +112,9 @@ class CashFlow:
     """
     Represents a company's cash flow statement for a specific period.
     """
+
+    _CSV_HEADER: ClassVar[Tuple[str, ...]] = CashFlowItem._CSV_HEADER
+
     def __init__(self, 
                  symbol: str,
                  fiscal_date: str,
@@ -304,43 +315,49 @@ class CashFlow:
         
     def get_csv_rows(self) -> List[Dict[str, str]]:
         """Create rows for CSV export"""
+        header = self._CSV_HEADER
+        return [dict(zip(header, row)) for row in self.get_csv_tuples()]
+    
+    def get_csv_tuples(self) -> List[Tuple[str, ...]]:
+        """Create CSV rows as tuples ordered like get_csv_headers()"""
         rows = []
+        separator = ("", "", "")  # Empty row as separator
         
         # Basic info
-        rows.append({"Item": "Symbol", "Value": self.symbol, "Flow Type": ""})
-        rows.append({"Item": "Fiscal Date", "Value": self.fiscal_date, "Flow Type": ""})
-        rows.append({"Item": "Fiscal Period", "Value": self.fiscal_period, "Flow Type": ""})
-        rows.append({"Item": "Currency", "Value": self.currency, "Flow Type": ""})
-        rows.append({"Item": "", "Value": "", "Flow Type": ""})  # Empty row as separator
+        rows.append(("Symbol", self.symbol, ""))
+        rows.append(("Fiscal Date", self.fiscal_date, ""))
+        rows.append(("Fiscal Period", self.fiscal_period, ""))
+        rows.append(("Currency", self.currency, ""))
+        rows.append(separator)
         
         # Beginning cash balance
-        rows.append(self.beginning_cash.to_csv_row())
-        rows.append({"Item": "", "Value": "", "Flow Type": ""})  # Empty row as separator
+        rows.append(self.beginning_cash.to_csv_tuple())
+        rows.append(separator)
         
         # Operating Activities
-        rows.extend(self.operating_activities.get_csv_rows())
-        rows.append({"Item": "", "Value": "", "Flow Type": ""})  # Empty row as separator
+        rows.extend(self.operating_activities.get_csv_tuples())
+        rows.append(separator)
         
         # Investing Activities
-        rows.extend(self.investing_activities.get_csv_rows())
-        rows.append({"Item": "", "Value": "", "Flow Type": ""})  # Empty row as separator
+        rows.extend(self.investing_activities.get_csv_tuples())
+        rows.append(separator)
         
         # Financing Activities
-        rows.extend(self.financing_activities.get_csv_rows())
-        rows.append({"Item": "", "Value": "", "Flow Type": ""})  # Empty row as separator
+        rows.extend(self.financing_activities.get_csv_tuples())
+        rows.append(separator)
         
         # Net change and ending cash
-        rows.append(self.net_change_in_cash.to_csv_row())
-        rows.append(self.ending_cash.to_csv_row())
-        rows.append({"Item": "", "Value": "", "Flow Type": ""})  # Empty row as separator
+        rows.append(self.net_change_in_cash.to_csv_tuple())
+        rows.append(self.ending_cash.to_csv_tuple())
+        rows.append(separator)
         
         # Free cash flow
         if self.free_cash_flow:
-            rows.append(self.free_cash_flow.to_csv_row())
+            rows.append(self.free_cash_flow.to_csv_tuple())
         
         return rows
     
-    @staticmethod
-    def get_csv_headers() -> List[str]:
+    @classmethod
+    def get_csv_headers(cls) -> Tuple[str, ...]:
         """Get headers for CSV export"""
-        return ["Item", "Value", "Flow Type"]
\ No newline at end of file
+        return cls._CSV_HEADER
\ No newline at end of file
@@ -4,7 +4,7 @@ Data models for dividend calendar information.
 
 from dataclasses import dataclass
 from datetime import datetime, date
-from typing import List, Optional, Dict, Any, ClassVar, Union
+from typing import List, Optional, Dict, Any, ClassVar, Tuple, Union
 import logging
 from collections import defaultdict
 
@@ -13,6 +13,12 @@ logger = logging.getLogger(__name__)
 
 class DividendCalendarEvent:
     """Model for a single dividend calendar event."""
+
+    _CSV_HEADER: ClassVar[Tuple[str, ...]] = (
+        'symbol', 'name', 'exchange', 'currency', 'payment_date',
+        'ex_dividend_date', 'record_date', 'declaration_date',
+        'amount', 'frequency', 'yield', 'dividend_type'
+    )
     
     def __init__(
         self,
@@ -141,14 +147,10 @@ class DividendCalendarEvent:
             'dividend_type': self.dividend_type or ''
         }
     
-    @staticmethod
-    def get_csv_header() -> List[str]:
+    @classmethod
+    def get_csv_header(cls) -> Tuple[str, ...]:
         """Get the CSV header for dividend calendar event data."""
-        return [
-            'symbol', 'name', 'exchange', 'currency', 'payment_date', 
-            'ex_dividend_date', 'record_date', 'declaration_date', 
-            'amount', 'frequency', 'yield', 'dividend_type'
-        ]
+        return cls._CSV_HEADER
 
 
 class DividendCalendar:
@@ -4,7 +4,7 @@ Data models for dividend information.
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional, Dict, Any, ClassVar, Union
+from typing import List, Optional, Dict, Any, ClassVar, Tuple, Union
 import logging
 
 logger = logging.getLogger(__name__)
@@ -12,6 +12,11 @@ logger = logging.getLogger(__name__)
 
 class Dividend:
     """Model for a stock dividend payment."""
+
+    _CSV_HEADER: ClassVar[Tuple[str, ...]] = (
+        'symbol', 'payment_date', 'ex_dividend_date', 'record_date',
+        'declaration_date', 'amount', 'currency', 'frequency', 'description'
+    )
     
     def __init__(
         self,
@@ -105,25 +110,26 @@ class Dividend:
     
     def to_csv_row(self) -> Dict[str, Any]:
         """Convert the dividend to a flat dictionary for CSV export."""
-        return {
-            'symbol': self.symbol,
-            'payment_date': self.payment_date.strftime('%Y-%m-%d') if self.payment_date else '',
-            'ex_dividend_date': self.ex_dividend_date.strftime('%Y-%m-%d') if self.ex_dividend_date else '',
-            'record_date': self.record_date.strftime('%Y-%m-%d') if self.record_date else '',
-            'declaration_date': self.declaration_date.strftime('%Y-%m-%d') if self.declaration_date else '',
-            'amount': self.amount,
-            'currency': self.currency,
-            'frequency': self.frequency or '',
-            'description': self.description or ''
-        }
+        return dict(zip(self._CSV_HEADER, self.to_csv_tuple()))
+
+    def to_csv_tuple(self) -> Tuple[Any, ...]:
+        """Convert the dividend to a CSV row ordered like get_csv_header()."""
+        return (
+            self.symbol,
+            self.payment_date.strftime('%Y-%m-%d') if self.payment_date else '',
+            self.ex_dividend_date.strftime('%Y-%m-%d') if self.ex_dividend_date else '',
+            self.record_date.strftime('%Y-%m-%d') if self.record_date else '',
+            self.declaration_date.strftime('%Y-%m-%d') if self.declaration_date else '',
+            self.amount,
+            self.currency,
+            self.frequency or '',
+            self.description or ''
+        )
     
-    @staticmethod
-    def get_csv_header() -> List[str]:
+    @classmethod
+    def get_csv_header(cls) -> Tuple[str, ...]:
         """Get the CSV header for dividend data."""
-        return [
-            'symbol', 'payment_date', 'ex_dividend_date', 'record_date',
-            'declaration_date', 'amount', 'currency', 'frequency', 'description'
-        ]
+        return cls._CSV_HEADER
 
 
 class DividendHistory:
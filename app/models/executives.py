@@ -1,7 +1,7 @@
 """
 Model for company executives and management data from the TwelveData API.
 """
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, ClassVar, Tuple
 from datetime import datetime
 
 
@@ -9,6 +9,12 @@ class Executive:
     """
     Represents a single executive or high-level manager at a company.
     """
+
+    _CSV_HEADER: ClassVar[Tuple[str, ...]] = (
+        "Name", "Title", "Age", "Compensation", "Currency", "Year",
+        "Gender", "Start Date", "Biography"
+    )
+
     def __init__(self,
                  name: str,
                  title: str,
@@ -129,49 +135,40 @@ class Executive:
     
     def to_csv_row(self) -> Dict[str, str]:
         """Format executive data for CSV export"""
-        row = {
-            "Name": self.name,
-            "Title": self.title,
-        }
-        
-        if self.age is not None:
-            row["Age"] = str(self.age)
-        else:
-            row["Age"] = ""
-            
+        return dict(zip(self._CSV_HEADER, self.to_csv_tuple()))
+    
+    def to_csv_tuple(self) -> Tuple[str, ...]:
+        """Format executive data for CSV export as a tuple ordered like the CSV header"""
         if self.pay is not None:
-            row["Compensation"] = f"{self.pay:,.0f}"
-            row["Currency"] = self.currency or ""
-            row["Year"] = str(self.year) if self.year else ""
-        else:
-            row["Compensation"] = ""
-            row["Currency"] = ""
-            row["Year"] = ""
-            
-        if self.gender:
-            row["Gender"] = self.gender
-        else:
-            row["Gender"] = ""
-            
-        if self.start_date:
-            row["Start Date"] = self.start_date
+            compensation = f"{self.pay:,.0f}"
+            currency = self.currency or ""
+            year = str(self.year) if self.year else ""
         else:
-            row["Start Date"] = ""
-            
-        if self.biography:
-            # Clean up newlines for CSV
-            bio = self.biography.replace('\n', ' ').replace('\r', '')
-            row["Biography"] = bio
-        else:
-            row["Biography"] = ""
-            
-        return row
+            compensation = currency = year = ""
+        
+        # Clean up newlines for CSV
+        bio = self.biography.replace('\n', ' ').replace('\r', '') if self.biography else ""
+        
+        return (
+            self.name,
+            self.title,
+            str(self.age) if self.age is not None else "",
+            compensation,
+            currency,
+            year,
+            self.gender or "",
+            self.start_date or "",
+            bio
+        )
 
 
 class ManagementTeam:
     """
     Represents the management team of a company.
     """
+
+    _CSV_HEADER: ClassVar[Tuple[str, ...]] = ("Symbol", "Company") + Executive._CSV_HEADER
+
     def __init__(self,
                  symbol: str,
                  name: Optional[str] = None,
@@ -266,22 +263,16 @@ class ManagementTeam:
     
     def get_csv_rows(self) -> List[Dict[str, str]]:
         """Format management team data for CSV export"""
-        rows = []
-        
-        for executive in self.executives:
-            row = executive.to_csv_row()
-            # Add company info to each row
-            row["Symbol"] = self.symbol
-            row["Company"] = self.name or ""
-            rows.append(row)
-            
-        return rows
+        header = self._CSV_HEADER
+        return [dict(zip(header, row)) for row in self.get_csv_tuples()]
+    
+    def get_csv_tuples(self) -> List[Tuple[str, ...]]:
+        """Format management team data for CSV export as tuples ordered like get_csv_headers()"""
+        # Add company info to each row
+        company = (self.symbol, self.name or "")
+        return [company + executive.to_csv_tuple() for executive in self.executives]
     
-    @staticmethod
-    def get_csv_headers() -> List[str]:
+    @classmethod
+    def get_csv_headers(cls) -> Tuple[str, ...]:
         """Get headers for CSV export"""
-        return [
-            "Symbol", "Company", "Name", "Title", "Age", 
-            "Compensation", "Currency", "Year", "Gender", 
-            "Start Date", "Biography"
-        ]
\ No newline at end of file
+        return cls._CSV_HEADER
\ No newline at end of file
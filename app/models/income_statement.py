@@ -2,13 +2,16 @@
 Model for company income statement data from the TwelveData API.
 """
 from datetime import datetime
-from typing import Dict, List, Union, Optional, Any
+from typing import Dict, List, Union, Optional, Any, ClassVar, Tuple
 
 
 class IncomeStatementItem:
     """
     Represents an individual line item in an income statement.
     """
+
+    _CSV_HEADER: ClassVar[Tuple[str, ...]] = ("Item", "Value")
+
     def __init__(self, name: str, value: Union[float, int], value_str: Optional[str] = None):
         self.name = name
         self.value = value
@@ -38,10 +41,11 @@ class IncomeStatementItem:
         
     def to_csv_row(self) -> Dict[str, str]:
         """Format for CSV export"""
-        return {
-            "Item": self.name,
-            "Value": self.value_str
-        }
+        return dict(zip(self._CSV_HEADER, self.to_csv_tuple()))
+
+    def to_csv_tuple(self) -> Tuple[str, ...]:
+        """Format for CSV export as a statement row (Item, Value, Percentage of Revenue)"""
+        return (self.name, self.value_str, "")
 
 
 class ExpenseItem(IncomeStatementItem):
@@ -49,6 +53,9 @@ class ExpenseItem(IncomeStatementItem):
     Represents an expense item in an income statement, with additional
     percentage tracking relative to revenue.
     """
+
+    _CSV_HEADER: ClassVar[Tuple[str, ...]] = ("Item", "Value", "Percentage of Revenue")
+
     def __init__(self, name: str, value: Union[float, int], 
                  percentage: Optional[float] = None, value_str: Optional[str] = None,
                  percentage_str: Optional[str] = None):
@@ -78,19 +85,18 @@ class ExpenseItem(IncomeStatementItem):
         })
         return result
     
-    def to_csv_row(self) -> Dict[str, str]:
-        """Format for CSV export"""
-        result = super().to_csv_row()
-        result.update({
-            "Percentage of Revenue": self.percentage_str
-        })
-        return result
+    def to_csv_tuple(self) -> Tuple[str, ...]:
+        """Format for CSV export as a statement row (Item, Value, Percentage of Revenue)"""
+        return (self.name, self.value_str, self.percentage_str)
 
 
 class IncomeStatement:
     """
     Represents a company's income statement for a specific period.
     """
+
+    _CSV_HEADER: ClassVar[Tuple[str, ...]] = ExpenseItem._CSV_HEADER
+
     def __init__(self, 
                  symbol: str,
                  fiscal_date: str,
@@ -313,50 +319,56 @@ class IncomeStatement:
         
     def get_csv_rows(self) -> List[Dict[str, str]]:
         """Create rows for CSV export"""
+        header = self._CSV_HEADER
+        return [dict(zip(header, row)) for row in self.get_csv_tuples()]
+    
+    def get_csv_tuples(self) -> List[Tuple[str, ...]]:
+        """Create CSV rows as tuples ordered like get_csv_headers()"""
         rows = []
+        separator = ("", "", "")  # Empty row as separator
         
         # Basic info
-        rows.append({"Item": "Symbol", "Value": self.symbol})
-        rows.append({"Item": "Fiscal Date", "Value": self.fiscal_date})
-        rows.append({"Item": "Fiscal Period", "Value": self.fiscal_period})
-        rows.append({"Item": "Currency", "Value": self.currency})
-        rows.append({"Item": "", "Value": ""})  # Empty row as separator
+        rows.append(("Symbol", self.symbol, ""))
+        rows.append(("Fiscal Date", self.fiscal_date, ""))
+        rows.append(("Fiscal Period", self.fiscal_period, ""))
+        rows.append(("Currency", self.currency, ""))
+        rows.append(separator)
         
         # Main income statement items
-        rows.append(self.revenue.to_csv_row())
-        rows.append(self.cost_of_revenue.to_csv_row())
-        rows.append(self.gross_profit.to_csv_row())
-        rows.append({"Item": "", "Value": ""})  # Empty row as separator
+        rows.append(self.revenue.to_csv_tuple())
+        rows.append(self.cost_of_revenue.to_csv_tuple())
+        rows.append(self.gross_profit.to_csv_tuple())
+        rows.append(separator)
         
         # Operating expenses
-        rows.append({"Item": "Operating Expenses", "Value": ""})
+        rows.append(("Operating Expenses", "", ""))
         for expense in self.operating_expenses:
-            rows.append(expense.to_csv_row())
-        rows.append(self.total_operating_expenses.to_csv_row())
-        rows.append({"Item": "", "Value": ""})  # Empty row as separator
+            rows.append(expense.to_csv_tuple())
+        rows.append(self.total_operating_expenses.to_csv_tuple())
+        rows.append(separator)
         
         # Operating income and non-operating items
-        rows.append(self.operating_income.to_csv_row())
-        rows.append({"Item": "Non-operating Items", "Value": ""})
+        rows.append(self.operating_income.to_csv_tuple())
+        rows.append(("Non-operating Items", "", ""))
         for item in self.non_operating_items:
-            rows.append(item.to_csv_row())
-        rows.append({"Item": "", "Value": ""})  # Empty row as separator
+            rows.append(item.to_csv_tuple())
+        rows.append(separator)
         
         # Bottom line metrics
-        rows.append(self.income_before_tax.to_csv_row())
-        rows.append(self.income_tax.to_csv_row())
-        rows.append(self.net_income.to_csv_row())
-        rows.append({"Item": "", "Value": ""})  # Empty row as separator
+        rows.append(self.income_before_tax.to_csv_tuple())
+        rows.append(self.income_tax.to_csv_tuple())
+        rows.append(self.net_income.to_csv_tuple())
+        rows.append(separator)
         
         # Per share data
-        rows.append(self.eps_basic.to_csv_row())
-        rows.append(self.eps_diluted.to_csv_row())
-        rows.append(self.shares_basic.to_csv_row())
-        rows.append(self.shares_diluted.to_csv_row())
+        rows.append(self.eps_basic.to_csv_tuple())
+        rows.append(self.eps_diluted.to_csv_tuple())
+        rows.append(self.shares_basic.to_csv_tuple())
+        rows.append(self.shares_diluted.to_csv_tuple())
         
         return rows
     
-    @staticmethod
-    def get_csv_headers() -> List[str]:
+    @classmethod
+    def get_csv_headers(cls) -> Tuple[str, ...]:
         """Get headers for CSV export"""
-        return ["Item", "Value", "Percentage of Revenue"]
\ No newline at end of file
+        return cls._CSV_HEADER
\ No newline at end of file
@@ -2,12 +2,17 @@
 Model for market capitalization data from the TwelveData API.
 """
 from datetime import datetime
-from typing import Dict, List, Union, Optional, Any
+from typing import Dict, List, Union, Optional, Any, ClassVar, Tuple
 
 class MarketCapPoint:
     """
     Represents a single market capitalization data point at a specific timestamp.
     """
+
+    _CSV_HEADER: ClassVar[Tuple[str, ...]] = (
+        "Timestamp", "Date", "Market Cap", "Market Cap Value", "Shares Outstanding"
+    )
+
     def __init__(self, 
                 timestamp: str, 
                 market_cap: float, 
@@ -70,13 +75,17 @@ class MarketCapPoint:
     
     def to_csv_row(self) -> Dict[str, str]:
         """Format for CSV export"""
-        return {
-            "Timestamp": self.timestamp,
-            "Date": self.date.isoformat() if self.date else "",
-            "Market Cap": self.market_cap_formatted,
-            "Market Cap Value": str(self.market_cap),
-            "Shares Outstanding": str(self.shares_outstanding)
-        }
+        return dict(zip(self._CSV_HEADER, self.to_csv_tuple()))
+    
+    def to_csv_tuple(self) -> Tuple[str, ...]:
+        """Format for CSV export as a tuple ordered like the CSV header"""
+        return (
+            self.timestamp,
+            self.date.isoformat() if self.date else "",
+            self.market_cap_formatted,
+            str(self.market_cap),
+            str(self.shares_outstanding)
+        )
 
 
 class MarketCapSummary:
@@ -134,6 +143,9 @@ class MarketCapHistory:
     """
     Represents the market capitalization history for a symbol over time.
     """
+
+    _CSV_HEADER: ClassVar[Tuple[str, ...]] = MarketCapPoint._CSV_HEADER
+
     def __init__(self, 
                 symbol: str, 
                 interval: str,
@@ -202,7 +214,11 @@ class MarketCapHistory:
         """Format market cap history for CSV export"""
         return [point.to_csv_row() for point in self.points]
     
-    @staticmethod
-    def get_csv_headers() -> List[str]:
+    def get_csv_tuples(self) -> List[Tuple[str, ...]]:
+        """Format market cap history for CSV export as tuples ordered like get_csv_headers()"""
+        return [point.to_csv_tuple() for point in self.points]
+    
+    @classmethod
+    def get_csv_headers(cls) -> Tuple[str, ...]:
         """Get headers for CSV export"""
-        return ["Timestamp", "Date", "Market Cap", "Market Cap Value", "Shares Outstanding"]
\ No newline at end of file
+        return cls._CSV_HEADER
\ No newline at end of file
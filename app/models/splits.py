@@ -4,7 +4,7 @@ Data models for stock splits information.
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional, Dict, Any, ClassVar, Union
+from typing import List, Optional, Dict, Any, ClassVar, Tuple, Union
 import logging
 
 logger = logging.getLogger(__name__)
@@ -12,6 +12,11 @@ logger = logging.getLogger(__name__)
 
 class StockSplit:
     """Model for a stock split event."""
+
+    _CSV_HEADER: ClassVar[Tuple[str, ...]] = (
+        'symbol', 'date', 'from_factor', 'to_factor',
+        'ratio', 'split_text', 'name', 'exchange'
+    )
     
     def __init__(
         self,
@@ -118,24 +123,25 @@ class StockSplit:
     
     def to_csv_row(self) -> Dict[str, Any]:
         """Convert the stock split to a flat dictionary for CSV export."""
-        return {
-            'symbol': self.symbol,
-            'date': self.date.strftime('%Y-%m-%d') if self.date else '',
-            'from_factor': self.from_factor,
-            'to_factor': self.to_factor,
-            'ratio': self.ratio,
-            'split_text': f"{self.from_factor}:{self.to_factor}",
-            'name': self.name or '',
-            'exchange': self.exchange or ''
-        }
+        return dict(zip(self._CSV_HEADER, self.to_csv_tuple()))
+
+    def to_csv_tuple(self) -> Tuple[Any, ...]:
+        """Convert the stock split to a CSV row ordered like get_csv_header()."""
+        return (
+            self.symbol,
+            self.date.strftime('%Y-%m-%d') if self.date else '',
+            self.from_factor,
+            self.to_factor,
+            self.ratio,
+            f"{self.from_factor}:{self.to_factor}",
+            self.name or '',
+            self.exchange or ''
+        )
     
-    @staticmethod
-    def get_csv_header() -> List[str]:
+    @classmethod
+    def get_csv_header(cls) -> Tuple[str, ...]:
         """Get the CSV header for stock split data."""
-        return [
-            'symbol', 'date', 'from_factor', 'to_factor', 
-            'ratio', 'split_text', 'name', 'exchange'
-        ]
+        return cls._CSV_HEADER
     
     @property
     def split_text(self) -> str:
@@ -4,7 +4,7 @@ Data models for stock splits calendar information.
 
 from dataclasses import dataclass
 from datetime import datetime, date
-from typing import List, Optional, Dict, Any, ClassVar, Union
+from typing import List, Optional, Dict, Any, ClassVar, Union, Tuple
 import logging
 from collections import defaultdict
 
@@ -13,6 +13,11 @@ logger = logging.getLogger(__name__)
 
 class SplitCalendarEvent:
     """Model for a single stock split calendar event."""
+
+    _CSV_HEADER: ClassVar[Tuple[str, ...]] = (
+        'symbol', 'date', 'from_factor', 'to_factor', 'ratio',
+        'split_text', 'name', 'exchange', 'status'
+    )
     
     def __init__(
         self,
@@ -135,13 +140,10 @@ class SplitCalendarEvent:
             'status': self.status or ''
         }
     
-    @staticmethod
-    def get_csv_header() -> List[str]:
+    @classmethod
+    def get_csv_header(cls) -> Tuple[str, ...]:
         """Get the CSV header for split calendar event data."""
-        return [
-            'symbol', 'date', 'from_factor', 'to_factor', 
-            'ratio', 'split_text', 'name', 'exchange', 'status'
-        ]
+        return cls._CSV_HEADER
     
     @property
     def split_text(self) -> str:
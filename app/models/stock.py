@@ -4,7 +4,7 @@ Data models for stock information.
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional, Dict, Any, ClassVar, Union
+from typing import List, Optional, Dict, Any, ClassVar, Tuple, Union
 import logging
 import json
 
@@ -12,6 +12,13 @@ logger = logging.getLogger(__name__)
 
 class Quote:
     """Model for a stock quote."""
+
+    _CSV_HEADER: ClassVar[Tuple[str, ...]] = (
+        "symbol", "price", "change", "change_percent", "timestamp",
+        "volume", "name", "currency", "open", "high", "low",
+        "previous_close", "fifty_two_week_high", "fifty_two_week_low"
+    )
+
     def __init__(
         self, 
         symbol: str,
@@ -170,14 +177,10 @@ class Quote:
             "fifty_two_week_low": f"{self.fifty_two_week_low:.2f}" if self.fifty_two_week_low is not None else "",
         }
     
-    @staticmethod
-    def get_csv_header() -> List[str]:
+    @classmethod
+    def get_csv_header(cls) -> Tuple[str, ...]:
         """Get the CSV header for quote data."""
-        return [
-            "symbol", "price", "change", "change_percent", "timestamp", 
-            "volume", "name", "currency", "open", "high", "low", 
-            "previous_close", "fifty_two_week_high", "fifty_two_week_low"
-        ]
+        return cls._CSV_HEADER
         
     def __repr__(self) -> str:
         return (f"Quote(symbol='{self.symbol}', price={self.price}, "
@@ -271,6 +274,13 @@ class TimeSeries:
             "bars": [bar.to_dict() for bar in self.bars],
         }
 
+    def columns(self) -> Dict[str, List[Any]]:
+        """Get the bar fields as one list per column, keyed like HistoricalBar.get_csv_header()."""
+        return {
+            name: [getattr(bar, name) for bar in self.bars]
+            for name in HistoricalBar.get_csv_header()
+        }
+
 
 @dataclass
 class TechnicalIndicator:
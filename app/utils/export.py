@@ -5,11 +5,20 @@ Utility functions for exporting data to various formats.
 import os
 import json
 import csv
+import hashlib
+import io
 import logging
+import statistics
 import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain
+from operator import attrgetter
 from pathlib import Path
 from datetime import date, datetime
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Iterable, Optional, Sequence, Tuple, Union
 
 from app.models.analyst_recommendation import AnalystRecommendations
 from app.models.analysts_estimates import AnalystEstimates
@@ -24,17 +33,139 @@ from app.models.income_statement import IncomeStatement
 from app.models.market_cap import MarketCapHistory
 from app.models.splits import SplitHistory, StockSplit
 from app.models.splits_calendar import SplitCalendarEvent, SplitsCalendar
-from app.models.stock import Quote, TimeSeries, TechnicalIndicator
+from app.models.stock import HistoricalBar, Quote, TimeSeries, TechnicalIndicator
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson options matching json.dump(..., indent=2); datetimes and dataclasses
+# are left to the default hook so both encoders format them the same way
+_ORJSON_OPTIONS = (
+    orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+    | orjson.OPT_PASSTHROUGH_DATACLASS
+    if orjson is not None else 0
+)
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as pa_feather
+    import pyarrow.parquet as pa_parquet
+except ImportError:
+    pa = None
+    pa_feather = None
+    pa_parquet = None
 
 logger = logging.getLogger(__name__)
 
+# Buffer size for export file handles, large enough that a typical export
+# reaches the disk in a handful of writes
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Number of serialized items buffered per write when streaming JSON arrays
+_JSON_STREAM_CHUNK_SIZE = 256
+
+# Upper bound on threads used to write independent export files concurrently
+_MAX_WRITE_WORKERS = 8
+
 
 def ensure_directory(filepath: Union[str, Path]) -> None:
     """Ensure that the directory for the file exists."""
-    directory = os.path.dirname(filepath)
-    if directory and not os.path.exists(directory):
-        os.makedirs(directory)
-        logger.debug(f"Created directory: {directory}")
+    Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+
+
+def _open_csv(path: Union[str, Path]):
+    """
+    Open a CSV file for writing as csv.writer expects.
+
+    Rows are buffered in a large user-space buffer so that writing many
+    short rows doesn't turn into one write() call each.
+    """
+    return open(path, 'w', newline='', buffering=_WRITE_BUFFER_SIZE)
+
+
+def _dump_json(data: Any, path: Union[str, Path], default: Optional[Any] = None) -> None:
+    """
+    Write data to a file as JSON indented by two spaces.
+
+    Uses orjson when it is installed (the "orjson" extra) and the json module
+    otherwise. Datetimes and dataclasses are passed to default by both, so
+    the usual export payloads come out byte for byte the same. The encoders
+    still differ on:
+
+    - non-ASCII text, written as UTF-8 by orjson and as \\uXXXX escapes by json
+    - NaN and infinities, written as null by orjson and as the non-standard
+      NaN/Infinity tokens by json
+    - floats in exponent notation, e.g. 1e-7 from orjson and 1e-07 from json
+    - Enum members, written as their value by orjson and passed to default
+      by json
+    - integers outside the 64-bit range, which orjson rejects with TypeError
+
+    Args:
+        data: The data to serialize
+        path: The path to the output file
+        default: Fallback serializer for objects the encoder cannot handle
+    """
+    if orjson is None:
+        with open(path, 'w', buffering=_WRITE_BUFFER_SIZE) as f:
+            json.dump(data, f, indent=2, default=default)
+        return
+
+    # orjson returns the whole document as bytes, so write it in one call;
+    # serializing first also avoids leaving an empty file behind on error
+    Path(path).write_bytes(orjson.dumps(data, default=default, option=_ORJSON_OPTIONS))
+
+
+def _json_text(data: Any, default: Optional[Any] = None) -> str:
+    """Serialize data as JSON text indented by two spaces, like _dump_json."""
+    if orjson is None:
+        return json.dumps(data, indent=2, default=default)
+    return orjson.dumps(data, default=default, option=_ORJSON_OPTIONS).decode()
+
+
+def _stream_json_object(f, fields: Dict[str, Any], stream_key: str,
+                        items: Iterable[Dict[str, Any]], chunk_size: int = 10,
+                        trailing_fields: Optional[Dict[str, Any]] = None) -> None:
+    """
+    Write a JSON object containing an array member streamed item by item.
+
+    The output matches _dump_json(..., default=str) on the equivalent dict,
+    but at most chunk_size serialized items are held in memory at once.
+
+    Args:
+        f: The text file to write to
+        fields: The members of the object before the streamed array
+        stream_key: The name of the streamed array member
+        items: The array elements, typically a generator of to_dict() results
+        chunk_size: Number of serialized items to buffer between writes
+        trailing_fields: The members of the object after the streamed array
+    """
+    f.write("{")
+    for key, value in fields.items():
+        encoded = _json_text(value, default=str).replace("\n", "\n  ")
+        f.write(f"\n  {json.dumps(key)}: {encoded},")
+    f.write(f"\n  {json.dumps(stream_key)}: [")
+
+    chunk = []
+    wrote_items = False
+    for item in items:
+        encoded = _json_text(item, default=str)
+        chunk.append(encoded.replace("\n", "\n    "))
+        if len(chunk) >= chunk_size:
+            f.write(("," if wrote_items else "") + "\n    " + ",\n    ".join(chunk))
+            wrote_items = True
+            chunk = []
+    if chunk:
+        f.write(("," if wrote_items else "") + "\n    " + ",\n    ".join(chunk))
+        wrote_items = True
+
+    f.write("\n  ]" if wrote_items else "]")
+
+    for key, value in (trailing_fields or {}).items():
+        encoded = _json_text(value, default=str).replace("\n", "\n  ")
+        f.write(f",\n  {json.dumps(key)}: {encoded}")
+    f.write("\n}")
 
 
 def export_to_json(data: Union[List[Any], Dict[str, Any]], filepath: Union[str, Path], pretty: bool = True) -> bool:
@@ -58,10 +189,12 @@ def export_to_json(data: Union[List[Any], Dict[str, Any]], filepath: Union[str,
         elif hasattr(data, 'to_dict'):
             data = data.to_dict()
 
-        with open(filepath, 'w') as f:
-            if pretty:
-                json.dump(data, f, indent=2, default=str)
-            else:
+        if pretty:
+            _dump_json(data, filepath, default=str)
+        else:
+            # orjson's compact output drops the spaces json.dump puts after
+            # separators, so keep the json module here
+            with open(filepath, 'w', buffering=_WRITE_BUFFER_SIZE) as f:
                 json.dump(data, f, default=str)
 
         logger.info(f"Exported data to JSON file: {filepath}")
@@ -71,10 +204,72 @@ def export_to_json(data: Union[List[Any], Dict[str, Any]], filepath: Union[str,
         return False
 
 
+# Characters that make csv.QUOTE_MINIMAL quote a field
+_CSV_QUOTE_CHARS = frozenset(',"\r\n')
+
+# Header line and row template matching csv.DictWriter output for quotes
+# that need no quoting
+_QUOTE_CSV_HEADER_LINE = ",".join(Quote.get_csv_header()) + "\r\n"
+_QUOTE_CSV_ROW_FORMAT = ",".join(
+    f"{{{name}}}" for name in Quote.get_csv_header()) + "\r\n"
+
+
+# Header line and row template matching csv.DictWriter output for time
+# series bars, whose timestamp and numeric fields never need quoting
+_BAR_CSV_HEADER_LINE = ",".join(HistoricalBar.get_csv_header()) + "\r\n"
+_BAR_CSV_ROW_FORMAT = ",".join(
+    f"{{{name}}}" for name in HistoricalBar.get_csv_header()) + "\r\n"
+
+
+# Header lines and row templates matching csv.writer output for dividend
+# and split detail rows whose cells need no quoting
+_DIVIDEND_CSV_HEADER_LINE = ",".join(Dividend.get_csv_header()) + "\r\n"
+_DIVIDEND_CSV_ROW_FORMAT = ",".join(["%s"] * len(Dividend.get_csv_header())) + "\r\n"
+_SPLIT_CSV_HEADER_LINE = ",".join(StockSplit.get_csv_header()) + "\r\n"
+_SPLIT_CSV_ROW_FORMAT = ",".join(["%s"] * len(StockSplit.get_csv_header())) + "\r\n"
+
+
+def _write_csv_tuples(f, header: Sequence[str], header_line: str, row_format: str,
+                      rows: List[Tuple[Any, ...]]) -> None:
+    """
+    Write tuple rows with a precomputed %-template, bypassing csv.writer.
+
+    Falls back to csv.writer when a cell is None or contains characters that
+    csv.QUOTE_MINIMAL would quote, so the output is always identical.
+    """
+    if any(cell is None or (isinstance(cell, str) and not _CSV_QUOTE_CHARS.isdisjoint(cell))
+           for row in rows for cell in row):
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(rows)
+        return
+
+    f.write(header_line + "".join(row_format % row for row in rows))
+
+
+def _quotes_need_csv_quoting(quotes: List[Quote]) -> bool:
+    """Check whether any free-text quote field contains CSV special characters."""
+    return any(
+        not _CSV_QUOTE_CHARS.isdisjoint(text)
+        for quote in quotes
+        for text in (quote.symbol, quote.name or "", quote.currency or "")
+    )
+
+
+def _fast_write_quotes_csv(quotes: List[Quote], f) -> None:
+    """Write quotes with a precomputed format string, bypassing csv.DictWriter."""
+    # Join the body first so the text layer encodes and writes it in one call
+    f.write(_QUOTE_CSV_HEADER_LINE + "".join(
+        _QUOTE_CSV_ROW_FORMAT.format_map(quote.to_csv_row()) for quote in quotes))
+
+
 def export_quotes_to_csv(quotes: List[Quote], filepath: Union[str, Path]) -> bool:
     """
     Export a list of quotes to a CSV file.
 
+    Quote rows are almost entirely numeric, so unless a free-text field
+    needs quoting they are written directly instead of through csv.DictWriter.
+
     Args:
         quotes: The quotes to export
         filepath: The path to the output file
@@ -85,13 +280,15 @@ def export_quotes_to_csv(quotes: List[Quote], filepath: Union[str, Path]) -> boo
     try:
         ensure_directory(filepath)
 
-        with open(filepath, 'w', newline='') as f:
-            fieldnames = Quote.get_csv_header()
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
+        with _open_csv(filepath) as f:
+            if not _quotes_need_csv_quoting(quotes):
+                _fast_write_quotes_csv(quotes, f)
+            else:
+                fieldnames = Quote.get_csv_header()
+                writer = csv.DictWriter(f, fieldnames=fieldnames)
 
-            writer.writeheader()
-            for quote in quotes:
-                writer.writerow(quote.to_csv_row())
+                writer.writeheader()
+                writer.writerows(quote.to_csv_row() for quote in quotes)
 
         logger.info(f"Exported quotes to CSV file: {filepath}")
         return True
@@ -104,6 +301,9 @@ def export_time_series_to_csv(time_series: TimeSeries, filepath: Union[str, Path
     """
     Export time series data to a CSV file.
 
+    Bar fields are timestamps and numbers, so rows are written with a
+    precomputed format string instead of csv.DictWriter.
+
     Args:
         time_series: The time series data to export
         filepath: The path to the output file
@@ -114,21 +314,18 @@ def export_time_series_to_csv(time_series: TimeSeries, filepath: Union[str, Path
     try:
         ensure_directory(filepath)
 
-        with open(filepath, 'w', newline='') as f:
-            # Add symbol and interval as header comments
-            f.write(f"# Symbol: {time_series.symbol}\n")
-            f.write(f"# Interval: {time_series.interval}\n")
-            f.write(f"# Currency: {time_series.currency}\n")
-            f.write(f"# Exported: {datetime.now().isoformat()}\n")
-
-            # Write the actual data
-            fieldnames = ["timestamp", "open",
-                          "high", "low", "close", "volume"]
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-
-            writer.writeheader()
-            for bar in time_series.bars:
-                writer.writerow(bar.to_csv_row())
+        with _open_csv(filepath) as f:
+            # Add symbol and interval as header comments, followed by the
+            # CSV header and body, in a single write
+            f.write(
+                f"# Symbol: {time_series.symbol}\n"
+                f"# Interval: {time_series.interval}\n"
+                f"# Currency: {time_series.currency}\n"
+                f"# Exported: {datetime.now().isoformat()}\n"
+                + _BAR_CSV_HEADER_LINE
+                + "".join(_BAR_CSV_ROW_FORMAT.format_map(bar.to_csv_row())
+                          for bar in time_series.bars)
+            )
 
         logger.info(f"Exported time series to CSV file: {filepath}")
         return True
@@ -138,32 +335,86 @@ def export_time_series_to_csv(time_series: TimeSeries, filepath: Union[str, Path
         return False
 
 
-def generate_export_filename(prefix: str, symbols: List[str], extension: str) -> str:
+def export_time_series_to_parquet(time_series: TimeSeries, filepath: Union[str, Path]) -> bool:
+    """
+    Export time series data to a Parquet file.
+
+    The table is built from the series' columns, so timestamps and prices
+    keep their types; the symbol, interval and currency are stored in the
+    schema metadata. Parquet output requires pyarrow.
+
+    Args:
+        time_series: The time series data to export
+        filepath: The path to the output file
+
+    Returns:
+        True if export was successful, False otherwise
+    """
+    try:
+        ensure_directory(filepath)
+    except Exception as e:
+        logger.error(f"Failed to export time series to Parquet: {e}", exc_info=True)
+        return False
+
+    metadata = {
+        "symbol": time_series.symbol,
+        "interval": time_series.interval,
+        "currency": time_series.currency,
+    }
+    if not _write_parquet(filepath, time_series.columns(), metadata):
+        return False
+
+    logger.info(f"Exported time series to Parquet file: {filepath}")
+    return True
+
+
+@lru_cache(maxsize=128)
+def _symbol_filename_part(symbols: Tuple[str, ...]) -> str:
+    """
+    Build the symbol part of an export filename (max 3 symbols in the filename).
+
+    Longer symbol lists are named after the first symbol plus a short fingerprint
+    of the whole list, so different comparisons don't overwrite each other.
+    """
+    if len(symbols) == 1:
+        return symbols[0]
+    if len(symbols) <= 3:
+        return "-".join(symbols)
+
+    fingerprint = hashlib.blake2b(",".join(symbols).encode(), digest_size=4).hexdigest()
+    return f"{symbols[0]}-and-{len(symbols)-1}-more-{fingerprint}"
+
+
+def generate_export_filename(prefix: str, symbols: List[str], extension: Optional[str] = None,
+                             additional_parts: Optional[List[str]] = None,
+                             timestamp: Optional[str] = None) -> str:
     """
     Generate a filename for exported data.
 
     Args:
         prefix: A prefix for the filename (e.g., 'quotes', 'history')
         symbols: The list of symbols included in the data
-        extension: The file extension (e.g., 'json', 'csv')
+        extension: The file extension (e.g., 'json', 'csv'), or None for a base name
+        additional_parts: Extra name parts placed between the symbols and the timestamp
+        timestamp: Timestamp shared with other files of the same export, or None for now
 
     Returns:
         A formatted filename
     """
-    # Format the current date and time
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    # Format the current date and time unless the caller already has one
+    if timestamp is None:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
-    # Create a consolidated symbol name (max 3 symbols in the filename)
-    if len(symbols) == 1:
-        symbol_str = symbols[0]
-    elif len(symbols) <= 3:
-        symbol_str = "-".join(symbols)
-    else:
-        symbol_str = f"{symbols[0]}-and-{len(symbols)-1}-more"
+    parts = [prefix, _symbol_filename_part(tuple(symbols))]
+    if additional_parts:
+        parts.extend(str(part) for part in additional_parts if part)
+    parts.append(timestamp)
 
-    return f"{prefix}_{symbol_str}_{timestamp}.{extension}"
+    base_name = "_".join(parts)
+    return f"{base_name}.{extension}" if extension else base_name
 
 
+@lru_cache(maxsize=1)
 def get_project_dir() -> Path:
     """Get the project directory path."""
     # If running as installed package
@@ -182,8 +433,9 @@ def get_project_dir() -> Path:
     return base_path
 
 
+@lru_cache(maxsize=1)
 def get_default_export_dir() -> Path:
-    """Get the default directory for exported files."""
+    """Get the default directory for exported files, created on the first call."""
     # Use the project's exports directory
     project_dir = get_project_dir()
     export_dir = project_dir / 'stock_cli' / 'exports'
@@ -194,14 +446,28 @@ def get_default_export_dir() -> Path:
     return export_dir
 
 
+@lru_cache(maxsize=1)
 def get_home_export_dir() -> Path:
-    """Get the export directory in the user's home folder."""
+    """Get the export directory in the user's home folder, created on the first call."""
     export_dir = Path.home() / '.stock_cli' / 'exports'
     export_dir.mkdir(parents=True, exist_ok=True)
     logger.debug(f"Using home directory for exports: {export_dir}")
     return export_dir
 
 
+# File writers used by export_quotes, keyed by format
+def _export_quotes_to_parquet(quotes: List[Quote], filepath: Union[str, Path]) -> bool:
+    """Export a list of quotes to a Parquet file, returning whether it was written."""
+    return _write_parquet(filepath, [quote.to_dict() for quote in quotes])
+
+
+_QUOTE_WRITERS = {
+    'json': export_to_json,
+    'csv': export_quotes_to_csv,
+    'parquet': _export_quotes_to_parquet,
+}
+
+
 def export_quotes(quotes: List[Quote], formats: List[str],
                   output_dir: Optional[Union[str, Path]] = None,
                   filename_prefix: str = "quotes") -> Dict[str, str]:
@@ -239,23 +505,20 @@ def export_quotes(quotes: List[Quote], formats: List[str],
 
     result = {}
 
+    # Generate the base filename once so every format shares its timestamp
+    base_filename = generate_export_filename(filename_prefix, symbols)
+
     # Export to each format
     for fmt in formats:
-        if fmt.lower() == 'json':
-            filename = generate_export_filename(
-                filename_prefix, symbols, 'json')
-            filepath = output_dir / filename
-            if export_to_json(quotes, filepath):
-                result['json'] = str(filepath)
-
-        elif fmt.lower() == 'csv':
-            filename = generate_export_filename(
-                filename_prefix, symbols, 'csv')
-            filepath = output_dir / filename
-            if export_quotes_to_csv(quotes, filepath):
-                result['csv'] = str(filepath)
-        else:
+        fmt_key = fmt.lower()
+        writer = _QUOTE_WRITERS.get(fmt_key)
+        if writer is None:
             logger.warning(f"Unsupported export format: {fmt}")
+            continue
+
+        filepath = output_dir / f"{base_filename}.{fmt_key}"
+        if writer(quotes, filepath):
+            result[fmt_key] = str(filepath)
 
     return result
 
@@ -274,13 +537,12 @@ def export_symbols_to_csv(symbols: List[Any], filepath: Union[str, Path]) -> boo
     try:
         ensure_directory(filepath)
 
-        with open(filepath, 'w', newline='') as f:
+        with _open_csv(filepath) as f:
             fieldnames = symbols[0].get_csv_header()
             writer = csv.DictWriter(f, fieldnames=fieldnames)
 
             writer.writeheader()
-            for symbol in symbols:
-                writer.writerow(symbol.to_csv_row())
+            writer.writerows(symbol.to_csv_row() for symbol in symbols)
 
         logger.info(f"Exported symbols to CSV file: {filepath}")
         return True
@@ -289,6 +551,13 @@ def export_symbols_to_csv(symbols: List[Any], filepath: Union[str, Path]) -> boo
         return False
 
 
+# File writers used by export_symbols, keyed by format
+_SYMBOL_WRITERS = {
+    'json': export_to_json,
+    'csv': export_symbols_to_csv,
+}
+
+
 def export_symbols(symbols: List[Any], formats: List[str],
                    output_dir: Optional[Union[str, Path]] = None,
                    filename_prefix: str = "symbols",
@@ -343,25 +612,64 @@ def export_symbols(symbols: List[Any], formats: List[str],
 
     # Export to each format
     for fmt in formats:
-        if fmt.lower() == 'json':
-            filename = f"{filename_prefix}_{timestamp}.json"
-            filepath = export_dir / filename
-            if export_to_json(symbols, filepath):
-                result['json'] = str(filepath)
-
-        elif fmt.lower() == 'csv':
-            filename = f"{filename_prefix}_{timestamp}.csv"
-            filepath = export_dir / filename
-            if export_symbols_to_csv(symbols, filepath):
-                result['csv'] = str(filepath)
-        else:
+        fmt_key = fmt.lower()
+        writer = _SYMBOL_WRITERS.get(fmt_key)
+        if writer is None:
             logger.warning(f"Unsupported export format: {fmt}")
+            continue
+
+        filepath = export_dir / f"{filename_prefix}_{timestamp}.{fmt_key}"
+        if writer(symbols, filepath):
+            result[fmt_key] = str(filepath)
 
     return result
 
 # This contains export functions to be added to export.py
 
 
+def _export_dividend_history_json(dividend_history: 'DividendHistory', output_dir: Union[str, Path],
+                                  timestamp: str) -> Optional[str]:
+    """Export a dividend history to JSON, returning the file path."""
+    symbol = dividend_history.symbol
+
+    filename = f"dividend_history_{symbol}_{timestamp}.json"
+    filepath = Path(output_dir) / filename
+
+    try:
+        _dump_json(dividend_history.to_dict(), filepath, default=str)
+        logger.info(f"Exported dividend history to JSON: {filepath}")
+        return str(filepath)
+    except Exception as e:
+        logger.error(f"Failed to export dividend history to JSON: {e}")
+        return None
+
+
+def _export_dividend_history_csv(dividend_history: 'DividendHistory', output_dir: Union[str, Path],
+                                 timestamp: str) -> Optional[str]:
+    """Export a dividend history to CSV, returning the file path."""
+    symbol = dividend_history.symbol
+
+    filename = f"dividend_history_{symbol}_{timestamp}.csv"
+    filepath = Path(output_dir) / filename
+
+    try:
+        with _open_csv(filepath) as f:
+            _write_csv_tuples(f, Dividend.get_csv_header(), _DIVIDEND_CSV_HEADER_LINE,
+                              _DIVIDEND_CSV_ROW_FORMAT,
+                              [dividend.to_csv_tuple() for dividend in dividend_history.dividends])
+        logger.info(f"Exported dividend history to CSV: {filepath}")
+        return str(filepath)
+    except Exception as e:
+        logger.error(f"Failed to export dividend history to CSV: {e}")
+        return None
+
+
+_DIVIDEND_HISTORY_EXPORTERS = {
+    'json': _export_dividend_history_json,
+    'csv': _export_dividend_history_csv,
+}
+
+
 def export_dividend_history(dividend_history: 'DividendHistory', formats: List[str],
                             output_dir: Union[str, Path]) -> Dict[str, str]:
     """
@@ -377,48 +685,148 @@ def export_dividend_history(dividend_history: 'DividendHistory', formats: List[s
     """
     results = {}
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    symbol = dividend_history.symbol
 
     # Ensure the output directory exists
     ensure_directory(output_dir)
 
     for fmt in formats:
-        if fmt.lower() == 'json':
-            # Export to JSON
-            filename = f"dividend_history_{symbol}_{timestamp}.json"
-            filepath = Path(output_dir) / filename
+        fmt_key = fmt.lower()
+        exporter = _DIVIDEND_HISTORY_EXPORTERS.get(fmt_key)
+        if exporter:
+            filepath = exporter(dividend_history, output_dir, timestamp)
+            if filepath:
+                results[fmt_key] = filepath
 
-            try:
-                with open(filepath, 'w') as f:
-                    json.dump(dividend_history.to_dict(),
-                              f, indent=2, default=str)
-                results['json'] = str(filepath)
-                logger.info(f"Exported dividend history to JSON: {filepath}")
-            except Exception as e:
-                logger.error(f"Failed to export dividend history to JSON: {e}")
-
-        elif fmt.lower() == 'csv':
-            # Export to CSV
-            filename = f"dividend_history_{symbol}_{timestamp}.csv"
-            filepath = Path(output_dir) / filename
+    return results
 
-            try:
-                with open(filepath, 'w', newline='') as f:
-                    writer = csv.DictWriter(
-                        f, fieldnames=Dividend.get_csv_header())
-                    writer.writeheader()
-                    for dividend in dividend_history.dividends:
-                        writer.writerow(dividend.to_csv_row())
-                results['csv'] = str(filepath)
-                logger.info(f"Exported dividend history to CSV: {filepath}")
-            except Exception as e:
-                logger.error(f"Failed to export dividend history to CSV: {e}")
 
-    return results
+def _dividend_summary_row(history: 'DividendHistory') -> List[Any]:
+    """Build the dividend comparison summary CSV row for one history."""
+    annual = history.annual_dividends()
+    years = list(annual)
+    amounts = list(annual.values())
+
+    # Same value as history.average_annual_dividend(), without regrouping
+    # the dividends by year; summing a list keeps the loop inside sum()
+    average_annual = sum(amounts) / len(amounts) if amounts else 0.0
+
+    # Get the latest year's dividend
+    latest_annual = amounts[-1] if amounts else 0.0
+
+    # Calculate 5-year average
+    recent_amounts = amounts[-5:]
+    five_year_avg = sum(recent_amounts) / len(recent_amounts) if recent_amounts else 0.0
+
+    # Calculate 5-year growth rate
+    five_year_growth = "N/A"
+    if len(recent_amounts) >= 2:
+        first_year, first_amount = years[-len(recent_amounts)], recent_amounts[0]
+        last_year, last_amount = years[-1], recent_amounts[-1]
+        years_diff = last_year - first_year
+        if years_diff > 0 and first_amount > 0:
+            cagr = ((last_amount / first_amount)
+                    ** (1 / years_diff) - 1) * 100
+            five_year_growth = f"{cagr:.2f}%"
+
+    return [
+        history.symbol,
+        history.name,
+        history.currency,
+        len(history.dividends),
+        average_annual,
+        latest_annual,
+        five_year_avg,
+        five_year_growth
+    ]
+
+
+def _export_dividend_comparison_json(dividend_histories: List['DividendHistory'], output_dir: Union[str, Path],
+                                     timestamp: str, symbol_list: List[str], chunk_size: int) -> Optional[str]:
+    """Export a dividend comparison to JSON, returning the file path."""
+    filename = f"dividend_comparison_{timestamp}.json"
+    filepath = Path(output_dir) / filename
+
+    try:
+        # Stream the histories so only a chunk of them is serialized at once
+        with open(filepath, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
+            _stream_json_object(
+                f,
+                {
+                    "timestamp": timestamp,
+                    "symbols": symbol_list
+                },
+                "histories",
+                (history.to_dict() for history in dividend_histories),
+                chunk_size
+            )
+        logger.info(
+            f"Exported dividend comparison to JSON: {filepath}")
+        return str(filepath)
+    except Exception as e:
+        logger.error(
+            f"Failed to export dividend comparison to JSON: {e}")
+        return None
+
+
+def _write_dividend_detail_csv(history: 'DividendHistory', output_prefix: str,
+                               timestamp: str) -> str:
+    """Write the per-symbol detail CSV of a dividend comparison, returning its path."""
+    detail_filepath = f"{output_prefix}dividend_history_{history.symbol}_{timestamp}.csv"
+
+    with _open_csv(detail_filepath) as f:
+        _write_csv_tuples(f, Dividend.get_csv_header(), _DIVIDEND_CSV_HEADER_LINE,
+                          _DIVIDEND_CSV_ROW_FORMAT,
+                          [dividend.to_csv_tuple() for dividend in history.dividends])
+
+    return detail_filepath
+
+
+def _export_dividend_comparison_csv(dividend_histories: List['DividendHistory'], output_dir: Union[str, Path],
+                                    timestamp: str, symbol_list: List[str], chunk_size: int) -> Optional[str]:
+    """Export a dividend comparison to CSV, returning the file path."""
+    # Export multiple CSV files - one summary and individual files for each symbol
+    summary_filename = f"dividend_comparison_summary_{timestamp}.csv"
+    summary_filepath = Path(output_dir) / summary_filename
+    output_prefix = os.path.join(output_dir, "")
+
+    try:
+        # The per-symbol detail files are independent, so write them on
+        # worker threads while the summary is written here
+        with ThreadPoolExecutor(max_workers=min(_MAX_WRITE_WORKERS, max(len(dividend_histories), 1))) as executor:
+            detail_paths = executor.map(
+                lambda history: _write_dividend_detail_csv(history, output_prefix, timestamp),
+                dividend_histories)
+
+            with _open_csv(summary_filepath) as f:
+                # Create summary headers
+                writer = csv.writer(f)
+                writer.writerow(["Symbol", "Name", "Currency", "Total Dividends",
+                                "Average Annual", "Latest Annual", "5Y Average", "5Y Growth"])
+
+                # Add summary data for each symbol
+                writer.writerows(_dividend_summary_row(history)
+                                 for history in dividend_histories)
+
+            # Surface any error raised while writing a detail file
+            list(detail_paths)
+
+        logger.info(
+            f"Exported dividend comparison to CSV: {summary_filepath}")
+        return str(summary_filepath)
+    except Exception as e:
+        logger.error(
+            f"Failed to export dividend comparison to CSV: {e}")
+        return None
+
+
+_DIVIDEND_COMPARISON_EXPORTERS = {
+    'json': _export_dividend_comparison_json,
+    'csv': _export_dividend_comparison_csv,
+}
 
 
 def export_dividend_comparison(dividend_histories: List['DividendHistory'], formats: List[str],
-                               output_dir: Union[str, Path]) -> Dict[str, str]:
+                               output_dir: Union[str, Path], chunk_size: int = 10) -> Dict[str, str]:
     """
     Export dividend comparison to specified formats.
 
@@ -426,113 +834,117 @@ def export_dividend_comparison(dividend_histories: List['DividendHistory'], form
         dividend_histories: List of DividendHistory objects to export
         formats: List of formats to export to ('json', 'csv')
         output_dir: Directory to save exported files
+        chunk_size: Number of histories serialized per JSON write
 
     Returns:
         Dictionary mapping format to exported file path
     """
     results = {}
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    symbols = "_".join([history.symbol for history in dividend_histories])
-
-    # Limit the filename length by truncating symbols if too many
-    if len(symbols) > 50:
-        symbols = f"{symbols[:47]}..."
+    symbol_list = [history.symbol for history in dividend_histories]
 
     # Ensure the output directory exists
     ensure_directory(output_dir)
 
     for fmt in formats:
-        if fmt.lower() == 'json':
-            # Export to JSON
-            filename = f"dividend_comparison_{timestamp}.json"
-            filepath = Path(output_dir) / filename
+        fmt_key = fmt.lower()
+        exporter = _DIVIDEND_COMPARISON_EXPORTERS.get(fmt_key)
+        if exporter:
+            filepath = exporter(dividend_histories, output_dir, timestamp, symbol_list, chunk_size)
+            if filepath:
+                results[fmt_key] = filepath
 
-            try:
-                comparison_data = {
-                    "timestamp": timestamp,
-                    "symbols": [history.symbol for history in dividend_histories],
-                    "histories": [history.to_dict() for history in dividend_histories]
-                }
+    return results
 
-                with open(filepath, 'w') as f:
-                    json.dump(comparison_data, f, indent=2, default=str)
-                results['json'] = str(filepath)
-                logger.info(
-                    f"Exported dividend comparison to JSON: {filepath}")
-            except Exception as e:
-                logger.error(
-                    f"Failed to export dividend comparison to JSON: {e}")
 
-        elif fmt.lower() == 'csv':
-            # Export multiple CSV files - one summary and individual files for each symbol
+def _export_dividend_calendar_json(dividend_calendar: 'DividendCalendar', output_dir: Union[str, Path],
+                                   timestamp: str, date_range: str, view_mode: str) -> Optional[str]:
+    """Export a dividend calendar to JSON, returning the file path."""
+    filename = f"dividend_calendar_{date_range}_{timestamp}.json"
+    filepath = Path(output_dir) / filename
 
-            # First, create a summary file
-            summary_filename = f"dividend_comparison_summary_{timestamp}.csv"
-            summary_filepath = Path(output_dir) / summary_filename
+    try:
+        _dump_json(dividend_calendar.to_dict(), filepath, default=str)
+        logger.info(f"Exported dividend calendar to JSON: {filepath}")
+        return str(filepath)
+    except Exception as e:
+        logger.error(
+            f"Failed to export dividend calendar to JSON: {e}")
+        return None
 
-            try:
-                with open(summary_filepath, 'w', newline='') as f:
-                    # Create summary headers
-                    writer = csv.writer(f)
-                    writer.writerow(["Symbol", "Name", "Currency", "Total Dividends",
-                                    "Average Annual", "Latest Annual", "5Y Average", "5Y Growth"])
-
-                    # Add summary data for each symbol
-                    for history in dividend_histories:
-                        annual = history.annual_dividends()
-
-                        # Get the latest year's dividend
-                        latest_annual = list(
-                            annual.items())[-1][1] if annual else 0.0
-
-                        # Calculate 5-year average
-                        recent_years = list(
-                            annual.items())[-5:] if len(annual) >= 5 else list(annual.items())
-                        five_year_avg = sum(
-                            amount for _, amount in recent_years) / len(recent_years) if recent_years else 0.0
-
-                        # Calculate 5-year growth rate
-                        five_year_growth = "N/A"
-                        if len(recent_years) >= 2:
-                            first_year, first_amount = recent_years[0]
-                            last_year, last_amount = recent_years[-1]
-                            years_diff = last_year - first_year
-                            if years_diff > 0 and first_amount > 0:
-                                cagr = ((last_amount / first_amount)
-                                        ** (1 / years_diff) - 1) * 100
-                                five_year_growth = f"{cagr:.2f}%"
-
-                        writer.writerow([
-                            history.symbol,
-                            history.name,
-                            history.currency,
-                            len(history.dividends),
-                            history.average_annual_dividend(),
-                            latest_annual,
-                            five_year_avg,
-                            five_year_growth
-                        ])
 
-                # Now export individual detailed files for each symbol
-                for history in dividend_histories:
-                    detail_filename = f"dividend_history_{history.symbol}_{timestamp}.csv"
-                    detail_filepath = Path(output_dir) / detail_filename
-
-                    with open(detail_filepath, 'w', newline='') as f:
-                        writer = csv.DictWriter(
-                            f, fieldnames=Dividend.get_csv_header())
-                        writer.writeheader()
-                        for dividend in history.dividends:
-                            writer.writerow(dividend.to_csv_row())
-
-                results['csv'] = str(summary_filepath)
-                logger.info(
-                    f"Exported dividend comparison to CSV: {summary_filepath}")
-            except Exception as e:
-                logger.error(
-                    f"Failed to export dividend comparison to CSV: {e}")
+def _export_dividend_calendar_csv(dividend_calendar: 'DividendCalendar', output_dir: Union[str, Path],
+                                  timestamp: str, date_range: str, view_mode: str) -> Optional[str]:
+    """Export a dividend calendar to CSV, returning the main file path."""
+    exported = None
+    filename = f"dividend_calendar_{date_range}_{timestamp}.csv"
+    filepath = Path(output_dir) / filename
+
+    # Group events by formatted ex-dividend date during the same pass that
+    # builds the main rows, so the by-date view needs no second traversal
+    events_by_date = defaultdict(list)
+
+    try:
+        rows = []
+        for event in dividend_calendar.events:
+            row = event.to_csv_row()
+            rows.append(row)
+            if row['ex_dividend_date']:
+                events_by_date[row['ex_dividend_date']].append((event, row))
+
+        with _open_csv(filepath) as f:
+            writer = csv.DictWriter(
+                f, fieldnames=DividendCalendarEvent.get_csv_header())
+            writer.writeheader()
+            writer.writerows(rows)
+        exported = str(filepath)
+        logger.info(f"Exported dividend calendar to CSV: {filepath}")
+    except Exception as e:
+        logger.error(f"Failed to export dividend calendar to CSV: {e}")
+
+    # For a more structured temporal view, create a date-based CSV as well
+    if view_mode == 'calendar':
+        date_filename = f"dividend_calendar_by_date_{date_range}_{timestamp}.csv"
+        date_filepath = Path(output_dir) / date_filename
+
+        try:
+            with _open_csv(date_filepath) as f:
+                writer = csv.writer(f)
+
+                # Write headers
+                writer.writerow(
+                    ['Date', 'Symbol', 'Name', 'Amount', 'Currency', 'Yield', 'Ex-Date', 'Pay-Date'])
+
+                # ISO formatted dates sort in date order
+                writer.writerows(
+                    [
+                        day_date,
+                        event.symbol,
+                        row['name'],
+                        event.amount,
+                        event.currency,
+                        f"{event.yield_value}%" if event.yield_value is not None else "",
+                        day_date,
+                        row['payment_date']
+                    ]
+                    for day_date in sorted(events_by_date)
+                    for event, row in events_by_date[day_date]
+                )
+
+            # We've created an additional file, but we'll still return just the main one
+            logger.info(
+                f"Exported dividend calendar by date to CSV: {date_filepath}")
+        except Exception as e:
+            logger.error(
+                f"Failed to export dividend calendar by date to CSV: {e}")
+
+    return exported
 
-    return results
+
+_DIVIDEND_CALENDAR_EXPORTERS = {
+    'json': _export_dividend_calendar_json,
+    'csv': _export_dividend_calendar_csv,
+}
 
 
 def export_dividend_calendar(dividend_calendar: 'DividendCalendar',
@@ -559,87 +971,57 @@ def export_dividend_calendar(dividend_calendar: 'DividendCalendar',
     ensure_directory(output_dir)
 
     for fmt in formats:
-        if fmt.lower() == 'json':
-            # Export to JSON
-            filename = f"dividend_calendar_{date_range}_{timestamp}.json"
-            filepath = Path(output_dir) / filename
+        fmt_key = fmt.lower()
+        exporter = _DIVIDEND_CALENDAR_EXPORTERS.get(fmt_key)
+        if exporter:
+            filepath = exporter(dividend_calendar, output_dir, timestamp, date_range, view_mode)
+            if filepath:
+                results[fmt_key] = filepath
 
-            try:
-                with open(filepath, 'w') as f:
-                    json.dump(dividend_calendar.to_dict(),
-                              f, indent=2, default=str)
-                results['json'] = str(filepath)
-                logger.info(f"Exported dividend calendar to JSON: {filepath}")
-            except Exception as e:
-                logger.error(
-                    f"Failed to export dividend calendar to JSON: {e}")
-
-        elif fmt.lower() == 'csv':
-            # Export to CSV
-            filename = f"dividend_calendar_{date_range}_{timestamp}.csv"
-            filepath = Path(output_dir) / filename
+    return results
 
-            try:
-                with open(filepath, 'w', newline='') as f:
-                    writer = csv.DictWriter(
-                        f, fieldnames=DividendCalendarEvent.get_csv_header())
-                    writer.writeheader()
-                    for event in dividend_calendar.events:
-                        writer.writerow(event.to_csv_row())
-                results['csv'] = str(filepath)
-                logger.info(f"Exported dividend calendar to CSV: {filepath}")
-            except Exception as e:
-                logger.error(f"Failed to export dividend calendar to CSV: {e}")
-
-            # For a more structured temporal view, create a date-based CSV as well
-            if view_mode == 'calendar':
-                date_filename = f"dividend_calendar_by_date_{date_range}_{timestamp}.csv"
-                date_filepath = Path(output_dir) / date_filename
-
-                try:
-                    with open(date_filepath, 'w', newline='') as f:
-                        writer = csv.writer(f)
-
-                        # Write headers
-                        writer.writerow(
-                            ['Date', 'Symbol', 'Name', 'Amount', 'Currency', 'Yield', 'Ex-Date', 'Pay-Date'])
-
-                        # Group by ex-dividend date
-                        events_by_date = dividend_calendar.get_events_by_date(
-                            'ex_dividend_date')
-
-                        # Sort dates
-                        sorted_dates = sorted(events_by_date.keys())
-
-                        # Write data for each date
-                        for day_date in sorted_dates:
-                            for event in events_by_date[day_date]:
-                                # Format the dates for readability
-                                ex_date = event.ex_dividend_date.strftime(
-                                    "%Y-%m-%d") if event.ex_dividend_date else ""
-                                pay_date = event.payment_date.strftime(
-                                    "%Y-%m-%d") if event.payment_date else ""
-                                yield_value = f"{event.yield_value}%" if event.yield_value is not None else ""
-
-                                writer.writerow([
-                                    day_date.strftime("%Y-%m-%d"),
-                                    event.symbol,
-                                    event.name or "",
-                                    event.amount,
-                                    event.currency,
-                                    yield_value,
-                                    ex_date,
-                                    pay_date
-                                ])
-
-                    # We've created an additional file, but we'll still return just the main one
-                    logger.info(
-                        f"Exported dividend calendar by date to CSV: {date_filepath}")
-                except Exception as e:
-                    logger.error(
-                        f"Failed to export dividend calendar by date to CSV: {e}")
 
-    return results
+def _export_stock_splits_json(split_history: 'SplitHistory', output_dir: Union[str, Path],
+                              timestamp: str) -> Optional[str]:
+    """Export a stock split history to JSON, returning the file path."""
+    symbol = split_history.symbol
+
+    filename = f"stock_splits_{symbol}_{timestamp}.json"
+    filepath = Path(output_dir) / filename
+
+    try:
+        _dump_json(split_history.to_dict(), filepath, default=str)
+        logger.info(f"Exported stock splits to JSON: {filepath}")
+        return str(filepath)
+    except Exception as e:
+        logger.error(f"Failed to export stock splits to JSON: {e}")
+        return None
+
+
+def _export_stock_splits_csv(split_history: 'SplitHistory', output_dir: Union[str, Path],
+                             timestamp: str) -> Optional[str]:
+    """Export a stock split history to CSV, returning the file path."""
+    symbol = split_history.symbol
+
+    filename = f"stock_splits_{symbol}_{timestamp}.csv"
+    filepath = Path(output_dir) / filename
+
+    try:
+        with _open_csv(filepath) as f:
+            _write_csv_tuples(f, StockSplit.get_csv_header(), _SPLIT_CSV_HEADER_LINE,
+                              _SPLIT_CSV_ROW_FORMAT,
+                              [split.to_csv_tuple() for split in split_history.splits])
+        logger.info(f"Exported stock splits to CSV: {filepath}")
+        return str(filepath)
+    except Exception as e:
+        logger.error(f"Failed to export stock splits to CSV: {e}")
+        return None
+
+
+_STOCK_SPLITS_EXPORTERS = {
+    'json': _export_stock_splits_json,
+    'csv': _export_stock_splits_csv,
+}
 
 
 def export_stock_splits(split_history: 'SplitHistory', formats: List[str],
@@ -657,48 +1039,179 @@ def export_stock_splits(split_history: 'SplitHistory', formats: List[str],
     """
     results = {}
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    symbol = split_history.symbol
 
     # Ensure the output directory exists
     ensure_directory(output_dir)
 
     for fmt in formats:
-        if fmt.lower() == 'json':
-            # Export to JSON
-            filename = f"stock_splits_{symbol}_{timestamp}.json"
-            filepath = Path(output_dir) / filename
+        fmt_key = fmt.lower()
+        exporter = _STOCK_SPLITS_EXPORTERS.get(fmt_key)
+        if exporter:
+            filepath = exporter(split_history, output_dir, timestamp)
+            if filepath:
+                results[fmt_key] = filepath
 
-            try:
-                with open(filepath, 'w') as f:
-                    json.dump(split_history.to_dict(),
-                              f, indent=2, default=str)
-                results['json'] = str(filepath)
-                logger.info(f"Exported stock splits to JSON: {filepath}")
-            except Exception as e:
-                logger.error(f"Failed to export stock splits to JSON: {e}")
-
-        elif fmt.lower() == 'csv':
-            # Export to CSV
-            filename = f"stock_splits_{symbol}_{timestamp}.csv"
-            filepath = Path(output_dir) / filename
+    return results
 
-            try:
-                with open(filepath, 'w', newline='') as f:
-                    writer = csv.DictWriter(
-                        f, fieldnames=StockSplit.get_csv_header())
-                    writer.writeheader()
-                    for split in split_history.splits:
-                        writer.writerow(split.to_csv_row())
-                results['csv'] = str(filepath)
-                logger.info(f"Exported stock splits to CSV: {filepath}")
-            except Exception as e:
-                logger.error(f"Failed to export stock splits to CSV: {e}")
 
-    return results
+def _format_date(value: Union[date, datetime]) -> str:
+    """
+    Format a date or datetime as YYYY-MM-DD.
+
+    isoformat() is much cheaper than strftime().
+    """
+    return value.isoformat()[:10]
+
+
+def _split_summary_row(history: 'SplitHistory') -> List[Any]:
+    """Build the splits comparison summary CSV row for one history."""
+    recent_split = history.splits[0] if history.splits else None
+    recent_date = _format_date(recent_split.date) if recent_split and recent_split.date else ""
+    recent_ratio = f"{recent_split.split_text}" if recent_split else ""
+
+    return [
+        history.symbol,
+        history.name or "",
+        len(history.splits),
+        recent_date,
+        recent_ratio,
+        history.get_cumulative_split_factor()
+    ]
+
+
+def _split_timeline_row(history: 'SplitHistory', sorted_years: List[int],
+                        year_bounds: Dict[int, Tuple[datetime, datetime]]) -> List[Any]:
+    """Build one symbol's row of the splits timeline CSV: a "count,factor" cell per year."""
+    years_with_splits = history.get_splits_by_year()
+    row = [history.symbol]
+
+    for year in sorted_years:
+        if year in years_with_splits:
+            year_start, year_end = year_bounds[year]
+            year_factor = history.get_cumulative_split_factor(year_start, year_end)
+
+            # Add split count and factor
+            row.append(f"{len(years_with_splits[year])},{year_factor:.2f}")
+        else:
+            row.append("")
+
+    return row
+
+
+def _write_split_detail_csv(history: 'SplitHistory', output_prefix: str,
+                            timestamp: str) -> str:
+    """Write the per-symbol detail CSV of a splits comparison, returning its path."""
+    detail_filepath = f"{output_prefix}stock_splits_{history.symbol}_{timestamp}.csv"
+
+    with _open_csv(detail_filepath) as f:
+        _write_csv_tuples(f, StockSplit.get_csv_header(), _SPLIT_CSV_HEADER_LINE,
+                          _SPLIT_CSV_ROW_FORMAT,
+                          [split.to_csv_tuple() for split in history.splits])
+
+    return detail_filepath
+
+
+def _export_stock_splits_comparison_json(split_histories: List['SplitHistory'], output_dir: Union[str, Path],
+                                         timestamp: str, symbol_list: List[str], chunk_size: int) -> Optional[str]:
+    """Export a stock splits comparison to JSON, returning the file path."""
+    output_prefix = os.path.join(output_dir, "")
+    filename = f"splits_comparison_{timestamp}.json"
+    filepath = output_prefix + filename
+
+    try:
+        # Stream the histories so only a chunk of them is serialized at once
+        with open(filepath, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
+            _stream_json_object(
+                f,
+                {
+                    "timestamp": timestamp,
+                    "symbols": symbol_list
+                },
+                "histories",
+                (history.to_dict() for history in split_histories),
+                chunk_size
+            )
+        logger.info(f"Exported splits comparison to JSON: {filepath}")
+        return str(filepath)
+    except Exception as e:
+        logger.error(
+            f"Failed to export splits comparison to JSON: {e}")
+        return None
+
+
+def _export_stock_splits_comparison_csv(split_histories: List['SplitHistory'], output_dir: Union[str, Path],
+                                        timestamp: str, symbol_list: List[str], chunk_size: int) -> Optional[str]:
+    """Export a stock splits comparison to CSV, returning the file path."""
+    output_prefix = os.path.join(output_dir, "")
+    # Export multiple CSV files - one summary and individual files for each symbol
+
+    # First, create a summary file
+    summary_filename = f"splits_comparison_summary_{timestamp}.csv"
+    summary_filepath = output_prefix + summary_filename
+
+    try:
+        # The per-symbol detail files are independent, so write them on
+        # worker threads while the summary and timeline are written here
+        with ThreadPoolExecutor(max_workers=min(_MAX_WRITE_WORKERS, max(len(split_histories), 1))) as executor:
+            detail_paths = executor.map(
+                lambda history: _write_split_detail_csv(history, output_prefix, timestamp),
+                split_histories)
+
+            with _open_csv(summary_filepath) as f:
+                # Create summary headers
+                writer = csv.writer(f)
+                writer.writerow(["Symbol", "Company", "Total Splits", "Latest Split Date",
+                                "Latest Split Ratio", "Cumulative Factor"])
+
+                # Add summary data for each symbol
+                writer.writerows(_split_summary_row(history)
+                                 for history in split_histories)
+
+            # Now create a timeline csv showing splits by year
+            timeline_filename = f"splits_timeline_{timestamp}.csv"
+            timeline_filepath = output_prefix + timeline_filename
+
+            # Find all years with splits
+            all_years = set()
+            for history in split_histories:
+                all_years.update(history.get_years_with_splits())
+
+            if all_years:
+                sorted_years = sorted(all_years, reverse=True)
+                year_bounds = {year: (datetime(year, 1, 1), datetime(year, 12, 31))
+                               for year in sorted_years}
+
+                with _open_csv(timeline_filepath) as f:
+                    writer = csv.writer(f)
+
+                    # Create header with years
+                    writer.writerow(["Symbol", *sorted_years])
+
+                    # Add data for each company
+                    writer.writerows(_split_timeline_row(history, sorted_years, year_bounds)
+                                     for history in split_histories)
+
+            # Surface any error raised while writing a detail file
+            list(detail_paths)
+
+        logger.info(
+            f"Exported splits comparison to CSV: {summary_filepath}")
+        logger.info(
+            f"Exported splits timeline to CSV: {timeline_filepath}")
+        return str(summary_filepath)
+    except Exception as e:
+        logger.error(f"Failed to export splits comparison to CSV: {e}")
+        return None
+
+
+_STOCK_SPLITS_COMPARISON_EXPORTERS = {
+    'json': _export_stock_splits_comparison_json,
+    'csv': _export_stock_splits_comparison_csv,
+}
 
 
 def export_stock_splits_comparison(split_histories: List['SplitHistory'], formats: List[str],
-                                   output_dir: Union[str, Path]) -> Dict[str, str]:
+                                   output_dir: Union[str, Path], chunk_size: int = 10) -> Dict[str, str]:
     """
     Export stock splits comparison to specified formats.
 
@@ -706,133 +1219,218 @@ def export_stock_splits_comparison(split_histories: List['SplitHistory'], format
         split_histories: List of SplitHistory objects to export
         formats: List of formats to export to ('json', 'csv')
         output_dir: Directory to save exported files
+        chunk_size: Number of histories serialized per JSON write
 
     Returns:
         Dictionary mapping format to exported file path
     """
     results = {}
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    symbols = "_".join([history.symbol for history in split_histories])
-
-    # Limit the filename length by truncating symbols if too many
-    if len(symbols) > 50:
-        symbols = f"{symbols[:47]}..."
+    symbol_list = [history.symbol for history in split_histories]
 
     # Ensure the output directory exists
     ensure_directory(output_dir)
 
     for fmt in formats:
-        if fmt.lower() == 'json':
-            # Export to JSON
-            filename = f"splits_comparison_{timestamp}.json"
-            filepath = Path(output_dir) / filename
+        fmt_key = fmt.lower()
+        exporter = _STOCK_SPLITS_COMPARISON_EXPORTERS.get(fmt_key)
+        if exporter:
+            filepath = exporter(split_histories, output_dir, timestamp, symbol_list, chunk_size)
+            if filepath:
+                results[fmt_key] = filepath
 
-            try:
-                comparison_data = {
-                    "timestamp": timestamp,
-                    "symbols": [history.symbol for history in split_histories],
-                    "histories": [history.to_dict() for history in split_histories]
-                }
+    return results
 
-                with open(filepath, 'w') as f:
-                    json.dump(comparison_data, f, indent=2, default=str)
-                results['json'] = str(filepath)
-                logger.info(f"Exported splits comparison to JSON: {filepath}")
-            except Exception as e:
-                logger.error(
-                    f"Failed to export splits comparison to JSON: {e}")
 
-        elif fmt.lower() == 'csv':
-            # Export multiple CSV files - one summary and individual files for each symbol
+# Split type label keyed by (is_forward_split, is_reverse_split)
+_SPLIT_TYPE_MAP = {
+    (True, False): "Forward",
+    (False, True): "Reverse",
+    (False, False): "Neutral",
+}
 
-            # First, create a summary file
-            summary_filename = f"splits_comparison_summary_{timestamp}.csv"
-            summary_filepath = Path(output_dir) / summary_filename
 
-            try:
-                with open(summary_filepath, 'w', newline='') as f:
-                    # Create summary headers
-                    writer = csv.writer(f)
-                    writer.writerow(["Symbol", "Company", "Total Splits", "Latest Split Date",
-                                    "Latest Split Ratio", "Cumulative Factor"])
-
-                    # Add summary data for each symbol
-                    for history in split_histories:
-                        recent_split = history.splits[0] if history.splits else None
-                        recent_date = recent_split.date.strftime(
-                            "%Y-%m-%d") if recent_split and recent_split.date else ""
-                        recent_ratio = f"{recent_split.split_text}" if recent_split else ""
-
-                        writer.writerow([
-                            history.symbol,
-                            history.name or "",
-                            len(history.splits),
-                            recent_date,
-                            recent_ratio,
-                            history.get_cumulative_split_factor()
-                        ])
+def _export_splits_calendar_json(splits_calendar: 'SplitsCalendar', output_dir: Union[str, Path],
+                                 timestamp: str, date_range: str, view_mode: str) -> Optional[str]:
+    """Export a splits calendar to JSON, returning the file path."""
+    output_prefix = os.path.join(output_dir, "")
+    filename = f"splits_calendar_{date_range}_{timestamp}.json"
+    filepath = output_prefix + filename
 
-                # Now create a timeline csv showing splits by year
-                timeline_filename = f"splits_timeline_{timestamp}.csv"
-                timeline_filepath = Path(output_dir) / timeline_filename
-
-                # Find all years with splits
-                all_years = set()
-                for history in split_histories:
-                    all_years.update(history.get_years_with_splits())
-
-                if all_years:
-                    with open(timeline_filepath, 'w', newline='') as f:
-                        writer = csv.writer(f)
-
-                        # Create header with years
-                        header = ["Symbol"]
-                        for year in sorted(all_years, reverse=True):
-                            header.append(str(year))
-                        writer.writerow(header)
-
-                        # Add data for each company
-                        for history in split_histories:
-                            row = [history.symbol]
-                            years_with_splits = history.get_splits_by_year()
-
-                            for year in sorted(all_years, reverse=True):
-                                if year in years_with_splits:
-                                    splits_in_year = years_with_splits[year]
-                                    year_start = datetime(year, 1, 1)
-                                    year_end = datetime(year, 12, 31)
-                                    year_factor = history.get_cumulative_split_factor(
-                                        year_start, year_end)
-
-                                    # Add split count and factor
-                                    row.append(
-                                        f"{len(splits_in_year)},{year_factor:.2f}")
-                                else:
-                                    row.append("")
-
-                            writer.writerow(row)
-
-                # Now export individual detailed files for each symbol
-                for history in split_histories:
-                    detail_filename = f"stock_splits_{history.symbol}_{timestamp}.csv"
-                    detail_filepath = Path(output_dir) / detail_filename
-
-                    with open(detail_filepath, 'w', newline='') as f:
-                        writer = csv.DictWriter(
-                            f, fieldnames=StockSplit.get_csv_header())
-                        writer.writeheader()
-                        for split in history.splits:
-                            writer.writerow(split.to_csv_row())
-
-                results['csv'] = str(summary_filepath)
-                logger.info(
-                    f"Exported splits comparison to CSV: {summary_filepath}")
-                logger.info(
-                    f"Exported splits timeline to CSV: {timeline_filepath}")
-            except Exception as e:
-                logger.error(f"Failed to export splits comparison to CSV: {e}")
+    try:
+        # Stream the events so the full calendar dict is never built
+        events = splits_calendar.events
+        with open(filepath, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
+            _stream_json_object(
+                f,
+                {
+                    'start_date': splits_calendar.start_date.isoformat(),
+                    'end_date': splits_calendar.end_date.isoformat(),
+                    'events_count': len(events)
+                },
+                'events',
+                (event.to_dict() for event in events),
+                chunk_size=_JSON_STREAM_CHUNK_SIZE
+            )
+        logger.info(f"Exported splits calendar to JSON: {filepath}")
+        return str(filepath)
+    except Exception as e:
+        logger.error(f"Failed to export splits calendar to JSON: {e}")
+        return None
+
+
+def _splits_calendar_summary_row(symbol: str, events: List['SplitCalendarEvent'],
+                                 today: date) -> List[Any]:
+    """Build the splits calendar summary CSV row for one symbol."""
+    # Basic information
+    company_name = events[0].name or ""
+
+    # Count split types and find the next split in one pass
+    total = len(events)
+    forward_count = 0
+    reverse_count = 0
+    next_event = None
+
+    for e in events:
+        if e.is_forward_split:
+            forward_count += 1
+        elif e.is_reverse_split:
+            reverse_count += 1
+        if e.date and e.date.date() >= today and (
+                next_event is None or e.date < next_event.date):
+            next_event = e
+
+    next_date = ""
+    next_ratio = ""
+    next_type = ""
+
+    if next_event:
+        next_date = _format_date(next_event.date)
+        next_ratio = next_event.split_text
+        next_type = _SPLIT_TYPE_MAP[(next_event.is_forward_split,
+                                     next_event.is_reverse_split)]
+
+    return [
+        symbol,
+        company_name,
+        total,
+        forward_count,
+        reverse_count,
+        next_date,
+        next_ratio,
+        next_type
+    ]
+
+
+def _export_splits_calendar_csv(splits_calendar: 'SplitsCalendar', output_dir: Union[str, Path],
+                                timestamp: str, date_range: str, view_mode: str) -> Optional[str]:
+    """Export a splits calendar to CSV, returning the main file path."""
+    output_prefix = os.path.join(output_dir, "")
+    exported = None
+    filename = f"splits_calendar_{date_range}_{timestamp}.csv"
+    filepath = output_prefix + filename
 
-    return results
+    try:
+        with _open_csv(filepath) as f:
+            writer = csv.DictWriter(
+                f, fieldnames=SplitCalendarEvent.get_csv_header())
+            writer.writeheader()
+            writer.writerows(event.to_csv_row() for event in splits_calendar.events)
+        exported = str(filepath)
+        logger.info(f"Exported splits calendar to CSV: {filepath}")
+    except Exception as e:
+        logger.error(f"Failed to export splits calendar to CSV: {e}")
+
+    # For a more structured temporal view, create a date-based CSV as well
+    if view_mode == 'calendar':
+        date_filename = f"splits_calendar_by_date_{date_range}_{timestamp}.csv"
+        date_filepath = output_prefix + date_filename
+
+        try:
+            with _open_csv(date_filepath) as f:
+                writer = csv.writer(f)
+
+                # Write headers
+                writer.writerow(
+                    ['Date', 'Symbol', 'Company', 'Split', 'Ratio', 'Type', 'Exchange'])
+
+                # Group by date once for this file and sort the dates
+                events_by_date = splits_calendar.get_events_by_date()
+                sorted_dates = sorted(events_by_date)
+
+                # Write data for each date
+                rows = [
+                    (
+                        _format_date(day_date),
+                        event.symbol,
+                        event.name or "",
+                        event.split_text,
+                        f"{event.ratio:.2f}",
+                        _SPLIT_TYPE_MAP[(event.is_forward_split, event.is_reverse_split)],
+                        event.exchange or ""
+                    )
+                    for day_date in sorted_dates
+                    for event in events_by_date[day_date]
+                ]
+                writer.writerows(rows)
+
+            # We've created an additional file, but we'll still return just the main one
+            logger.info(
+                f"Exported splits calendar by date to CSV: {date_filepath}")
+        except Exception as e:
+            logger.error(
+                f"Failed to export splits calendar by date to CSV: {e}")
+
+    # Also create a summary CSV if view mode is 'summary'
+    if view_mode == 'summary':
+        summary_filename = f"splits_calendar_summary_{date_range}_{timestamp}.csv"
+        summary_filepath = output_prefix + summary_filename
+
+        try:
+            with _open_csv(summary_filepath) as f:
+                writer = csv.writer(f)
+
+                # Write headers
+                writer.writerow([
+                    'Symbol', 'Company', 'Total Splits', 'Forward Splits',
+                    'Reverse Splits', 'Next Split Date', 'Next Split Ratio', 'Next Split Type'
+                ])
+
+                # Group by symbol
+                events_by_symbol = splits_calendar.get_events_by_symbol()
+                today = date.today()
+
+                # Write data for each symbol
+                writer.writerows(_splits_calendar_summary_row(symbol, events, today)
+                                 for symbol, events in sorted(events_by_symbol.items()))
+
+            logger.info(
+                f"Exported splits calendar summary to CSV: {summary_filepath}")
+        except Exception as e:
+            logger.error(
+                f"Failed to export splits calendar summary to CSV: {e}")
+
+    return exported
+
+
+def _export_splits_calendar_parquet(splits_calendar: 'SplitsCalendar', output_dir: Union[str, Path],
+                                    timestamp: str, date_range: str, view_mode: str) -> Optional[str]:
+    """Export the events of a splits calendar to Parquet, returning the file path."""
+    filename = f"splits_calendar_{date_range}_{timestamp}.parquet"
+    filepath = os.path.join(output_dir, filename)
+
+    if not _write_parquet(filepath, [event.to_dict() for event in splits_calendar.events]):
+        return None
+
+    logger.info(f"Exported splits calendar to Parquet: {filepath}")
+    return filepath
+
+
+_SPLITS_CALENDAR_EXPORTERS = {
+    'json': _export_splits_calendar_json,
+    'csv': _export_splits_calendar_csv,
+    'parquet': _export_splits_calendar_parquet,
+}
 
 
 def export_splits_calendar(splits_calendar: 'SplitsCalendar',
@@ -844,7 +1442,7 @@ def export_splits_calendar(splits_calendar: 'SplitsCalendar',
 
     Args:
         splits_calendar: SplitsCalendar object to export
-        formats: List of formats to export to ('json', 'csv')
+        formats: List of formats to export to ('json', 'csv' and/or 'parquet')
         output_dir: Directory to save exported files
         view_mode: The view mode that was used (for naming purposes)
 
@@ -859,144 +1457,109 @@ def export_splits_calendar(splits_calendar: 'SplitsCalendar',
     ensure_directory(output_dir)
 
     for fmt in formats:
-        if fmt.lower() == 'json':
-            # Export to JSON
-            filename = f"splits_calendar_{date_range}_{timestamp}.json"
-            filepath = Path(output_dir) / filename
+        fmt_key = fmt.lower()
+        exporter = _SPLITS_CALENDAR_EXPORTERS.get(fmt_key)
+        if exporter:
+            filepath = exporter(splits_calendar, output_dir, timestamp, date_range, view_mode)
+            if filepath:
+                results[fmt_key] = filepath
 
-            try:
-                with open(filepath, 'w') as f:
-                    json.dump(splits_calendar.to_dict(),
-                              f, indent=2, default=str)
-                results['json'] = str(filepath)
-                logger.info(f"Exported splits calendar to JSON: {filepath}")
-            except Exception as e:
-                logger.error(f"Failed to export splits calendar to JSON: {e}")
-
-        elif fmt.lower() == 'csv':
-            # Export to CSV
-            filename = f"splits_calendar_{date_range}_{timestamp}.csv"
-            filepath = Path(output_dir) / filename
+    return results
 
-            try:
-                with open(filepath, 'w', newline='') as f:
-                    writer = csv.DictWriter(
-                        f, fieldnames=SplitCalendarEvent.get_csv_header())
-                    writer.writeheader()
-                    for event in splits_calendar.events:
-                        writer.writerow(event.to_csv_row())
-                results['csv'] = str(filepath)
-                logger.info(f"Exported splits calendar to CSV: {filepath}")
-            except Exception as e:
-                logger.error(f"Failed to export splits calendar to CSV: {e}")
-
-            # For a more structured temporal view, create a date-based CSV as well
-            if view_mode == 'calendar':
-                date_filename = f"splits_calendar_by_date_{date_range}_{timestamp}.csv"
-                date_filepath = Path(output_dir) / date_filename
-
-                try:
-                    with open(date_filepath, 'w', newline='') as f:
-                        writer = csv.writer(f)
-
-                        # Write headers
-                        writer.writerow(
-                            ['Date', 'Symbol', 'Company', 'Split', 'Ratio', 'Type', 'Exchange'])
-
-                        # Group by date
-                        events_by_date = splits_calendar.get_events_by_date()
-
-                        # Sort dates
-                        sorted_dates = sorted(events_by_date.keys())
-
-                        # Write data for each date
-                        for day_date in sorted_dates:
-                            for event in events_by_date[day_date]:
-                                # Determine split type
-                                split_type = "Forward" if event.is_forward_split else "Reverse" if event.is_reverse_split else "Neutral"
-
-                                writer.writerow([
-                                    day_date.strftime("%Y-%m-%d"),
-                                    event.symbol,
-                                    event.name or "",
-                                    event.split_text,
-                                    f"{event.ratio:.2f}",
-                                    split_type,
-                                    event.exchange or ""
-                                ])
-
-                    # We've created an additional file, but we'll still return just the main one
-                    logger.info(
-                        f"Exported splits calendar by date to CSV: {date_filepath}")
-                except Exception as e:
-                    logger.error(
-                        f"Failed to export splits calendar by date to CSV: {e}")
-
-            # Also create a summary CSV if view mode is 'summary'
-            if view_mode == 'summary':
-                summary_filename = f"splits_calendar_summary_{date_range}_{timestamp}.csv"
-                summary_filepath = Path(output_dir) / summary_filename
-
-                try:
-                    with open(summary_filepath, 'w', newline='') as f:
-                        writer = csv.writer(f)
-
-                        # Write headers
-                        writer.writerow([
-                            'Symbol', 'Company', 'Total Splits', 'Forward Splits',
-                            'Reverse Splits', 'Next Split Date', 'Next Split Ratio', 'Next Split Type'
-                        ])
 
-                        # Group by symbol
-                        events_by_symbol = splits_calendar.get_events_by_symbol()
-
-                        # Write data for each symbol
-                        for symbol, events in sorted(events_by_symbol.items()):
-                            # Basic information
-                            company_name = events[0].name or ""
-
-                            # Count split types
-                            total = len(events)
-                            forward_count = sum(
-                                1 for e in events if e.is_forward_split)
-                            reverse_count = sum(
-                                1 for e in events if e.is_reverse_split)
-
-                            # Find next split
-                            next_date = ""
-                            next_ratio = ""
-                            next_type = ""
-
-                            future_events = [
-                                e for e in events if e.date and e.date.date() >= date.today()]
-                            if future_events:
-                                future_events.sort(key=lambda e: e.date)
-                                next_event = future_events[0]
-
-                                if next_event.date:
-                                    next_date = next_event.date.strftime(
-                                        "%Y-%m-%d")
-                                    next_ratio = next_event.split_text
-                                    next_type = "Forward" if next_event.is_forward_split else "Reverse" if next_event.is_reverse_split else "Neutral"
-
-                            writer.writerow([
-                                symbol,
-                                company_name,
-                                total,
-                                forward_count,
-                                reverse_count,
-                                next_date,
-                                next_ratio,
-                                next_type
-                            ])
-
-                    logger.info(
-                        f"Exported splits calendar summary to CSV: {summary_filepath}")
-                except Exception as e:
-                    logger.error(
-                        f"Failed to export splits calendar summary to CSV: {e}")
+def _write_csv_rows(path: Union[str, Path], header: Sequence[str],
+                    rows: Iterable[Sequence[Any]]) -> None:
+    """
+    Write a header and rows to a CSV file with csv.writer.
 
-    return results
+    Args:
+        path: The path to the output file
+        header: The column names, in output order
+        rows: The rows to write, each ordered like header
+    """
+    with _open_csv(path) as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(rows)
+
+
+def _write_arrow(path: Union[str, Path], records: List[Dict[str, Any]]) -> bool:
+    """
+    Write records to an Arrow IPC (Feather v2) file.
+
+    Arrow output requires pyarrow; when it is not installed the format is
+    skipped and a warning is logged.
+
+    Args:
+        path: The path to the output file
+        records: The records to write, one row per dict
+
+    Returns:
+        True if the file was written, False otherwise
+    """
+    if pa is None:
+        logger.warning("Skipping Arrow export: pyarrow is not installed "
+                       "(pip install 'stockcli[arrow]')")
+        return False
+
+    try:
+        table = pa.Table.from_pylist(records)
+        pa_feather.write_feather(table, str(path), compression='zstd')
+        return True
+    except Exception as e:
+        logger.error(f"Error exporting Arrow file {path}: {e}")
+        return False
+
+
+def _write_parquet(path: Union[str, Path],
+                   records: Union[List[Dict[str, Any]], Dict[str, List[Any]]],
+                   metadata: Optional[Dict[str, str]] = None) -> bool:
+    """
+    Write records to a zstd-compressed Parquet file.
+
+    Parquet output requires pyarrow; when it is not installed the format is
+    skipped and a warning is logged.
+
+    Args:
+        path: The path to the output file
+        records: The records to write, one row per dict, or a dict of
+            equally long column lists
+        metadata: Optional key/value pairs stored in the schema metadata
+
+    Returns:
+        True if the file was written, False otherwise
+    """
+    if pa is None:
+        logger.warning("Skipping Parquet export: pyarrow is not installed "
+                       "(pip install 'stockcli[parquet]')")
+        return False
+
+    try:
+        if isinstance(records, dict):
+            table = pa.table(records)
+        else:
+            table = pa.Table.from_pylist(records)
+        if metadata:
+            table = table.replace_schema_metadata(metadata)
+        pa_parquet.write_table(table, str(path), compression='zstd')
+        return True
+    except Exception as e:
+        logger.error(f"Error exporting Parquet file {path}: {e}")
+        return False
+
+
+def _statement_csv_header(statement_cls) -> Tuple[str, ...]:
+    """Get the combined CSV header for a multi-statement export."""
+    return ('fiscal_date',) + statement_cls.get_csv_headers()
+
+
+def _statement_csv_rows(statements: List[Any]) -> List[Tuple[str, ...]]:
+    """Flatten the CSV rows of several statements, tagging each with its fiscal date."""
+    return [
+        (statement.fiscal_date,) + row
+        for statement in statements
+        for row in statement.get_csv_tuples()
+    ]
 
 
 def export_income_statement(income_statement: IncomeStatement, formats: List[str],
@@ -1025,25 +1588,20 @@ def export_income_statement(income_statement: IncomeStatement, formats: List[str
     )
 
     ensure_directory(output_dir)
+    output_prefix = os.path.join(output_dir, "")
 
     # Export to JSON
     if 'json' in formats:
-        json_path = output_dir / f"{base_filename}.json"
-        with open(json_path, 'w') as f:
-            json.dump(income_statement.to_dict(), f, indent=2)
+        json_path = f"{output_prefix}{base_filename}.json"
+        _dump_json(income_statement.to_dict(), json_path)
         result['json'] = str(json_path)
 
     # Export to CSV
     if 'csv' in formats:
-        csv_path = output_dir / f"{base_filename}.csv"
+        csv_path = f"{output_prefix}{base_filename}.csv"
 
-        with open(csv_path, 'w', newline='') as f:
-            csv_writer = csv.DictWriter(
-                f, fieldnames=IncomeStatement.get_csv_headers())
-            csv_writer.writeheader()
-
-            for row in income_statement.get_csv_rows():
-                csv_writer.writerow(row)
+        _write_csv_rows(csv_path, IncomeStatement.get_csv_headers(),
+                        income_statement.get_csv_tuples())
 
         result['csv'] = str(csv_path)
 
@@ -1057,7 +1615,7 @@ def export_income_statements(income_statements: List[IncomeStatement], formats:
 
     Args:
         income_statements: The income statements to export
-        formats: List of formats to export ('json', 'csv', or both)
+        formats: List of formats to export ('json', 'csv' and/or 'arrow')
         output_dir: Directory to save the exported files
 
     Returns:
@@ -1079,40 +1637,30 @@ def export_income_statements(income_statements: List[IncomeStatement], formats:
     )
 
     ensure_directory(output_dir)
+    output_prefix = os.path.join(output_dir, "")
 
     # Export to JSON
     if 'json' in formats:
-        json_path = output_dir / f"{base_filename}.json"
-        with open(json_path, 'w') as f:
-            json.dump({
-                "symbol": symbol,
-                "period": period,
-                "statements": [statement.to_dict() for statement in income_statements]
-            }, f, indent=2)
+        json_path = f"{output_prefix}{base_filename}.json"
+        _dump_json({
+            "symbol": symbol,
+            "period": period,
+            "statements": [statement.to_dict() for statement in income_statements]
+        }, json_path)
         result['json'] = str(json_path)
 
-    # Export to CSV - each statement in a separate file
+    # Export to CSV - all statements in one file, keyed by fiscal date
     if 'csv' in formats:
-        # Create a directory for all CSVs
-        csv_dir = output_dir / f"{base_filename}_csv"
-        ensure_directory(csv_dir)
-
-        csv_paths = []
-        for statement in income_statements:
-            statement_filename = f"{symbol}_{period}_{statement.fiscal_date}.csv"
-            csv_path = csv_dir / statement_filename
-
-            with open(csv_path, 'w', newline='') as f:
-                csv_writer = csv.DictWriter(
-                    f, fieldnames=IncomeStatement.get_csv_headers())
-                csv_writer.writeheader()
-
-                for row in statement.get_csv_rows():
-                    csv_writer.writerow(row)
-
-            csv_paths.append(str(csv_path))
+        csv_path = f"{output_prefix}{base_filename}.csv"
+        _write_csv_rows(csv_path, _statement_csv_header(IncomeStatement),
+                        _statement_csv_rows(income_statements))
+        result['csv'] = str(csv_path)
 
-        result['csv'] = csv_paths
+    # Export to Arrow IPC - one row per statement
+    if 'arrow' in formats:
+        arrow_path = f"{output_prefix}{base_filename}.arrow"
+        if _write_arrow(arrow_path, [statement.to_dict() for statement in income_statements]):
+            result['arrow'] = str(arrow_path)
 
     return result
 
@@ -1143,37 +1691,35 @@ def export_expense_breakdown(income_statement: IncomeStatement, formats: List[st
     )
 
     ensure_directory(output_dir)
+    output_prefix = os.path.join(output_dir, "")
 
     expenses = income_statement.get_all_expenses()
 
     # Export to JSON
     if 'json' in formats:
-        json_path = output_dir / f"{base_filename}.json"
-        with open(json_path, 'w') as f:
-            json.dump({
-                "symbol": symbol,
-                "period": period,
-                "fiscal_date": date,
-                "currency": income_statement.currency,
-                "revenue": income_statement.revenue.to_dict(),
-                "expenses": [expense.to_dict() for expense in expenses]
-            }, f, indent=2)
+        json_path = f"{output_prefix}{base_filename}.json"
+        _dump_json({
+            "symbol": symbol,
+            "period": period,
+            "fiscal_date": date,
+            "currency": income_statement.currency,
+            "revenue": income_statement.revenue.to_dict(),
+            "expenses": [expense.to_dict() for expense in expenses]
+        }, json_path)
         result['json'] = str(json_path)
 
     # Export to CSV
     if 'csv' in formats:
-        csv_path = output_dir / f"{base_filename}.csv"
+        csv_path = f"{output_prefix}{base_filename}.csv"
 
-        with open(csv_path, 'w', newline='') as f:
+        with _open_csv(csv_path) as f:
             csv_writer = csv.writer(f)
             csv_writer.writerow(["Expense Category", "Amount", "% of Revenue"])
 
-            for expense in expenses:
-                csv_writer.writerow([
-                    expense.name,
-                    expense.value_str,
-                    expense.percentage_str
-                ])
+            csv_writer.writerows(
+                [expense.name, expense.value_str, expense.percentage_str]
+                for expense in expenses
+            )
 
         result['csv'] = str(csv_path)
 
@@ -1206,98 +1752,26 @@ def export_balance_sheet(balance_sheet: BalanceSheet, formats: List[str],
     )
 
     ensure_directory(output_dir)
+    output_prefix = os.path.join(output_dir, "")
 
     # Export to JSON
     if 'json' in formats:
-        json_path = output_dir / f"{base_filename}.json"
-        with open(json_path, 'w') as f:
-            json.dump(balance_sheet.to_dict(), f, indent=2)
+        json_path = f"{output_prefix}{base_filename}.json"
+        _dump_json(balance_sheet.to_dict(), json_path)
         result['json'] = str(json_path)
 
     # Export to CSV
     if 'csv' in formats:
-        csv_path = output_dir / f"{base_filename}.csv"
-
-        with open(csv_path, 'w', newline='') as f:
-            csv_writer = csv.DictWriter(
-                f, fieldnames=BalanceSheet.get_csv_headers())
-            csv_writer.writeheader()
+        csv_path = f"{output_prefix}{base_filename}.csv"
 
-            for row in balance_sheet.get_csv_rows():
-                csv_writer.writerow(row)
+        _write_csv_rows(csv_path, BalanceSheet.get_csv_headers(),
+                        balance_sheet.get_csv_tuples())
 
         result['csv'] = str(csv_path)
 
     return result
 
 
-def export_balance_sheets(balance_sheets: List[BalanceSheet], formats: List[str],
-                          output_dir: Path) -> Dict[str, Any]:
-    """
-    Export multiple balance sheets to file(s).
-
-    Args:
-        balance_sheets: The balance sheets to export
-        formats: List of formats to export ('json', 'csv', or both)
-        output_dir: Directory to save the exported files
-
-    Returns:
-        Dict mapping format to file path(s)
-    """
-    if not balance_sheets:
-        return {}
-
-    result = {}
-    symbol = balance_sheets[0].symbol.upper()
-    period = balance_sheets[0].fiscal_period
-    date_range = f"{balance_sheets[-1].fiscal_date}_to_{balance_sheets[0].fiscal_date}"
-
-    # Generate filename
-    base_filename = generate_export_filename(
-        'balance_sheets',
-        [symbol],
-        additional_parts=[period, date_range]
-    )
-
-    ensure_directory(output_dir)
-
-    # Export to JSON
-    if 'json' in formats:
-        json_path = output_dir / f"{base_filename}.json"
-        with open(json_path, 'w') as f:
-            json.dump({
-                "symbol": symbol,
-                "period": period,
-                "statements": [statement.to_dict() for statement in balance_sheets]
-            }, f, indent=2)
-        result['json'] = str(json_path)
-
-    # Export to CSV - each statement in a separate file
-    if 'csv' in formats:
-        # Create a directory for all CSVs
-        csv_dir = output_dir / f"{base_filename}_csv"
-        ensure_directory(csv_dir)
-
-        csv_paths = []
-        for statement in balance_sheets:
-            statement_filename = f"{symbol}_{period}_{statement.fiscal_date}.csv"
-            csv_path = csv_dir / statement_filename
-
-            with open(csv_path, 'w', newline='') as f:
-                csv_writer = csv.DictWriter(
-                    f, fieldnames=BalanceSheet.get_csv_headers())
-                csv_writer.writeheader()
-
-                for row in statement.get_csv_rows():
-                    csv_writer.writerow(row)
-
-            csv_paths.append(str(csv_path))
-
-        result['csv'] = csv_paths
-
-    return result
-
-
 def export_balance_sheets(balance_sheets: List[BalanceSheet], formats: List[str],
                           output_dir: Path, custom_filename: Optional[str] = None) -> Dict[str, Any]:
     """
@@ -1305,7 +1779,7 @@ def export_balance_sheets(balance_sheets: List[BalanceSheet], formats: List[str]
 
     Args:
         balance_sheets: The balance sheets to export
-        formats: List of formats to export ('json', 'csv', or both)
+        formats: List of formats to export ('json', 'csv' and/or 'arrow')
         output_dir: Directory to save the exported files
         custom_filename: Optional custom base filename to use
 
@@ -1331,42 +1805,62 @@ def export_balance_sheets(balance_sheets: List[BalanceSheet], formats: List[str]
         )
 
     ensure_directory(output_dir)
+    output_prefix = os.path.join(output_dir, "")
 
     # Export to JSON
     if 'json' in formats:
-        json_path = output_dir / f"{base_filename}.json"
-        with open(json_path, 'w') as f:
-            json.dump({
-                "symbol": symbol,
-                "period": period,
-                "statements": [statement.to_dict() for statement in balance_sheets]
-            }, f, indent=2)
+        json_path = f"{output_prefix}{base_filename}.json"
+        _dump_json({
+            "symbol": symbol,
+            "period": period,
+            "statements": [statement.to_dict() for statement in balance_sheets]
+        }, json_path)
         result['json'] = str(json_path)
 
-    # Export to CSV - each statement in a separate file
+    # Export to CSV - all statements in one file, keyed by fiscal date
     if 'csv' in formats:
-        # Create a directory for all CSVs
-        csv_dir = output_dir / f"{base_filename}_csv"
-        ensure_directory(csv_dir)
+        csv_path = f"{output_prefix}{base_filename}.csv"
+        _write_csv_rows(csv_path, _statement_csv_header(BalanceSheet),
+                        _statement_csv_rows(balance_sheets))
+        result['csv'] = str(csv_path)
 
-        csv_paths = []
-        for statement in balance_sheets:
-            statement_filename = f"{symbol}_{period}_{statement.fiscal_date}.csv"
-            csv_path = csv_dir / statement_filename
+    # Export to Arrow IPC - one row per statement
+    if 'arrow' in formats:
+        arrow_path = f"{output_prefix}{base_filename}.arrow"
+        if _write_arrow(arrow_path, [statement.to_dict() for statement in balance_sheets]):
+            result['arrow'] = str(arrow_path)
 
-            with open(csv_path, 'w', newline='') as f:
-                csv_writer = csv.DictWriter(
-                    f, fieldnames=BalanceSheet.get_csv_headers())
-                csv_writer.writeheader()
+    return result
 
-                for row in statement.get_csv_rows():
-                    csv_writer.writerow(row)
 
-            csv_paths.append(str(csv_path))
+def _percent_of_total(value: float, total_assets: float) -> float:
+    """Express a value as a percentage of total assets, or 0 when there are none."""
+    return (value / total_assets * 100) if total_assets > 0 else 0
 
-        result['csv'] = csv_paths
 
-    return result
+def _section_dict(section: Any, total_assets: float) -> Dict[str, Any]:
+    """
+    Summarize a balance sheet section for the JSON summary export.
+
+    Args:
+        section: The balance sheet section to summarize
+        total_assets: Total assets the percentages are relative to
+
+    Returns:
+        Dictionary with the section value, percentage and items
+    """
+    return {
+        "value": section.value,
+        "percentage": _percent_of_total(section.value, total_assets),
+        "items": [
+            {
+                "name": item.name,
+                "value": item.value,
+                "percentage": _percent_of_total(item.value, total_assets)
+            }
+            for item in section.items
+        ]
+    }
 
 
 def export_balance_sheet_summary(balance_sheet: BalanceSheet, formats: List[str],
@@ -1399,6 +1893,17 @@ def export_balance_sheet_summary(balance_sheet: BalanceSheet, formats: List[str]
         )
 
     ensure_directory(output_dir)
+    output_prefix = os.path.join(output_dir, "")
+
+    # Bind the sections and their totals once; each .value is a property lookup
+    ca = balance_sheet.current_assets
+    nca = balance_sheet.non_current_assets
+    cl = balance_sheet.current_liabilities
+    ncl = balance_sheet.non_current_liabilities
+    equity = balance_sheet.shareholders_equity
+    ca_val = ca.value
+    cl_val = cl.value
+    working_capital = ca_val - cl_val
 
     # Calculate total assets for percentages
     total_assets = balance_sheet.total_assets.value
@@ -1413,188 +1918,110 @@ def export_balance_sheet_summary(balance_sheet: BalanceSheet, formats: List[str]
             "currency": balance_sheet.currency,
             "structure": {
                 "assets": {
-                    "current_assets": {
-                        "value": balance_sheet.current_assets.value,
-                        "percentage": (balance_sheet.current_assets.value / total_assets * 100) if total_assets > 0 else 0,
-                        "items": [
-                            {
-                                "name": item.name,
-                                "value": item.value,
-                                "percentage": (item.value / total_assets * 100) if total_assets > 0 else 0
-                            }
-                            for item in balance_sheet.current_assets.items
-                        ]
-                    },
-                    "non_current_assets": {
-                        "value": balance_sheet.non_current_assets.value,
-                        "percentage": (balance_sheet.non_current_assets.value / total_assets * 100) if total_assets > 0 else 0,
-                        "items": [
-                            {
-                                "name": item.name,
-                                "value": item.value,
-                                "percentage": (item.value / total_assets * 100) if total_assets > 0 else 0
-                            }
-                            for item in balance_sheet.non_current_assets.items
-                        ]
-                    }
+                    "current_assets": _section_dict(ca, total_assets),
+                    "non_current_assets": _section_dict(nca, total_assets)
                 },
                 "liabilities": {
-                    "current_liabilities": {
-                        "value": balance_sheet.current_liabilities.value,
-                        "percentage": (balance_sheet.current_liabilities.value / total_assets * 100) if total_assets > 0 else 0,
-                        "items": [
-                            {
-                                "name": item.name,
-                                "value": item.value,
-                                "percentage": (item.value / total_assets * 100) if total_assets > 0 else 0
-                            }
-                            for item in balance_sheet.current_liabilities.items
-                        ]
-                    },
-                    "non_current_liabilities": {
-                        "value": balance_sheet.non_current_liabilities.value,
-                        "percentage": (balance_sheet.non_current_liabilities.value / total_assets * 100) if total_assets > 0 else 0,
-                        "items": [
-                            {
-                                "name": item.name,
-                                "value": item.value,
-                                "percentage": (item.value / total_assets * 100) if total_assets > 0 else 0
-                            }
-                            for item in balance_sheet.non_current_liabilities.items
-                        ]
-                    }
+                    "current_liabilities": _section_dict(cl, total_assets),
+                    "non_current_liabilities": _section_dict(ncl, total_assets)
                 },
-                "equity": {
-                    "value": balance_sheet.shareholders_equity.value,
-                    "percentage": (balance_sheet.shareholders_equity.value / total_assets * 100) if total_assets > 0 else 0,
-                    "items": [
-                        {
-                            "name": item.name,
-                            "value": item.value,
-                            "percentage": (item.value / total_assets * 100) if total_assets > 0 else 0
-                        }
-                        for item in balance_sheet.shareholders_equity.items
-                    ]
-                }
+                "equity": _section_dict(equity, total_assets)
             },
             "financial_health": {
-                "working_capital": balance_sheet.current_assets.value - balance_sheet.current_liabilities.value,
+                "working_capital": working_capital,
                 "current_ratio": balance_sheet.current_ratio.value,
                 "debt_to_equity": balance_sheet.debt_to_equity.value,
                 "debt_ratio": balance_sheet.debt_ratio.value
             }
         }
 
-        json_path = output_dir / f"{base_filename}.json"
-        with open(json_path, 'w') as f:
-            json.dump(summary, f, indent=2)
+        json_path = f"{output_prefix}{base_filename}.json"
+        _dump_json(summary, json_path)
         result['json'] = str(json_path)
 
     # Export to CSV
     if 'csv' in formats:
-        csv_path = output_dir / f"{base_filename}.csv"
+        csv_path = f"{output_prefix}{base_filename}.csv"
+
+        def section_rows(section, prefix="  "):
+            """Yield the indented line item rows for one balance sheet section."""
+            return ((f"{prefix}{item.name}", item.value_str,
+                     f"{_percent_of_total(item.value, total_assets):.2f}%")
+                    for item in section.items)
+
+        blank_row = ("", "", "")
+        nca_total = nca.total
+        ncl_total = ncl.total
+        equity_total = equity.total
 
-        with open(csv_path, 'w', newline='') as f:
+        with _open_csv(csv_path) as f:
             csv_writer = csv.writer(f)
 
             # Write header
             csv_writer.writerow(
                 ["Component", "Amount", "Percentage of Total Assets"])
 
-            # Write assets
-            csv_writer.writerow(["ASSETS", "", ""])
-
-            # Current Assets
-            csv_writer.writerow(["Current Assets", balance_sheet.current_assets.total.value_str,
-                                f"{(balance_sheet.current_assets.value / total_assets * 100) if total_assets > 0 else 0:.2f}%"])
-
-            for item in balance_sheet.current_assets.items:
-                csv_writer.writerow([
-                    f"  {item.name}",
-                    item.value_str,
-                    f"{(item.value / total_assets * 100) if total_assets > 0 else 0:.2f}%"
-                ])
-
-            # Non-Current Assets
-            csv_writer.writerow(["Non-Current Assets", balance_sheet.non_current_assets.total.value_str,
-                                f"{(balance_sheet.non_current_assets.value / total_assets * 100) if total_assets > 0 else 0:.2f}%"])
+            # Write assets: current, non-current and the total
+            csv_writer.writerows(chain(
+                [("ASSETS", "", ""),
+                 ("Current Assets", ca.total.value_str, f"{_percent_of_total(ca_val, total_assets):.2f}%")],
+                section_rows(ca),
+                [("Non-Current Assets", nca_total.value_str, f"{_percent_of_total(nca_total.value, total_assets):.2f}%")],
+                section_rows(nca),
+                [("TOTAL ASSETS", balance_sheet.total_assets.value_str, "100.00%"),
+                 blank_row]
+            ))
+
+            # Write liabilities: current, non-current and the total
+            csv_writer.writerows(chain(
+                [("LIABILITIES", "", ""),
+                 ("Current Liabilities", cl.total.value_str, f"{_percent_of_total(cl_val, total_assets):.2f}%")],
+                section_rows(cl),
+                [("Non-Current Liabilities", ncl_total.value_str, f"{_percent_of_total(ncl_total.value, total_assets):.2f}%")],
+                section_rows(ncl),
+                [("TOTAL LIABILITIES", balance_sheet.total_liabilities.value_str,
+                  f"{_percent_of_total(balance_sheet.total_liabilities.value, total_assets):.2f}%"),
+                 blank_row]
+            ))
 
-            for item in balance_sheet.non_current_assets.items:
-                csv_writer.writerow([
-                    f"  {item.name}",
-                    item.value_str,
-                    f"{(item.value / total_assets * 100) if total_assets > 0 else 0:.2f}%"
-                ])
-
-            # Total Assets
-            csv_writer.writerow(
-                ["TOTAL ASSETS", balance_sheet.total_assets.value_str, "100.00%"])
-            csv_writer.writerow(["", "", ""])  # Empty row
-
-            # Write liabilities
-            csv_writer.writerow(["LIABILITIES", "", ""])
-
-            # Current Liabilities
-            csv_writer.writerow(["Current Liabilities", balance_sheet.current_liabilities.total.value_str,
-                                f"{(balance_sheet.current_liabilities.value / total_assets * 100) if total_assets > 0 else 0:.2f}%"])
-
-            for item in balance_sheet.current_liabilities.items:
-                csv_writer.writerow([
-                    f"  {item.name}",
-                    item.value_str,
-                    f"{(item.value / total_assets * 100) if total_assets > 0 else 0:.2f}%"
-                ])
-
-            # Non-Current Liabilities
-            csv_writer.writerow(["Non-Current Liabilities", balance_sheet.non_current_liabilities.total.value_str,
-                                f"{(balance_sheet.non_current_liabilities.value / total_assets * 100) if total_assets > 0 else 0:.2f}%"])
-
-            for item in balance_sheet.non_current_liabilities.items:
-                csv_writer.writerow([
-                    f"  {item.name}",
-                    item.value_str,
-                    f"{(item.value / total_assets * 100) if total_assets > 0 else 0:.2f}%"
-                ])
+            # Write equity
+            csv_writer.writerows(chain(
+                [("SHAREHOLDERS' EQUITY", "", "")],
+                section_rows(equity),
+                [("TOTAL SHAREHOLDERS' EQUITY", equity_total.value_str,
+                  f"{_percent_of_total(equity_total.value, total_assets):.2f}%"),
+                 blank_row,
+                 ("TOTAL LIABILITIES AND EQUITY",
+                  balance_sheet.total_liabilities_and_equity.value_str, "100.00%"),
+                 blank_row]
+            ))
 
-            # Total Liabilities
-            csv_writer.writerow(["TOTAL LIABILITIES", balance_sheet.total_liabilities.value_str,
-                                f"{(balance_sheet.total_liabilities.value / total_assets * 100) if total_assets > 0 else 0:.2f}%"])
-            csv_writer.writerow(["", "", ""])  # Empty row
+            # Financial Health Indicators
+            csv_writer.writerows([
+                ("FINANCIAL HEALTH INDICATORS", "", ""),
+                ("Working Capital", f"{working_capital:,.2f}", ""),
+                ("Current Ratio", balance_sheet.current_ratio.value_str, ""),
+                ("Debt to Equity Ratio", balance_sheet.debt_to_equity.value_str, ""),
+                ("Debt Ratio", balance_sheet.debt_ratio.value_str, ""),
+            ])
 
-            # Write equity
-            csv_writer.writerow(["SHAREHOLDERS' EQUITY", "", ""])
+        result['csv'] = str(csv_path)
 
-            for item in balance_sheet.shareholders_equity.items:
-                csv_writer.writerow([
-                    f"  {item.name}",
-                    item.value_str,
-                    f"{(item.value / total_assets * 100) if total_assets > 0 else 0:.2f}%"
-                ])
+    return result
 
-            # Total Equity
-            csv_writer.writerow(["TOTAL SHAREHOLDERS' EQUITY", balance_sheet.shareholders_equity.total.value_str,
-                                f"{(balance_sheet.shareholders_equity.value / total_assets * 100) if total_assets > 0 else 0:.2f}%"])
-            csv_writer.writerow(["", "", ""])  # Empty row
+# Header line matching csv.writer output for the cash flow CSV header; none
+# of the column names need quoting
+_CASH_FLOW_CSV_HEADER_LINE = ",".join(CashFlow.get_csv_headers()) + "\r\n"
 
-            # Total Liabilities and Equity
-            csv_writer.writerow(["TOTAL LIABILITIES AND EQUITY",
-                                balance_sheet.total_liabilities_and_equity.value_str, "100.00%"])
-            csv_writer.writerow(["", "", ""])  # Empty row
 
-            # Financial Health Indicators
-            csv_writer.writerow(["FINANCIAL HEALTH INDICATORS", "", ""])
-            csv_writer.writerow(
-                ["Working Capital", f"{balance_sheet.current_assets.value - balance_sheet.current_liabilities.value:,.2f}", ""])
-            csv_writer.writerow(
-                ["Current Ratio", balance_sheet.current_ratio.value_str, ""])
-            csv_writer.writerow(
-                ["Debt to Equity Ratio", balance_sheet.debt_to_equity.value_str, ""])
-            csv_writer.writerow(
-                ["Debt Ratio", balance_sheet.debt_ratio.value_str, ""])
+def _write_cash_flow_csv(cash_flow: CashFlow, csv_path: Union[str, Path]) -> str:
+    """Write one cash flow statement to its own CSV file, returning the path."""
+    with _open_csv(csv_path) as f:
+        f.write(_CASH_FLOW_CSV_HEADER_LINE)
+        csv.writer(f).writerows(cash_flow.get_csv_tuples())
 
-        result['csv'] = str(csv_path)
+    return str(csv_path)
 
-    return result
 
 def export_cash_flow(cash_flow: CashFlow, formats: List[str], 
                     output_dir: Path) -> Dict[str, str]:
@@ -1626,22 +2053,13 @@ def export_cash_flow(cash_flow: CashFlow, formats: List[str],
     # Export to JSON
     if 'json' in formats:
         json_path = output_dir / f"{base_filename}.json"
-        with open(json_path, 'w') as f:
-            json.dump(cash_flow.to_dict(), f, indent=2)
+        _dump_json(cash_flow.to_dict(), json_path)
         result['json'] = str(json_path)
     
     # Export to CSV
     if 'csv' in formats:
         csv_path = output_dir / f"{base_filename}.csv"
-        
-        with open(csv_path, 'w', newline='') as f:
-            csv_writer = csv.DictWriter(f, fieldnames=CashFlow.get_csv_headers())
-            csv_writer.writeheader()
-            
-            for row in cash_flow.get_csv_rows():
-                csv_writer.writerow(row)
-                
-        result['csv'] = str(csv_path)
+        result['csv'] = _write_cash_flow_csv(cash_flow, csv_path)
     
     return result
 
@@ -1679,39 +2097,69 @@ def export_cash_flows(cash_flows: List[CashFlow], formats: List[str],
     # Export to JSON
     if 'json' in formats:
         json_path = output_dir / f"{base_filename}.json"
-        with open(json_path, 'w') as f:
-            json.dump({
-                "symbol": symbol,
-                "period": period,
-                "statements": [statement.to_dict() for statement in cash_flows]
-            }, f, indent=2)
+        # Stream the statements so only one chunk of them is serialized at once
+        with open(json_path, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
+            _stream_json_object(
+                f,
+                {"symbol": symbol, "period": period},
+                "statements",
+                (statement.to_dict() for statement in cash_flows),
+                chunk_size=_JSON_STREAM_CHUNK_SIZE
+            )
         result['json'] = str(json_path)
     
     # Export to CSV - each statement in a separate file
     if 'csv' in formats:
         # Create a directory for all CSVs
         csv_dir = output_dir / f"{base_filename}_csv"
-        ensure_directory(csv_dir)
+        csv_dir.mkdir(parents=True, exist_ok=True)
+        csv_prefix = os.path.join(csv_dir, "")
         
-        csv_paths = []
-        for statement in cash_flows:
-            statement_filename = f"{symbol}_{period}_{statement.fiscal_date}.csv"
-            csv_path = csv_dir / statement_filename
-            
-            with open(csv_path, 'w', newline='') as f:
-                csv_writer = csv.DictWriter(f, fieldnames=CashFlow.get_csv_headers())
-                csv_writer.writeheader()
-                
-                for row in statement.get_csv_rows():
-                    csv_writer.writerow(row)
-                    
-            csv_paths.append(str(csv_path))
+        # The statement files are independent, so write them concurrently;
+        # map() keeps the paths in statement order
+        with ThreadPoolExecutor(max_workers=min(_MAX_WRITE_WORKERS, len(cash_flows))) as executor:
+            csv_paths = list(executor.map(
+                lambda statement: _write_cash_flow_csv(
+                    statement, f"{csv_prefix}{symbol}_{period}_{statement.fiscal_date}.csv"),
+                cash_flows))
         
         result['csv'] = csv_paths
     
     return result
 
 
+def _cash_flow_series_stats(values: List[float]) -> Dict[str, Any]:
+    """
+    Summarize a cash flow series for the analysis export.
+
+    Args:
+        values: The series values, oldest first
+
+    Returns:
+        Dict with the average, the overall change (trend) and the growth
+        percentage of the series; trend and growth are None when they
+        cannot be computed
+    """
+    trend = (values[-1] - values[0]) if len(values) >= 2 else None
+    return {
+        "average": sum(values) / len(values) if values else 0,
+        "trend": trend,
+        "growth_pct": (trend / abs(values[0]) * 100) if trend is not None and values[0] != 0 else None,
+    }
+
+
+def _cash_flow_trend_row(label: str, stats: Dict[str, Any]) -> Tuple[str, str, str, str]:
+    """Format one row of the cash flow analysis CSV trend table."""
+    trend = stats["trend"]
+    growth_pct = stats["growth_pct"]
+    return (
+        label,
+        str(stats["average"]),
+        str(trend) if trend is not None else "N/A",
+        str(growth_pct) if growth_pct is not None else "N/A"
+    )
+
+
 def export_cash_flow_analysis(cash_flows: List[CashFlow], formats: List[str],
                              output_dir: Path) -> Dict[str, str]:
     """
@@ -1725,7 +2173,7 @@ def export_cash_flow_analysis(cash_flows: List[CashFlow], formats: List[str],
     Returns:
         Dict mapping format to file path
     """
-    if not cash_flows:
+    if not cash_flows or ('json' not in formats and 'csv' not in formats):
         return {}
         
     result = {}
@@ -1745,26 +2193,29 @@ def export_cash_flow_analysis(cash_flows: List[CashFlow], formats: List[str],
     # Sort statements by date
     sorted_statements = sorted(cash_flows, key=lambda s: s.fiscal_date)
     
-    # Prepare analysis data
-    operating_values = [s.operating_activities.value for s in sorted_statements]
-    investing_values = [s.investing_activities.value for s in sorted_statements]
-    financing_values = [s.financing_activities.value for s in sorted_statements]
-    
-    # Calculate trends
-    operating_trend = (operating_values[-1] - operating_values[0]) if len(operating_values) >= 2 else None  
-    investing_trend = (investing_values[-1] - investing_values[0]) if len(investing_values) >= 2 else None
-    financing_trend = (financing_values[-1] - financing_values[0]) if len(financing_values) >= 2 else None
-    
-    # Calculate averages
-    operating_avg = sum(operating_values) / len(operating_values) if operating_values else 0
-    investing_avg = sum(investing_values) / len(investing_values) if investing_values else 0
-    financing_avg = sum(financing_values) / len(financing_values) if financing_values else 0
-    
-    # Free Cash Flow data if available
-    fcf_values = [s.free_cash_flow.value for s in sorted_statements 
-                 if s.free_cash_flow and s.free_cash_flow.value_str != "N/A"]
-    fcf_trend = (fcf_values[-1] - fcf_values[0]) if len(fcf_values) >= 2 else None
-    fcf_avg = sum(fcf_values) / len(fcf_values) if fcf_values else 0
+    # Prepare analysis data - extract every series in a single pass
+    dates = []
+    operating_values = []
+    investing_values = []
+    financing_values = []
+    fcf_values = []
+    fcf_dates = []
+    for s in sorted_statements:
+        dates.append(s.fiscal_date)
+        operating_values.append(s.operating_activities.value)
+        investing_values.append(s.investing_activities.value)
+        financing_values.append(s.financing_activities.value)
+        if s.free_cash_flow and s.free_cash_flow.value_str != "N/A":
+            fcf_values.append(s.free_cash_flow.value)
+            fcf_dates.append(s.fiscal_date)
+    
+    # Average, overall change and growth of each series, shared by JSON and CSV
+    operating_stats = _cash_flow_series_stats(operating_values)
+    investing_stats = _cash_flow_series_stats(investing_values)
+    financing_stats = _cash_flow_series_stats(financing_values)
+    fcf_stats = _cash_flow_series_stats(fcf_values)
+    
+    currency = sorted_statements[0].currency if sorted_statements else "USD"
     
     # Cash position change
     beginning_cash = sorted_statements[0].beginning_cash.value if sorted_statements else 0
@@ -1772,113 +2223,90 @@ def export_cash_flow_analysis(cash_flows: List[CashFlow], formats: List[str],
     cash_change = ending_cash - beginning_cash
     cash_pct_change = (cash_change / beginning_cash * 100) if beginning_cash != 0 else None
     
-    # Create analysis object
-    analysis = {
-        "symbol": symbol,
-        "period": period,
-        "analysis_range": date_range,
-        "currency": sorted_statements[0].currency if sorted_statements else "USD",
-        "operating_cash_flow": {
-            "values_by_period": dict(zip([s.fiscal_date for s in sorted_statements], operating_values)),
-            "average": operating_avg,
-            "trend": operating_trend,
-            "growth_pct": (operating_trend / abs(operating_values[0]) * 100) if operating_values and operating_values[0] != 0 and operating_trend is not None else None,
-        },
-        "investing_cash_flow": {
-            "values_by_period": dict(zip([s.fiscal_date for s in sorted_statements], investing_values)),
-            "average": investing_avg,
-            "trend": investing_trend,
-            "growth_pct": (investing_trend / abs(investing_values[0]) * 100) if investing_values and investing_values[0] != 0 and investing_trend is not None else None,
-        },
-        "financing_cash_flow": {
-            "values_by_period": dict(zip([s.fiscal_date for s in sorted_statements], financing_values)),
-            "average": financing_avg,
-            "trend": financing_trend,
-            "growth_pct": (financing_trend / abs(financing_values[0]) * 100) if financing_values and financing_values[0] != 0 and financing_trend is not None else None,
-        },
-        "cash_position": {
-            "beginning": beginning_cash,
-            "ending": ending_cash,
-            "net_change": cash_change,
-            "change_pct": cash_pct_change
-        }
-    }
-    
-    # Add free cash flow data if available
-    if fcf_values:
-        analysis["free_cash_flow"] = {
-            "values_by_period": dict(zip([s.fiscal_date for s in sorted_statements if s.free_cash_flow and s.free_cash_flow.value_str != "N/A"], fcf_values)),
-            "average": fcf_avg,
-            "trend": fcf_trend,
-            "growth_pct": (fcf_trend / abs(fcf_values[0]) * 100) if fcf_values and fcf_values[0] != 0 and fcf_trend is not None else None,
-        }
-    
     # Export to JSON
     if 'json' in formats:
+        # The nested analysis object is only needed for the JSON output
+        analysis = {
+            "symbol": symbol,
+            "period": period,
+            "analysis_range": date_range,
+            "currency": currency,
+            "operating_cash_flow": {
+                "values_by_period": dict(zip(dates, operating_values)),
+                **operating_stats
+            },
+            "investing_cash_flow": {
+                "values_by_period": dict(zip(dates, investing_values)),
+                **investing_stats
+            },
+            "financing_cash_flow": {
+                "values_by_period": dict(zip(dates, financing_values)),
+                **financing_stats
+            },
+            "cash_position": {
+                "beginning": beginning_cash,
+                "ending": ending_cash,
+                "net_change": cash_change,
+                "change_pct": cash_pct_change
+            }
+        }
+        
+        # Add free cash flow data if available
+        if fcf_values:
+            analysis["free_cash_flow"] = {
+                "values_by_period": dict(zip(fcf_dates, fcf_values)),
+                **fcf_stats
+            }
+        
         json_path = output_dir / f"{base_filename}.json"
-        with open(json_path, 'w') as f:
-            json.dump(analysis, f, indent=2)
+        _dump_json(analysis, json_path)
         result['json'] = str(json_path)
     
     # Export to CSV
     if 'csv' in formats:
         csv_path = output_dir / f"{base_filename}.csv"
         
-        with open(csv_path, 'w', newline='') as f:
-            csv_writer = csv.writer(f)
-            
-            # Write header information
-            csv_writer.writerow(["Cash Flow Analysis", symbol])
-            csv_writer.writerow(["Period", period])
-            csv_writer.writerow(["Date Range", date_range])
-            csv_writer.writerow(["Currency", sorted_statements[0].currency if sorted_statements else "USD"])
-            csv_writer.writerow([])  # Empty row
-            
-            # Write column headers for time series data
-            date_headers = ["Cash Flow Category", "Metric"] + [s.fiscal_date for s in sorted_statements]
-            csv_writer.writerow(date_headers)
-            
-            # Write operating cash flow data
-            csv_writer.writerow(["Operating Cash Flow", "Value"] + operating_values)
-            
-            # Write investing cash flow data
-            csv_writer.writerow(["Investing Cash Flow", "Value"] + investing_values)
-            
-            # Write financing cash flow data
-            csv_writer.writerow(["Financing Cash Flow", "Value"] + financing_values)
-            
-            # Write free cash flow data if available
-            if fcf_values and len(fcf_values) == len(sorted_statements):
-                csv_writer.writerow(["Free Cash Flow", "Value"] + fcf_values)
-            
-            # Write cash position data
-            csv_writer.writerow([])  # Empty row
-            csv_writer.writerow(["Cash Position", "Beginning", str(beginning_cash)])
-            csv_writer.writerow(["", "Ending", str(ending_cash)])
-            csv_writer.writerow(["", "Net Change", str(cash_change)])
-            csv_writer.writerow(["", "Change %", str(cash_pct_change) if cash_pct_change is not None else "N/A"])
-            
-            # Write trend analysis
-            csv_writer.writerow([])  # Empty row
-            csv_writer.writerow(["Trend Analysis", "Average", "Change", "Growth %"])
-            
-            # Operating
-            operating_growth_pct = (operating_trend / abs(operating_values[0]) * 100) if operating_values and operating_values[0] != 0 and operating_trend is not None else "N/A"
-            csv_writer.writerow(["Operating Cash Flow", str(operating_avg), str(operating_trend) if operating_trend is not None else "N/A", str(operating_growth_pct)])
-            
-            # Investing
-            investing_growth_pct = (investing_trend / abs(investing_values[0]) * 100) if investing_values and investing_values[0] != 0 and investing_trend is not None else "N/A"
-            csv_writer.writerow(["Investing Cash Flow", str(investing_avg), str(investing_trend) if investing_trend is not None else "N/A", str(investing_growth_pct)])
-            
-            # Financing
-            financing_growth_pct = (financing_trend / abs(financing_values[0]) * 100) if financing_values and financing_values[0] != 0 and financing_trend is not None else "N/A"
-            csv_writer.writerow(["Financing Cash Flow", str(financing_avg), str(financing_trend) if financing_trend is not None else "N/A", str(financing_growth_pct)])
-            
-            # Free Cash Flow
-            if fcf_values:
-                fcf_growth_pct = (fcf_trend / abs(fcf_values[0]) * 100) if fcf_values and fcf_values[0] != 0 and fcf_trend is not None else "N/A"
-                csv_writer.writerow(["Free Cash Flow", str(fcf_avg), str(fcf_trend) if fcf_trend is not None else "N/A", str(fcf_growth_pct)])
-                
+        # Format the trend analysis rows from the precomputed statistics
+        trend_rows = [
+            _cash_flow_trend_row("Operating Cash Flow", operating_stats),
+            _cash_flow_trend_row("Investing Cash Flow", investing_stats),
+            _cash_flow_trend_row("Financing Cash Flow", financing_stats),
+        ]
+        if fcf_values:
+            trend_rows.append(_cash_flow_trend_row("Free Cash Flow", fcf_stats))
+        
+        # Header information and the time series, one row per category
+        rows = [
+            ("Cash Flow Analysis", symbol),
+            ("Period", period),
+            ("Date Range", date_range),
+            ("Currency", currency),
+            (),  # Empty row
+            ["Cash Flow Category", "Metric", *dates],
+            ["Operating Cash Flow", "Value", *operating_values],
+            ["Investing Cash Flow", "Value", *investing_values],
+            ["Financing Cash Flow", "Value", *financing_values],
+        ]
+        
+        # Free cash flow only lines up with the date columns if every period has it
+        if fcf_values and len(fcf_values) == len(sorted_statements):
+            rows.append(["Free Cash Flow", "Value", *fcf_values])
+        
+        # Cash position and trend analysis
+        rows.extend([
+            (),  # Empty row
+            ("Cash Position", "Beginning", str(beginning_cash)),
+            ("", "Ending", str(ending_cash)),
+            ("", "Net Change", str(cash_change)),
+            ("", "Change %", str(cash_pct_change) if cash_pct_change is not None else "N/A"),
+            (),  # Empty row
+            ("Trend Analysis", "Average", "Change", "Growth %"),
+        ])
+        rows.extend(trend_rows)
+        
+        with _open_csv(csv_path) as f:
+            csv.writer(f).writerows(rows)
+        
         result['csv'] = str(csv_path)
     
     return result
@@ -1910,20 +2338,18 @@ def export_executives(management_team: ManagementTeam, formats: List[str],
     # Export to JSON
     if 'json' in formats:
         json_path = output_dir / f"{base_filename}.json"
-        with open(json_path, 'w') as f:
-            json.dump(management_team.to_dict(), f, indent=2)
+        _dump_json(management_team.to_dict(), json_path)
         result['json'] = str(json_path)
     
     # Export to CSV
     if 'csv' in formats:
         csv_path = output_dir / f"{base_filename}.csv"
         
-        with open(csv_path, 'w', newline='') as f:
-            csv_writer = csv.DictWriter(f, fieldnames=ManagementTeam.get_csv_headers())
-            csv_writer.writeheader()
-            
-            for row in management_team.get_csv_rows():
-                csv_writer.writerow(row)
+        with _open_csv(csv_path) as f:
+            header = ManagementTeam.get_csv_headers()
+            csv_writer = csv.writer(f)
+            csv_writer.writerow(header)
+            csv_writer.writerows(management_team.get_csv_tuples())
                 
         result['csv'] = str(csv_path)
     
@@ -1971,24 +2397,22 @@ def export_executive_profile(executive: Executive, company_name: str, symbol: st
         }
         
         json_path = output_dir / f"{base_filename}.json"
-        with open(json_path, 'w') as f:
-            json.dump(profile, f, indent=2)
+        _dump_json(profile, json_path)
         result['json'] = str(json_path)
     
     # Export to CSV
     if 'csv' in formats:
         csv_path = output_dir / f"{base_filename}.csv"
         
-        with open(csv_path, 'w', newline='') as f:
+        with _open_csv(csv_path) as f:
             # Get CSV row from executive but add company info
             row = executive.to_csv_row()
             row["Symbol"] = symbol
             row["Company"] = company_name
             
-            # Write as CSV
-            csv_writer = csv.DictWriter(f, fieldnames=list(row.keys()))
-            csv_writer.writeheader()
-            csv_writer.writerow(row)
+            # Write as CSV - the row's own key order is the header
+            csv_writer = csv.writer(f)
+            csv_writer.writerows((row.keys(), row.values()))
                 
         result['csv'] = str(csv_path)
     
@@ -2008,6 +2432,9 @@ def export_compensation_analysis(management_team: ManagementTeam, formats: List[
     Returns:
         Dict mapping format to file path
     """
+    if 'json' not in formats and 'csv' not in formats:
+        return {}
+    
     result = {}
     symbol = management_team.symbol.upper()
     
@@ -2019,59 +2446,70 @@ def export_compensation_analysis(management_team: ManagementTeam, formats: List[
     
     ensure_directory(output_dir)
     
-    # Filter executives with compensation data
-    execs_with_pay = [exec for exec in management_team.executives if exec.pay is not None]
+    # Filter executives with compensation data, collecting their pay and
+    # the running total in the same pass
+    execs_with_pay = []
+    pays = []
+    total_comp = 0.0
+    for exec in management_team.executives:
+        pay = exec.pay
+        if pay is not None:
+            execs_with_pay.append(exec)
+            pays.append(pay)
+            total_comp += pay
     
     if not execs_with_pay:
         return {}  # No compensation data available
     
     # Calculate statistics (assuming all in same currency)
-    total_comp = sum(exec.pay for exec in execs_with_pay)
-    avg_comp = total_comp / len(execs_with_pay) if execs_with_pay else 0
-    median_pay = sorted([exec.pay for exec in execs_with_pay])[len(execs_with_pay)//2] if len(execs_with_pay) > 0 else 0
+    avg_comp = total_comp / len(pays)
+    # median_high keeps the upper middle value for an even count
+    median_pay = statistics.median_high(pays) if pays else 0
+    
+    # Rank executives by pay once for both the JSON and CSV outputs
+    ranked_execs = sorted(execs_with_pay, key=lambda e: e.pay or 0, reverse=True)
     
     # Get CEO pay if available
     ceo = management_team.get_ceo()
     ceo_pay = ceo.pay if ceo else None
     
-    # Create analysis dictionary
-    analysis = {
-        "company": {
-            "symbol": symbol,
-            "name": management_team.name
-        },
-        "executives_with_compensation": len(execs_with_pay),
-        "compensation_data": {
-            "currency": execs_with_pay[0].currency if execs_with_pay else "N/A",
-            "total": total_comp,
-            "average": avg_comp,
-            "median": median_pay,
-            "ceo": ceo_pay,
-            "ceo_to_average_ratio": (ceo_pay / avg_comp) if (ceo_pay and avg_comp > 0) else None,
-        },
-        "executives": [
-            {
-                "name": exec.name,
-                "title": exec.title,
-                "compensation": exec.pay,
-                "year": exec.year
-            }
-            for exec in sorted(execs_with_pay, key=lambda e: e.pay or 0, reverse=True)
-        ]
-    }
-    
     # Export to JSON
     if 'json' in formats:
+        # The analysis dictionary is only needed for the JSON output
+        analysis = {
+            "company": {
+                "symbol": symbol,
+                "name": management_team.name
+            },
+            "executives_with_compensation": len(execs_with_pay),
+            "compensation_data": {
+                "currency": execs_with_pay[0].currency if execs_with_pay else "N/A",
+                "total": total_comp,
+                "average": avg_comp,
+                "median": median_pay,
+                "ceo": ceo_pay,
+                "ceo_to_average_ratio": (ceo_pay / avg_comp) if (ceo_pay and avg_comp > 0) else None,
+            },
+            "executives": [
+                {
+                    "name": exec.name,
+                    "title": exec.title,
+                    "compensation": exec.pay,
+                    "year": exec.year
+                }
+                for exec in ranked_execs
+            ]
+        }
+        
         json_path = output_dir / f"{base_filename}.json"
-        with open(json_path, 'w') as f:
-            json.dump(analysis, f, indent=2)
+        _dump_json(analysis, json_path)
         result['json'] = str(json_path)
     
     # Export to CSV
     if 'csv' in formats:
         csv_path = output_dir / f"{base_filename}.csv"
         
-        with open(csv_path, 'w', newline='') as f:
+        with _open_csv(csv_path) as f:
             csv_writer = csv.writer(f)
             
             # Write header and company info
@@ -2098,19 +2536,69 @@ def export_compensation_analysis(management_team: ManagementTeam, formats: List[
             csv_writer.writerow(["Executive Compensation Ranking"])
             csv_writer.writerow(["Rank", "Name", "Title", "Compensation", "Year"])
             
-            for i, exec in enumerate(sorted(execs_with_pay, key=lambda e: e.pay or 0, reverse=True), 1):
-                csv_writer.writerow([
-                    i, 
-                    exec.name, 
-                    exec.title, 
-                    f"{exec.pay:,.2f}" if exec.pay else "N/A",
-                    exec.year or "N/A"
-                ])
+            csv_writer.writerows(
+                (i, exec.name, exec.title,
+                 f"{exec.pay:,.2f}" if exec.pay else "N/A",
+                 exec.year or "N/A")
+                for i, exec in enumerate(ranked_execs, 1)
+            )
                 
         result['csv'] = str(csv_path)
     
     return result
 
+
+def _write_market_cap_history_csv(market_cap_history: MarketCapHistory, csv_path: Union[str, Path]) -> str:
+    """Write one market cap history to a CSV file, returning its path."""
+    with _open_csv(csv_path) as f:
+        header = MarketCapHistory.get_csv_headers()
+        csv_writer = csv.writer(f)
+        csv_writer.writerow(header)
+        csv_writer.writerows(market_cap_history.get_csv_tuples())
+
+    return str(csv_path)
+
+
+def _write_market_cap_summary_csv(symbol: str, end_date: str, daily_history: MarketCapHistory,
+                                  monthly_history: MarketCapHistory, csv_path: Union[str, Path]) -> str:
+    """Write the short- vs long-term market cap comparison CSV, returning its path."""
+    with _open_csv(csv_path) as f:
+        csv_writer = csv.writer(f)
+        
+        # Write header and basic info
+        csv_writer.writerow(["Symbol", symbol])
+        csv_writer.writerow(["Date", end_date])
+        csv_writer.writerow(["Current Market Cap", daily_history.summary.end_cap_formatted if daily_history.summary else "N/A"])
+        csv_writer.writerow([])  # Empty row
+        
+        # Write comparison table
+        csv_writer.writerow(["Period", "Start", "End", "Change", "% Change", "Min", "Max"])
+        
+        if daily_history.summary:
+            csv_writer.writerow([
+                f"Short-term ({daily_history.interval})",
+                daily_history.summary.start_cap_formatted,
+                daily_history.summary.end_cap_formatted,
+                daily_history.summary.change_value_formatted,
+                daily_history.summary.change_percent_formatted,
+                daily_history.summary.min_cap_formatted,
+                daily_history.summary.max_cap_formatted
+            ])
+            
+        if monthly_history.summary:
+            csv_writer.writerow([
+                f"Long-term ({monthly_history.interval})",
+                monthly_history.summary.start_cap_formatted,
+                monthly_history.summary.end_cap_formatted,
+                monthly_history.summary.change_value_formatted,
+                monthly_history.summary.change_percent_formatted,
+                monthly_history.summary.min_cap_formatted,
+                monthly_history.summary.max_cap_formatted
+            ])
+
+    return str(csv_path)
+
+
 def export_market_cap(market_cap_history: MarketCapHistory, formats: List[str], 
                      output_dir: Path) -> Dict[str, str]:
     """
@@ -2143,22 +2631,13 @@ def export_market_cap(market_cap_history: MarketCapHistory, formats: List[str],
     # Export to JSON
     if 'json' in formats:
         json_path = output_dir / f"{base_filename}.json"
-        with open(json_path, 'w') as f:
-            json.dump(market_cap_history.to_dict(), f, indent=2)
+        _dump_json(market_cap_history.to_dict(), json_path)
         result['json'] = str(json_path)
     
     # Export to CSV
     if 'csv' in formats:
         csv_path = output_dir / f"{base_filename}.csv"
-        
-        with open(csv_path, 'w', newline='') as f:
-            csv_writer = csv.DictWriter(f, fieldnames=MarketCapHistory.get_csv_headers())
-            csv_writer.writeheader()
-            
-            for row in market_cap_history.get_csv_rows():
-                csv_writer.writerow(row)
-                
-        result['csv'] = str(csv_path)
+        result['csv'] = _write_market_cap_history_csv(market_cap_history, csv_path)
     
     return result
 
@@ -2214,72 +2693,55 @@ def export_market_cap_comparison(symbol: str, daily_history: MarketCapHistory,
         }
         
         json_path = output_dir / f"{base_filename}.json"
-        with open(json_path, 'w') as f:
-            json.dump(comparison, f, indent=2)
+        _dump_json(comparison, json_path)
         result['json'] = str(json_path)
     
     # Export to CSV - separate files for daily and monthly
     if 'csv' in formats:
         # Create a directory for all CSVs
         csv_dir = output_dir / f"{base_filename}_csv"
-        ensure_directory(csv_dir)
-        
-        # Export daily history
-        daily_csv_path = csv_dir / f"{symbol}_market_cap_daily.csv"
-        with open(daily_csv_path, 'w', newline='') as f:
-            csv_writer = csv.DictWriter(f, fieldnames=MarketCapHistory.get_csv_headers())
-            csv_writer.writeheader()
-            for row in daily_history.get_csv_rows():
-                csv_writer.writerow(row)
-                
-        # Export monthly history
-        monthly_csv_path = csv_dir / f"{symbol}_market_cap_monthly.csv"
-        with open(monthly_csv_path, 'w', newline='') as f:
-            csv_writer = csv.DictWriter(f, fieldnames=MarketCapHistory.get_csv_headers())
-            csv_writer.writeheader()
-            for row in monthly_history.get_csv_rows():
-                csv_writer.writerow(row)
-        
-        # Export comparison summary
-        summary_csv_path = csv_dir / f"{symbol}_market_cap_comparison.csv"
-        with open(summary_csv_path, 'w', newline='') as f:
-            csv_writer = csv.writer(f)
-            
-            # Write header and basic info
-            csv_writer.writerow(["Symbol", symbol])
-            csv_writer.writerow(["Date", end_date])
-            csv_writer.writerow(["Current Market Cap", daily_history.summary.end_cap_formatted if daily_history.summary else "N/A"])
-            csv_writer.writerow([])  # Empty row
-            
-            # Write comparison table
-            csv_writer.writerow(["Period", "Start", "End", "Change", "% Change", "Min", "Max"])
-            
-            if daily_history.summary:
-                csv_writer.writerow([
-                    f"Short-term ({daily_history.interval})",
-                    daily_history.summary.start_cap_formatted,
-                    daily_history.summary.end_cap_formatted,
-                    daily_history.summary.change_value_formatted,
-                    daily_history.summary.change_percent_formatted,
-                    daily_history.summary.min_cap_formatted,
-                    daily_history.summary.max_cap_formatted
-                ])
-                
-            if monthly_history.summary:
-                csv_writer.writerow([
-                    f"Long-term ({monthly_history.interval})",
-                    monthly_history.summary.start_cap_formatted,
-                    monthly_history.summary.end_cap_formatted,
-                    monthly_history.summary.change_value_formatted,
-                    monthly_history.summary.change_percent_formatted,
-                    monthly_history.summary.min_cap_formatted,
-                    monthly_history.summary.max_cap_formatted
-                ])
-                
-        result['csv'] = [str(daily_csv_path), str(monthly_csv_path), str(summary_csv_path)]
+        csv_dir.mkdir(parents=True, exist_ok=True)
+        csv_prefix = os.path.join(csv_dir, "")
+        
+        # The daily and monthly history files are independent, so write
+        # them on worker threads while the summary is written here
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            daily_future = executor.submit(
+                _write_market_cap_history_csv, daily_history,
+                f"{csv_prefix}{symbol}_market_cap_daily.csv")
+            monthly_future = executor.submit(
+                _write_market_cap_history_csv, monthly_history,
+                f"{csv_prefix}{symbol}_market_cap_monthly.csv")
+            
+            summary_csv_path = _write_market_cap_summary_csv(
+                symbol, end_date, daily_history, monthly_history,
+                f"{csv_prefix}{symbol}_market_cap_comparison.csv")
+            
+            result['csv'] = [daily_future.result(), monthly_future.result(), summary_csv_path]
     
     return result
 
+
+def _write_small_csv(path: Union[str, Path], rows: Iterable[Sequence[Any]]) -> None:
+    """
+    Write a CSV file of a few rows with a single write call.
+
+    The rows are rendered in memory first, so no large file buffer is
+    allocated and nothing is written if formatting a row fails. The file
+    is opened like _open_csv, so both use the same text encoding.
+    """
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    with open(path, 'w', newline='') as f:
+        f.write(buffer.getvalue())
+
+
+# Header of the analyst price target CSV
+_PRICE_TARGET_CSV_HEADER = (
+    "Target Type", "Mean Target", "Median Target", "High Target", "Low Target", "Analyst Count", "Currency"
+)
+
+
 def export_analyst_estimates(estimates: AnalystEstimates, formats: List[str], 
                             output_dir: Path) -> Dict[str, str]:
     """
@@ -2308,78 +2770,65 @@ def export_analyst_estimates(estimates: AnalystEstimates, formats: List[str],
     # Export to JSON
     if 'json' in formats:
         json_path = output_dir / f"{base_filename}.json"
-        with open(json_path, 'w') as f:
-            json.dump(estimates.to_dict(), f, indent=2)
+        _dump_json(estimates.to_dict(), json_path)
         result['json'] = str(json_path)
     
     # Export to CSV - multiple files for different sections
     if 'csv' in formats:
         # Create a directory for all CSVs
         csv_dir = output_dir / f"{base_filename}_csv"
-        ensure_directory(csv_dir)
+        csv_dir.mkdir(parents=True, exist_ok=True)
+        csv_prefix = os.path.join(csv_dir, "")
         
         csv_paths = []
         
         # EPS estimates CSV
         if estimates.quarterly_eps_estimates or estimates.annual_eps_estimates:
-            eps_csv_path = csv_dir / f"{symbol}_eps_estimates.csv"
+            eps_csv_path = f"{csv_prefix}{symbol}_eps_estimates.csv"
             
-            with open(eps_csv_path, 'w', newline='') as f:
-                csv_writer = csv.DictWriter(f, fieldnames=AnalystEstimates.get_csv_headers_eps())
-                csv_writer.writeheader()
-                
-                for row in estimates.get_csv_rows_eps_estimates():
-                    csv_writer.writerow(row)
+            with _open_csv(eps_csv_path) as f:
+                csv_writer = csv.writer(f)
+                csv_writer.writerow(AnalystEstimates.get_csv_headers_eps())
+                csv_writer.writerows(estimates.get_csv_row_tuples_eps_estimates())
                     
             csv_paths.append(str(eps_csv_path))
             
         # Revenue estimates CSV
         if estimates.quarterly_revenue_estimates or estimates.annual_revenue_estimates:
-            revenue_csv_path = csv_dir / f"{symbol}_revenue_estimates.csv"
+            revenue_csv_path = f"{csv_prefix}{symbol}_revenue_estimates.csv"
             
-            with open(revenue_csv_path, 'w', newline='') as f:
-                csv_writer = csv.DictWriter(f, fieldnames=AnalystEstimates.get_csv_headers_revenue())
-                csv_writer.writeheader()
-                
-                for row in estimates.get_csv_rows_revenue_estimates():
-                    csv_writer.writerow(row)
+            with _open_csv(revenue_csv_path) as f:
+                csv_writer = csv.writer(f)
+                csv_writer.writerow(AnalystEstimates.get_csv_headers_revenue())
+                csv_writer.writerows(estimates.get_csv_row_tuples_revenue_estimates())
                     
             csv_paths.append(str(revenue_csv_path))
             
         # Recommendations CSV
         if estimates.recommendation_trends:
-            rec_csv_path = csv_dir / f"{symbol}_recommendations.csv"
+            rec_csv_path = f"{csv_prefix}{symbol}_recommendations.csv"
             
-            with open(rec_csv_path, 'w', newline='') as f:
-                csv_writer = csv.DictWriter(f, fieldnames=AnalystEstimates.get_csv_headers_recommendations())
-                csv_writer.writeheader()
-                
-                for trend in estimates.recommendation_trends:
-                    csv_writer.writerow(trend.to_csv_row())
+            header = AnalystEstimates.get_csv_headers_recommendations()
+            _write_small_csv(rec_csv_path, chain(
+                [header], (trend.to_csv_tuple() for trend in estimates.recommendation_trends)))
                     
             csv_paths.append(str(rec_csv_path))
             
         # Price target CSV
         if estimates.price_target:
-            price_csv_path = csv_dir / f"{symbol}_price_target.csv"
-            
-            with open(price_csv_path, 'w', newline='') as f:
-                csv_writer = csv.writer(f)
-                
-                # Write header
-                csv_writer.writerow(["Target Type", "Mean Target", "Median Target", "High Target", "Low Target", "Analyst Count", "Currency"])
-                
-                # Write data
-                target = estimates.price_target
-                csv_writer.writerow([
-                    target.target_type.title(),
-                    f"${target.mean_target:.2f}",
-                    f"${target.median_target:.2f}" if target.median_target is not None else "N/A",
-                    f"${target.high_target:.2f}" if target.high_target is not None else "N/A",
-                    f"${target.low_target:.2f}" if target.low_target is not None else "N/A",
-                    str(target.analyst_count),
-                    target.currency
-                ])
+            price_csv_path = f"{csv_prefix}{symbol}_price_target.csv"
+            
+            target = estimates.price_target
+            row = (
+                target.target_type.title(),
+                f"${target.mean_target:.2f}",
+                f"${target.median_target:.2f}" if target.median_target is not None else "N/A",
+                f"${target.high_target:.2f}" if target.high_target is not None else "N/A",
+                f"${target.low_target:.2f}" if target.low_target is not None else "N/A",
+                str(target.analyst_count),
+                target.currency or ""
+            )
+            _write_small_csv(price_csv_path, [_PRICE_TARGET_CSV_HEADER, row])
                     
             csv_paths.append(str(price_csv_path))
                 
@@ -2388,6 +2837,95 @@ def export_analyst_estimates(estimates: AnalystEstimates, formats: List[str],
     return result
 
 
+# Accessors for the estimate list compared for each (kind, period type)
+_ESTIMATE_LIST_GETTERS = {
+    ('eps', 'quarterly'): attrgetter('quarterly_eps_estimates'),
+    ('eps', 'annual'): attrgetter('annual_eps_estimates'),
+    ('revenue', 'quarterly'): attrgetter('quarterly_revenue_estimates'),
+    ('revenue', 'annual'): attrgetter('annual_revenue_estimates'),
+}
+
+# Sort key ordering estimates by their period label
+_PERIOD_KEY = attrgetter('period')
+
+
+def _estimate_comparison_entry(symbol: str, estimate_list: List[Any]) -> Dict[str, Any]:
+    """Build the per-symbol entry of an EPS or revenue comparison export."""
+    return {
+        "symbol": symbol,
+        "estimates": [
+            {
+                "period": est.period,
+                "period_end_date": est.period_end_date,
+                "estimate_value": est.estimate_value,
+                "actual_value": est.actual_value,
+                "surprise_value": est.surprise_value,
+                "surprise_percent": est.surprise_percent
+            }
+            for est in estimate_list
+        ]
+    }
+
+
+@dataclass(frozen=True)
+class _EpsGrowthRate:
+    """
+    Year-over-year EPS growth between a symbol's first two annual estimates.
+
+    Exactly one of growth_percent and growth_status is set when the symbol
+    has two estimates; neither is set when it has fewer.
+    """
+    symbol: str
+    current_period: Optional[str] = None
+    next_period: Optional[str] = None
+    current_estimate: Optional[float] = None
+    next_estimate: Optional[float] = None
+    growth_percent: Optional[float] = None
+    growth_status: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the dict written to the JSON export."""
+        if self.growth_percent is None and self.growth_status is None:
+            return {"symbol": self.symbol, "status": "insufficient_data"}
+
+        data = {
+            "symbol": self.symbol,
+            "current_period": self.current_period,
+            "next_period": self.next_period,
+            "current_estimate": self.current_estimate,
+            "next_estimate": self.next_estimate
+        }
+        if self.growth_percent is not None:
+            data["growth_percent"] = self.growth_percent
+        else:
+            data["growth_status"] = self.growth_status
+        return data
+
+    def to_csv_row(self) -> List[str]:
+        """Convert to a row of the comparison CSV growth section."""
+        if self.growth_percent is None and self.growth_status is None:
+            return [self.symbol, "Insufficient data", "", "", "", ""]
+
+        return [
+            self.symbol,
+            self.current_period,
+            self.next_period,
+            f"{self.current_estimate:.2f}",
+            f"{self.next_estimate:.2f}",
+            f"{self.growth_percent:.2f}%" if self.growth_percent is not None else self.growth_status
+        ]
+
+
+def _eps_comparison_cells(estimate: Any) -> Tuple[str, str]:
+    """Format the estimated and actual EPS cells of a comparison CSV row."""
+    if not estimate:
+        return ("N/A", "N/A")
+    return (
+        f"{estimate.estimate_value:.2f}",
+        "N/A" if estimate.actual_value is None else f"{estimate.actual_value:.2f}"
+    )
+
+
 def export_eps_comparison(symbols: List[str], estimates_list: List[AnalystEstimates], 
                          period_type: str, formats: List[str], output_dir: Path) -> Dict[str, str]:
     """
@@ -2403,6 +2941,10 @@ def export_eps_comparison(symbols: List[str], estimates_list: List[AnalystEstima
     Returns:
         Dict mapping format to file path
     """
+    # Periods and growth rates only feed the JSON and CSV output
+    if 'json' not in formats and 'csv' not in formats:
+        return {}
+        
     result = {}
     
     # Generate base filename
@@ -2414,174 +2956,180 @@ def export_eps_comparison(symbols: List[str], estimates_list: List[AnalystEstima
     
     ensure_directory(output_dir)
     
-    # Prepare comparison data
-    comparison_data = {
-        "symbols": symbols,
-        "period_type": period_type,
-        "comparisons": []
-    }
+    # Choose the correct set of estimates once per symbol
+    period_key = period_type.lower()
+    get_estimates = _ESTIMATE_LIST_GETTERS[('eps', 'quarterly' if period_key == 'quarterly' else 'annual')]
+    per_symbol_estimates = [get_estimates(estimates) for estimates in estimates_list]
     
+    # Collect every period covered by any symbol and, for annual estimates,
+    # calculate each symbol's growth rate in the same pass
     all_periods = set()
+    growth_rates = [] if period_key == 'annual' else None
     
-    # Extract all the estimates
-    for estimates in estimates_list:
-        estimates_data = {
-            "symbol": estimates.symbol,
-            "estimates": []
-        }
+    for estimates, estimate_list in zip(estimates_list, per_symbol_estimates):
+        all_periods.update(est.period for est in estimate_list)
         
-        # Choose the correct set of estimates
-        if period_type.lower() == 'quarterly':
-            estimate_list = estimates.quarterly_eps_estimates
-        else:
-            estimate_list = estimates.annual_eps_estimates
-            
-        # Process each estimate
-        for est in estimate_list:
-            all_periods.add(est.period)
-            
-            estimates_data["estimates"].append({
-                "period": est.period,
-                "period_end_date": est.period_end_date,
-                "estimate_value": est.estimate_value,
-                "actual_value": est.actual_value,
-                "surprise_value": est.surprise_value,
-                "surprise_percent": est.surprise_percent
-            })
-            
-        comparison_data["comparisons"].append(estimates_data)
-            
-    # Add periods to the comparison data
-    comparison_data["all_periods"] = sorted(list(all_periods))
-    
-    # Calculate growth rates if we have annual estimates
-    if period_type.lower() == 'annual':
-        growth_rates = []
+        if growth_rates is None:
+            continue
+        
+        # Sort by period to ensure correct order
+        sorted_ests = sorted(estimate_list, key=_PERIOD_KEY)
         
-        for estimates in estimates_list:
-            if period_type.lower() == 'annual':
-                estimate_list = estimates.annual_eps_estimates
+        if len(sorted_ests) >= 2:
+            # Calculate YoY growth from current to next year's estimate
+            current_est = sorted_ests[0].estimate_value
+            next_est = sorted_ests[1].estimate_value
+            
+            if current_est > 0:
+                growth = ((next_est - current_est) / current_est) * 100
+                growth_rates.append(_EpsGrowthRate(
+                    estimates.symbol, sorted_ests[0].period, sorted_ests[1].period,
+                    current_est, next_est, growth_percent=growth
+                ))
             else:
-                estimate_list = estimates.quarterly_eps_estimates
-                
-            # Sort by period to ensure correct order
-            sorted_ests = sorted(estimate_list, key=lambda e: e.period)
-            
-            if len(sorted_ests) >= 2:
-                # Calculate YoY growth from current to next year's estimate
-                current_est = sorted_ests[0].estimate_value
-                next_est = sorted_ests[1].estimate_value
-                
-                if current_est > 0:
-                    growth = ((next_est - current_est) / current_est) * 100
-                    growth_rates.append({
-                        "symbol": estimates.symbol,
-                        "current_period": sorted_ests[0].period,
-                        "next_period": sorted_ests[1].period,
-                        "current_estimate": current_est,
-                        "next_estimate": next_est,
-                        "growth_percent": growth
-                    })
+                # Handle division by zero or negative EPS
+                if current_est < 0 and next_est > 0:
+                    status = "positive_turnaround"
+                elif current_est <= 0 and next_est <= 0 and next_est > current_est:
+                    status = "improving_negative_eps"
                 else:
-                    # Handle division by zero or negative EPS
-                    if current_est < 0 and next_est > 0:
-                        status = "positive_turnaround"
-                    elif current_est <= 0 and next_est <= 0 and next_est > current_est:
-                        status = "improving_negative_eps"
-                    else:
-                        status = "declining_negative_eps"
-                        
-                    growth_rates.append({
-                        "symbol": estimates.symbol,
-                        "current_period": sorted_ests[0].period,
-                        "next_period": sorted_ests[1].period,
-                        "current_estimate": current_est,
-                        "next_estimate": next_est,
-                        "growth_status": status
-                    })
-            else:
-                growth_rates.append({
-                    "symbol": estimates.symbol,
-                    "status": "insufficient_data"
-                })
-                
-        # Add growth rates to the comparison data
-        comparison_data["growth_rates"] = growth_rates
+                    status = "declining_negative_eps"
+                    
+                growth_rates.append(_EpsGrowthRate(
+                    estimates.symbol, sorted_ests[0].period, sorted_ests[1].period,
+                    current_est, next_est, growth_status=status
+                ))
+        else:
+            growth_rates.append(_EpsGrowthRate(estimates.symbol))
+    
+    sorted_periods = sorted(all_periods)
     
     # Export to JSON
     if 'json' in formats:
         json_path = output_dir / f"{base_filename}.json"
-        with open(json_path, 'w') as f:
-            json.dump(comparison_data, f, indent=2)
+        
+        # Members written after the per-symbol comparisons
+        trailing_fields = {"all_periods": sorted_periods}
+        if growth_rates is not None:
+            trailing_fields["growth_rates"] = [growth.to_dict() for growth in growth_rates]
+        
+        # Stream the per-symbol comparisons so only a chunk of them is built at once
+        with open(json_path, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
+            _stream_json_object(
+                f,
+                {"symbols": symbols, "period_type": period_type},
+                "comparisons",
+                (
+                    _estimate_comparison_entry(estimates.symbol, estimate_list)
+                    for estimates, estimate_list in zip(estimates_list, per_symbol_estimates)
+                ),
+                chunk_size=_JSON_STREAM_CHUNK_SIZE,
+                trailing_fields=trailing_fields
+            )
         result['json'] = str(json_path)
     
     # Export to CSV
     if 'csv' in formats:
         csv_path = output_dir / f"{base_filename}.csv"
         
-        with open(csv_path, 'w', newline='') as f:
+        with _open_csv(csv_path) as f:
             # Create dynamic headers with symbol names
-            headers = ['Period']
-            for symbol in symbols:
-                headers.append(f"{symbol.upper()} Est. EPS")
-                headers.append(f"{symbol.upper()} Act. EPS")
+            headers = ['Period', *chain.from_iterable(
+                (f"{upper_symbol} Est. EPS", f"{upper_symbol} Act. EPS")
+                for upper_symbol in (symbol.upper() for symbol in symbols)
+            )]
             
             csv_writer = csv.writer(f)
             csv_writer.writerow(headers)
             
+            # Index each symbol's estimates by period, keeping the first match
+            period_lookups = [
+                {est.period: est for est in reversed(estimate_list)}
+                for estimate_list in per_symbol_estimates
+            ]
+            
             # Write rows for each period
-            for period in sorted(all_periods):
-                row = [period]
-                
-                for estimates in estimates_list:
-                    if period_type.lower() == 'quarterly':
-                        estimate_list = estimates.quarterly_eps_estimates
-                    else:
-                        estimate_list = estimates.annual_eps_estimates
-                        
-                    # Find the estimate for this period
-                    estimate = next((est for est in estimate_list if est.period == period), None)
-                    
-                    if estimate:
-                        row.append(f"{estimate.estimate_value:.2f}")
-                        row.append(f"{estimate.actual_value:.2f}" if estimate.actual_value is not None else "N/A")
-                    else:
-                        row.append("N/A")
-                        row.append("N/A")
-                
-                csv_writer.writerow(row)
+            csv_writer.writerows(
+                [period, *chain.from_iterable(
+                    _eps_comparison_cells(lookup.get(period)) for lookup in period_lookups
+                )]
+                for period in sorted_periods
+            )
                 
             # Add growth rates if available
-            if period_type.lower() == 'annual' and 'growth_rates' in comparison_data:
+            if growth_rates is not None:
                 csv_writer.writerow([])  # Empty row
                 csv_writer.writerow(['Symbol', 'Current Period', 'Next Period', 'Current Est.', 'Next Est.', 'Growth %'])
                 
-                for growth in comparison_data['growth_rates']:
-                    if 'growth_percent' in growth:
-                        csv_writer.writerow([
-                            growth['symbol'],
-                            growth['current_period'],
-                            growth['next_period'],
-                            f"{growth['current_estimate']:.2f}",
-                            f"{growth['next_estimate']:.2f}",
-                            f"{growth['growth_percent']:.2f}%"
-                        ])
-                    elif 'growth_status' in growth:
-                        csv_writer.writerow([
-                            growth['symbol'],
-                            growth['current_period'],
-                            growth['next_period'],
-                            f"{growth['current_estimate']:.2f}",
-                            f"{growth['next_estimate']:.2f}",
-                            growth['growth_status']
-                        ])
-                    else:
-                        csv_writer.writerow([growth['symbol'], "Insufficient data", "", "", "", ""])
+                csv_writer.writerows(growth.to_csv_row() for growth in growth_rates)
                     
         result['csv'] = str(csv_path)
     
     return result
 
+# Formats estimate amounts with thousands separators, e.g. 1,234.50
+_AMOUNT_FORMAT = "{:,.2f}".format
+
+
+def _format_amount(value: Optional[float], fallback: str = "N/A") -> str:
+    """Format an estimate amount for CSV output, or return fallback if it is missing."""
+    return fallback if value is None else _AMOUNT_FORMAT(value)
+
+
+def _revenue_comparison_cells(estimate: Any) -> Tuple[str, str]:
+    """Format the estimated and actual revenue cells of a comparison CSV row."""
+    if not estimate:
+        return ("N/A", "N/A")
+    return (_format_amount(estimate.estimate_value), _format_amount(estimate.actual_value))
+
+
+def _revenue_estimate_csv_row(est: Any) -> List[Any]:
+    """Build the CSV row for a quarterly or annual revenue estimate."""
+    return [
+        est.period,
+        est.period_end_date,
+        _format_amount(est.estimate_value),
+        est.estimate_count,
+        _format_amount(est.actual_value, "Not reported"),
+        _format_amount(est.surprise_value),
+        "N/A" if est.surprise_percent is None else f"{est.surprise_percent:.2f}"
+    ]
+
+
+def _revenue_growth_csv_row(growth: Dict[str, Any]) -> List[Any]:
+    """Build the growth rate CSV row of a revenue comparison for one symbol."""
+    if 'growth_percent' not in growth:
+        return [growth['symbol'], "Insufficient data", "", "", "", growth.get('reason', '')]
+    return [
+        growth['symbol'],
+        growth['current_period'],
+        growth['next_period'],
+        f"{growth['current_estimate']:,.2f}",
+        f"{growth['next_estimate']:,.2f}",
+        f"{growth['growth_percent']:.2f}"
+    ]
+
+
+def _period_end_sort_key(estimate: Any) -> str:
+    """Sort key ordering estimates by period end date, with undated estimates last."""
+    return estimate.period_end_date or "9999-99-99"
+
+
+def _write_revenue_estimates_csv(revenue_estimates: List[Any], csv_path: Union[str, Path]) -> str:
+    """Write revenue estimates to a CSV file by period end date, returning its path."""
+    sorted_ests = sorted(revenue_estimates, key=_period_end_sort_key)
+
+    with _open_csv(csv_path) as f:
+        csv_writer = csv.writer(f)
+        csv_writer.writerow([
+            "Period", "Period End Date", "Revenue Estimate ($M)", 
+            "Analyst Count", "Actual Revenue ($M)", "Surprise ($M)", "Surprise (%)"
+        ])
+        csv_writer.writerows(_revenue_estimate_csv_row(est) for est in sorted_ests)
+
+    return str(csv_path)
+
+
 def export_revenue_estimates(estimates: AnalystEstimates, formats: List[str], 
                             output_dir: Path) -> Dict[str, str]:
     """
@@ -2611,39 +3159,22 @@ def export_revenue_estimates(estimates: AnalystEstimates, formats: List[str],
     quarterly_estimates = estimates.quarterly_revenue_estimates
     annual_estimates = estimates.annual_revenue_estimates
     
-    # Package the data for export
-    revenue_data = {
-        "symbol": symbol,
-        "name": estimates.name,
-        "currency": estimates.currency,
-        "last_updated": estimates.last_updated,
-        "quarterly_estimates": [est.to_dict() for est in quarterly_estimates],
-        "annual_estimates": [est.to_dict() for est in annual_estimates]
-    }
+    # (previous estimate, estimate, growth %) for consecutive annual periods
+    # and the CAGR summary, shared by the JSON data and the growth CSV
+    growth_steps = []
+    cagr_data = None
     
     # Calculate growth rates for annual estimates if available
     if len(annual_estimates) >= 2:
         # Sort by period to ensure correct order
-        sorted_ests = sorted(annual_estimates, key=lambda e: e.period)
-        
-        growth_rates = []
-        prev_value = None
+        sorted_ests = sorted(annual_estimates, key=_PERIOD_KEY)
         
-        for estimate in sorted_ests:
+        for prev_est, estimate in zip(sorted_ests, sorted_ests[1:]):
+            prev_value = prev_est.estimate_value
             value = estimate.estimate_value
             
             if prev_value is not None and prev_value > 0 and value is not None:
-                growth_pct = ((value - prev_value) / prev_value) * 100
-                growth_rates.append({
-                    "period": estimate.period,
-                    "value": value,
-                    "previous_value": prev_value,
-                    "growth_percent": growth_pct
-                })
-                
-            prev_value = value
-            
-        revenue_data["annual_growth_rates"] = growth_rates
+                growth_steps.append((prev_est, estimate, ((value - prev_value) / prev_value) * 100))
         
         # Calculate CAGR if we have sufficient data
         if len(sorted_ests) >= 2:
@@ -2667,7 +3198,7 @@ def export_revenue_estimates(estimates: AnalystEstimates, formats: List[str],
             if first_value is not None and last_value is not None and first_value > 0 and years_diff > 0:
                 cagr = ((last_value / first_value) ** (1 / years_diff) - 1) * 100
                 
-                revenue_data["cagr"] = {
+                cagr_data = {
                     "first_period": first_est.period,
                     "last_period": last_est.period,
                     "first_value": first_value,
@@ -2679,114 +3210,88 @@ def export_revenue_estimates(estimates: AnalystEstimates, formats: List[str],
     # Export to JSON
     if 'json' in formats:
         json_path = output_dir / f"{base_filename}.json"
-        with open(json_path, 'w') as f:
-            json.dump(revenue_data, f, indent=2)
+        
+        # Package the data for export; the per-estimate dicts are only
+        # needed here, so CSV-only exports skip building them
+        revenue_data = {
+            "symbol": symbol,
+            "name": estimates.name,
+            "currency": estimates.currency,
+            "last_updated": estimates.last_updated,
+            "quarterly_estimates": [est.to_dict() for est in quarterly_estimates],
+            "annual_estimates": [est.to_dict() for est in annual_estimates]
+        }
+        if len(annual_estimates) >= 2:
+            revenue_data["annual_growth_rates"] = [
+                {
+                    "period": estimate.period,
+                    "value": estimate.estimate_value,
+                    "previous_value": prev_est.estimate_value,
+                    "growth_percent": growth_pct
+                }
+                for prev_est, estimate, growth_pct in growth_steps
+            ]
+        if cagr_data is not None:
+            revenue_data["cagr"] = cagr_data
+        
+        _dump_json(revenue_data, json_path)
         result['json'] = str(json_path)
     
     # Export to CSV
     if 'csv' in formats:
-        # Create a CSV file for quarterly estimates
-        if quarterly_estimates:
-            quarterly_csv_path = output_dir / f"{symbol}_quarterly_revenue_estimates.csv"
-            
-            with open(quarterly_csv_path, 'w', newline='') as f:
-                csv_writer = csv.writer(f)
-                
-                # Write header
-                csv_writer.writerow([
-                    "Period", "Period End Date", "Revenue Estimate ($M)", 
-                    "Analyst Count", "Actual Revenue ($M)", "Surprise ($M)", "Surprise (%)"
-                ])
+        # The quarterly and annual files are independent, so write them on
+        # worker threads while the growth rates are written here
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            quarterly_future = executor.submit(
+                _write_revenue_estimates_csv, quarterly_estimates,
+                output_dir / f"{symbol}_quarterly_revenue_estimates.csv") if quarterly_estimates else None
+            annual_future = executor.submit(
+                _write_revenue_estimates_csv, annual_estimates,
+                output_dir / f"{symbol}_annual_revenue_estimates.csv") if annual_estimates else None
+            
+            # Create a CSV file for growth rates if available
+            growth_csv_path = None
+            if growth_steps:
+                growth_csv_path = output_dir / f"{symbol}_revenue_growth_rates.csv"
                 
-                # Write data - sort by period end date
-                sorted_ests = sorted(quarterly_estimates, key=lambda e: e.period_end_date if e.period_end_date else "9999-99-99")
-                for est in sorted_ests:
+                with _open_csv(growth_csv_path) as f:
+                    csv_writer = csv.writer(f)
+                    
+                    # Write header
                     csv_writer.writerow([
-                        est.period,
-                        est.period_end_date,
-                        f"{est.estimate_value:,.2f}" if est.estimate_value is not None else "N/A",
-                        est.estimate_count,
-                        f"{est.actual_value:,.2f}" if est.actual_value is not None else "Not reported",
-                        f"{est.surprise_value:,.2f}" if est.surprise_value is not None else "N/A",
-                        f"{est.surprise_percent:.2f}" if est.surprise_percent is not None else "N/A"
+                        "Period", "Revenue Estimate ($M)", "Previous Period", "Previous Revenue ($M)", "YoY Growth (%)"
                     ])
-            
-            result['quarterly_csv'] = str(quarterly_csv_path)
-            
-        # Create a CSV file for annual estimates
-        if annual_estimates:
-            annual_csv_path = output_dir / f"{symbol}_annual_revenue_estimates.csv"
-            
-            with open(annual_csv_path, 'w', newline='') as f:
-                csv_writer = csv.writer(f)
-                
-                # Write header
-                csv_writer.writerow([
-                    "Period", "Period End Date", "Revenue Estimate ($M)", 
-                    "Analyst Count", "Actual Revenue ($M)", "Surprise ($M)", "Surprise (%)"
-                ])
-                
-                # Write data - sort by period end date
-                sorted_ests = sorted(annual_estimates, key=lambda e: e.period_end_date if e.period_end_date else "9999-99-99")
-                for est in sorted_ests:
-                    csv_writer.writerow([
+                    
+                    # Write data
+                    csv_writer.writerows([
                         est.period,
-                        est.period_end_date,
-                        f"{est.estimate_value:,.2f}" if est.estimate_value is not None else "N/A",
-                        est.estimate_count,
-                        f"{est.actual_value:,.2f}" if est.actual_value is not None else "Not reported",
-                        f"{est.surprise_value:,.2f}" if est.surprise_value is not None else "N/A",
-                        f"{est.surprise_percent:.2f}" if est.surprise_percent is not None else "N/A"
-                    ])
-            
-            result['annual_csv'] = str(annual_csv_path)
-            
-        # Create a CSV file for growth rates if available
-        if "annual_growth_rates" in revenue_data and revenue_data["annual_growth_rates"]:
-            growth_csv_path = output_dir / f"{symbol}_revenue_growth_rates.csv"
-            
-            with open(growth_csv_path, 'w', newline='') as f:
-                csv_writer = csv.writer(f)
-                
-                # Write header
-                csv_writer.writerow([
-                    "Period", "Revenue Estimate ($M)", "Previous Period", "Previous Revenue ($M)", "YoY Growth (%)"
-                ])
-                
-                # Write data
-                prev_period = None
-                for i, est in enumerate(sorted(annual_estimates, key=lambda e: e.period)):
-                    if i > 0 and est.estimate_value is not None and prev_value is not None and prev_value > 0:
-                        growth_pct = ((est.estimate_value - prev_value) / prev_value) * 100
+                        f"{est.estimate_value:,.2f}",
+                        prev_est.period,
+                        f"{prev_est.estimate_value:,.2f}",
+                        f"{growth_pct:.2f}"
+                    ] for prev_est, est, growth_pct in growth_steps)
                         
+                    # Write CAGR if available
+                    if cagr_data is not None:
+                        csv_writer.writerow([])  # Empty row
+                        csv_writer.writerow(["CAGR Analysis", "", "", "", ""])
                         csv_writer.writerow([
-                            est.period,
-                            f"{est.estimate_value:,.2f}",
-                            prev_period,
-                            f"{prev_value:,.2f}",
-                            f"{growth_pct:.2f}"
+                            "First Period", "First Value ($M)", "Last Period", "Last Value ($M)", "CAGR (%)"
+                        ])
+                        csv_writer.writerow([
+                            cagr_data["first_period"],
+                            f"{cagr_data['first_value']:,.2f}",
+                            cagr_data["last_period"],
+                            f"{cagr_data['last_value']:,.2f}",
+                            f"{cagr_data['cagr_percent']:.2f}"
                         ])
-                        
-                    prev_period = est.period
-                    prev_value = est.estimate_value
-                    
-                # Write CAGR if available
-                if "cagr" in revenue_data:
-                    cagr = revenue_data["cagr"]
-                    csv_writer.writerow([])  # Empty row
-                    csv_writer.writerow(["CAGR Analysis", "", "", "", ""])
-                    csv_writer.writerow([
-                        "First Period", "First Value ($M)", "Last Period", "Last Value ($M)", "CAGR (%)"
-                    ])
-                    csv_writer.writerow([
-                        cagr["first_period"],
-                        f"{cagr['first_value']:,.2f}",
-                        cagr["last_period"],
-                        f"{cagr['last_value']:,.2f}",
-                        f"{cagr['cagr_percent']:.2f}"
-                    ])
             
-            result['growth_csv'] = str(growth_csv_path)
+            if quarterly_future is not None:
+                result['quarterly_csv'] = quarterly_future.result()
+            if annual_future is not None:
+                result['annual_csv'] = annual_future.result()
+            if growth_csv_path is not None:
+                result['growth_csv'] = str(growth_csv_path)
             
         if 'quarterly_csv' in result or 'annual_csv' in result or 'growth_csv' in result:
             result['csv'] = [
@@ -2815,6 +3320,10 @@ def export_revenue_comparison(symbols: List[str], estimates_list: List[AnalystEs
     Returns:
         Dict mapping format to file path
     """
+    # Periods and growth rates only feed the JSON and CSV output
+    if 'json' not in formats and 'csv' not in formats:
+        return {}
+        
     result = {}
     
     # Generate base filename
@@ -2826,58 +3335,27 @@ def export_revenue_comparison(symbols: List[str], estimates_list: List[AnalystEs
     
     ensure_directory(output_dir)
     
-    # Prepare comparison data
-    comparison_data = {
-        "symbols": symbols,
-        "period_type": period_type,
-        "comparisons": []
-    }
+    # Choose the correct set of estimates once per symbol
+    period_key = period_type.lower()
+    get_estimates = _ESTIMATE_LIST_GETTERS[('revenue', 'quarterly' if period_key == 'quarterly' else 'annual')]
+    per_symbol_estimates = [get_estimates(estimates) for estimates in estimates_list]
     
+    # Collect every period covered by any symbol
     all_periods = set()
+    for estimate_list in per_symbol_estimates:
+        all_periods.update(est.period for est in estimate_list)
+    sorted_periods = sorted(all_periods)
     
-    # Extract all the estimates
-    for estimates in estimates_list:
-        estimates_data = {
-            "symbol": estimates.symbol,
-            "estimates": []
-        }
-        
-        # Choose the correct set of estimates
-        if period_type.lower() == 'quarterly':
-            estimate_list = estimates.quarterly_revenue_estimates
-        else:
-            estimate_list = estimates.annual_revenue_estimates
-            
-        # Process each estimate
-        for est in estimate_list:
-            all_periods.add(est.period)
-            
-            estimates_data["estimates"].append({
-                "period": est.period,
-                "period_end_date": est.period_end_date,
-                "estimate_value": est.estimate_value,
-                "actual_value": est.actual_value,
-                "surprise_value": est.surprise_value,
-                "surprise_percent": est.surprise_percent
-            })
-            
-        comparison_data["comparisons"].append(estimates_data)
-            
-    # Add periods to the comparison data
-    comparison_data["all_periods"] = sorted(list(all_periods))
+    # Members written after the per-symbol comparisons in the JSON export
+    comparison_data = {"all_periods": sorted_periods}
     
     # Calculate growth rates if we have annual estimates
-    if period_type.lower() == 'annual':
+    if period_key == 'annual':
         growth_rates = []
         
-        for estimates in estimates_list:
-            if period_type.lower() == 'annual':
-                estimate_list = estimates.annual_revenue_estimates
-            else:
-                estimate_list = estimates.quarterly_revenue_estimates
-                
+        for estimates, estimate_list in zip(estimates_list, per_symbol_estimates):
             # Sort by period to ensure correct order
-            sorted_ests = sorted(estimate_list, key=lambda e: e.period)
+            sorted_ests = sorted(estimate_list, key=_PERIOD_KEY)
             
             if len(sorted_ests) >= 2:
                 # Calculate YoY growth from current to next year's estimate
@@ -2913,75 +3391,83 @@ def export_revenue_comparison(symbols: List[str], estimates_list: List[AnalystEs
     # Export to JSON
     if 'json' in formats:
         json_path = output_dir / f"{base_filename}.json"
-        with open(json_path, 'w') as f:
-            json.dump(comparison_data, f, indent=2)
+        # Stream the per-symbol comparisons so only a chunk of them is built at once
+        with open(json_path, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
+            _stream_json_object(
+                f,
+                {"symbols": symbols, "period_type": period_type},
+                "comparisons",
+                (
+                    _estimate_comparison_entry(estimates.symbol, estimate_list)
+                    for estimates, estimate_list in zip(estimates_list, per_symbol_estimates)
+                ),
+                chunk_size=_JSON_STREAM_CHUNK_SIZE,
+                trailing_fields=comparison_data
+            )
         result['json'] = str(json_path)
     
     # Export to CSV
     if 'csv' in formats:
         csv_path = output_dir / f"{base_filename}.csv"
         
-        with open(csv_path, 'w', newline='') as f:
+        with _open_csv(csv_path) as f:
             # Create dynamic headers with symbol names
-            headers = ['Period']
-            for symbol in symbols:
-                headers.append(f"{symbol.upper()} Est. Revenue ($M)")
-                headers.append(f"{symbol.upper()} Act. Revenue ($M)")
+            headers = ['Period', *chain.from_iterable(
+                (f"{upper_symbol} Est. Revenue ($M)", f"{upper_symbol} Act. Revenue ($M)")
+                for upper_symbol in (symbol.upper() for symbol in symbols)
+            )]
             
             csv_writer = csv.writer(f)
             csv_writer.writerow(headers)
             
+            # Index each symbol's estimates by period, keeping the first match
+            period_lookups = [
+                {est.period: est for est in reversed(estimate_list)}
+                for estimate_list in per_symbol_estimates
+            ]
+            
             # Write rows for each period
-            for period in sorted(all_periods):
-                row = [period]
-                
-                for estimates in estimates_list:
-                    if period_type.lower() == 'quarterly':
-                        estimate_list = estimates.quarterly_revenue_estimates
-                    else:
-                        estimate_list = estimates.annual_revenue_estimates
-                        
-                    # Find the estimate for this period
-                    estimate = next((est for est in estimate_list if est.period == period), None)
-                    
-                    if estimate:
-                        row.append(f"{estimate.estimate_value:,.2f}" if estimate.estimate_value is not None else "N/A")
-                        row.append(f"{estimate.actual_value:,.2f}" if estimate.actual_value is not None else "N/A")
-                    else:
-                        row.append("N/A")
-                        row.append("N/A")
-                
-                csv_writer.writerow(row)
+            csv_writer.writerows(
+                [period, *chain.from_iterable(
+                    _revenue_comparison_cells(lookup.get(period)) for lookup in period_lookups
+                )]
+                for period in sorted_periods
+            )
                 
             # Add growth rates if available
-            if period_type.lower() == 'annual' and 'growth_rates' in comparison_data:
+            if 'growth_rates' in comparison_data:
                 csv_writer.writerow([])  # Empty row
                 csv_writer.writerow(['Symbol', 'Current Period', 'Next Period', 'Current Est. ($M)', 'Next Est. ($M)', 'Growth (%)'])
                 
-                for growth in comparison_data['growth_rates']:
-                    if 'growth_percent' in growth:
-                        csv_writer.writerow([
-                            growth['symbol'],
-                            growth['current_period'],
-                            growth['next_period'],
-                            f"{growth['current_estimate']:,.2f}",
-                            f"{growth['next_estimate']:,.2f}",
-                            f"{growth['growth_percent']:.2f}"
-                        ])
-                    else:
-                        csv_writer.writerow([
-                            growth['symbol'], 
-                            "Insufficient data", 
-                            "", 
-                            "", 
-                            "",
-                            growth.get('reason', '')
-                        ])
-                    
+                csv_writer.writerows(_revenue_growth_csv_row(growth)
+                                     for growth in comparison_data['growth_rates'])
+
         result['csv'] = str(csv_path)
     
     return result
 
+def _eps_history_csv_row(point: Dict[str, Any], has_changes: bool,
+                         has_actual_comparison: bool) -> List[str]:
+    """Build the CSV row for one point of an EPS estimate history."""
+    date_str = point["date"].strftime("%Y-%m-%d") if point["date"] else point["date_str"]
+
+    row = [date_str, f"{point['estimate_value']:.2f}"]
+
+    if has_changes and "change_from_previous" in point:
+        row.append(f"{point['change_from_previous']:.2f}")
+        row.append(f"{point['change_percent']:.2f}%")
+    elif has_changes:
+        row.extend(["", ""])
+
+    if has_actual_comparison and "diff_from_actual" in point:
+        row.append(f"{point['diff_from_actual']:.2f}")
+        row.append(f"{point['diff_from_actual_percent']:.2f}%")
+    elif has_actual_comparison:
+        row.extend(["", ""])
+
+    return row
+
+
 def export_eps_estimate_history(symbol: str, estimate_history: Dict[str, Any], 
                                formats: List[str], output_dir: Path) -> Dict[str, str]:
     """
@@ -3006,7 +3492,8 @@ def export_eps_estimate_history(symbol: str, estimate_history: Dict[str, Any],
     
     # Generate filename base
     period = estimate_history["period"]
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    generated_at = datetime.now()
+    timestamp = generated_at.strftime("%Y%m%d_%H%M%S")
     base_filename = f"eps_history_{symbol}_{period.replace(' ', '_')}_{timestamp}"
     
     # Ensure output directory exists
@@ -3046,8 +3533,7 @@ def export_eps_estimate_history(symbol: str, estimate_history: Dict[str, Any],
             json_data["historical_estimates"].append(point_data)
         
         # Write to JSON file
-        with open(json_path, 'w') as f:
-            json.dump(json_data, f, indent=2)
+        _dump_json(json_data, json_path)
             
         result['json'] = str(json_path)
     
@@ -3055,7 +3541,7 @@ def export_eps_estimate_history(symbol: str, estimate_history: Dict[str, Any],
     if 'csv' in formats:
         csv_path = output_dir / f"{base_filename}.csv"
         
-        with open(csv_path, 'w', newline='') as f:
+        with _open_csv(csv_path) as f:
             # Write metadata as comments
             f.write(f"# EPS Estimate History for {symbol} - {period}\n")
             f.write(f"# Period End Date: {estimate_history['period_end_date']}\n")
@@ -3063,7 +3549,7 @@ def export_eps_estimate_history(symbol: str, estimate_history: Dict[str, Any],
             f.write(f"# Analyst Count: {estimate_history['analyst_count']}\n")
             if estimate_history["actual_value"] is not None:
                 f.write(f"# Actual EPS: ${estimate_history['actual_value']:.2f}\n")
-            f.write(f"# Generated: {datetime.now().isoformat()}\n")
+            f.write(f"# Generated: {generated_at.isoformat()}\n")
             f.write("#\n")
             
             # Determine headers based on available data
@@ -3085,24 +3571,9 @@ def export_eps_estimate_history(symbol: str, estimate_history: Dict[str, Any],
             csv_writer.writerow(headers)
             
             # Write data rows
-            for point in estimate_history["historical_estimates"]:
-                date_str = point["date"].strftime("%Y-%m-%d") if point["date"] else point["date_str"]
-                
-                row = [date_str, f"{point['estimate_value']:.2f}"]
-                
-                if has_changes and "change_from_previous" in point:
-                    row.append(f"{point['change_from_previous']:.2f}")
-                    row.append(f"{point['change_percent']:.2f}%")
-                elif has_changes:
-                    row.extend(["", ""])
-                
-                if has_actual_comparison and "diff_from_actual" in point:
-                    row.append(f"{point['diff_from_actual']:.2f}")
-                    row.append(f"{point['diff_from_actual_percent']:.2f}%")
-                elif has_actual_comparison:
-                    row.extend(["", ""])
-                
-                csv_writer.writerow(row)
+            csv_writer.writerows(
+                _eps_history_csv_row(point, has_changes, has_actual_comparison)
+                for point in estimate_history["historical_estimates"])
         
         result['csv'] = str(csv_path)
     
@@ -3125,7 +3596,8 @@ def export_eps_revisions(revisions: 'EpsRevisions', formats: List[str],
     result = {}
     
     # Generate filename base
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    generated_at = datetime.now()
+    timestamp = generated_at.strftime("%Y%m%d_%H%M%S")
     base_filename = f"eps_revisions_{revisions.symbol}_{timestamp}"
     
     # Ensure output directory exists
@@ -3135,8 +3607,7 @@ def export_eps_revisions(revisions: 'EpsRevisions', formats: List[str],
     if 'json' in formats:
         json_path = output_dir / f"{base_filename}.json"
         
-        with open(json_path, 'w') as f:
-            json.dump(revisions.to_dict(), f, indent=2)
+        _dump_json(revisions.to_dict(), json_path)
             
         result['json'] = str(json_path)
     
@@ -3146,7 +3617,7 @@ def export_eps_revisions(revisions: 'EpsRevisions', formats: List[str],
             # Export detailed CSV with quarterly/annual breakdown
             detailed_csv_path = output_dir / f"{base_filename}_detailed.csv"
             
-            with open(detailed_csv_path, 'w', newline='') as f:
+            with _open_csv(detailed_csv_path) as f:
                 # Write metadata as comments
                 f.write(f"# EPS Revisions for {revisions.symbol}")
                 if revisions.name:
@@ -3155,7 +3626,7 @@ def export_eps_revisions(revisions: 'EpsRevisions', formats: List[str],
                 
                 if revisions.last_updated:
                     f.write(f"# Last Updated: {revisions.last_updated}\n")
-                f.write(f"# Generated: {datetime.now().isoformat()}\n")
+                f.write(f"# Generated: {generated_at.isoformat()}\n")
                 f.write("#\n")
                 
                 # Get headers and rows
@@ -3165,15 +3636,14 @@ def export_eps_revisions(revisions: 'EpsRevisions', formats: List[str],
                 # Create CSV writer and write data
                 writer = csv.DictWriter(f, fieldnames=headers)
                 writer.writeheader()
-                for row in rows:
-                    writer.writerow(row)
+                writer.writerows(rows)
             
             result['csv_detailed'] = str(detailed_csv_path)
         
         # Export summary CSV
         summary_csv_path = output_dir / f"{base_filename}_summary.csv"
         
-        with open(summary_csv_path, 'w', newline='') as f:
+        with _open_csv(summary_csv_path) as f:
             # Write metadata as comments
             f.write(f"# EPS Revisions Summary for {revisions.symbol}")
             if revisions.name:
@@ -3182,7 +3652,7 @@ def export_eps_revisions(revisions: 'EpsRevisions', formats: List[str],
             
             if revisions.last_updated:
                 f.write(f"# Last Updated: {revisions.last_updated}\n")
-            f.write(f"# Generated: {datetime.now().isoformat()}\n")
+            f.write(f"# Generated: {generated_at.isoformat()}\n")
             f.write("#\n")
             
             # Get headers and rows
@@ -3192,8 +3662,7 @@ def export_eps_revisions(revisions: 'EpsRevisions', formats: List[str],
             # Create CSV writer and write data
             writer = csv.DictWriter(f, fieldnames=headers)
             writer.writeheader()
-            for row in rows:
-                writer.writerow(row)
+            writer.writerows(rows)
         
         result['csv_summary'] = str(summary_csv_path)
         
@@ -3221,7 +3690,8 @@ def export_growth_estimates(estimates: 'GrowthEstimates', formats: List[str],
     result = {}
     
     # Generate filename base
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    generated_at = datetime.now()
+    timestamp = generated_at.strftime("%Y%m%d_%H%M%S")
     base_filename = f"growth_estimates_{estimates.symbol}_{timestamp}"
     
     # Ensure output directory exists
@@ -3231,8 +3701,7 @@ def export_growth_estimates(estimates: 'GrowthEstimates', formats: List[str],
     if 'json' in formats:
         json_path = output_dir / f"{base_filename}.json"
         
-        with open(json_path, 'w') as f:
-            json.dump(estimates.to_dict(), f, indent=2)
+        _dump_json(estimates.to_dict(), json_path)
             
         result['json'] = str(json_path)
     
@@ -3240,7 +3709,7 @@ def export_growth_estimates(estimates: 'GrowthEstimates', formats: List[str],
     if 'csv' in formats:
         csv_path = output_dir / f"{base_filename}.csv"
         
-        with open(csv_path, 'w', newline='') as f:
+        with _open_csv(csv_path) as f:
             # Write metadata as comments
             f.write(f"# Growth Estimates for {estimates.symbol}")
             if estimates.name:
@@ -3249,7 +3718,7 @@ def export_growth_estimates(estimates: 'GrowthEstimates', formats: List[str],
             
             if estimates.last_updated:
                 f.write(f"# Last Updated: {estimates.last_updated}\n")
-            f.write(f"# Generated: {datetime.now().isoformat()}\n")
+            f.write(f"# Generated: {generated_at.isoformat()}\n")
             f.write("#\n")
             
             # Get headers and rows
@@ -3259,8 +3728,7 @@ def export_growth_estimates(estimates: 'GrowthEstimates', formats: List[str],
             # Create CSV writer and write data
             writer = csv.DictWriter(f, fieldnames=headers)
             writer.writeheader()
-            for row in rows:
-                writer.writerow(row)
+            writer.writerows(rows)
         
         result['csv'] = str(csv_path)
     
@@ -3282,7 +3750,8 @@ def export_analyst_recommendations(recommendations: 'AnalystRecommendations',
     result = {}
     
     # Generate filename base
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    generated_at = datetime.now()
+    timestamp = generated_at.strftime("%Y%m%d_%H%M%S")
     base_filename = f"analyst_recommendations_{recommendations.symbol}_{timestamp}"
     
     # Ensure output directory exists
@@ -3292,8 +3761,7 @@ def export_analyst_recommendations(recommendations: 'AnalystRecommendations',
     if 'json' in formats:
         json_path = output_dir / f"{base_filename}.json"
         
-        with open(json_path, 'w') as f:
-            json.dump(recommendations.to_dict(), f, indent=2)
+        _dump_json(recommendations.to_dict(), json_path)
             
         result['json'] = str(json_path)
     
@@ -3302,7 +3770,7 @@ def export_analyst_recommendations(recommendations: 'AnalystRecommendations',
         # Export consensus summary to CSV
         consensus_csv_path = output_dir / f"{base_filename}_consensus.csv"
         
-        with open(consensus_csv_path, 'w', newline='') as f:
+        with _open_csv(consensus_csv_path) as f:
             # Write metadata as comments
             f.write(f"# Analyst Recommendations Consensus for {recommendations.symbol}")
             if recommendations.name:
@@ -3311,7 +3779,7 @@ def export_analyst_recommendations(recommendations: 'AnalystRecommendations',
             
             if recommendations.last_updated:
                 f.write(f"# Last Updated: {recommendations.last_updated}\n")
-            f.write(f"# Generated: {datetime.now().isoformat()}\n")
+            f.write(f"# Generated: {generated_at.isoformat()}\n")
             f.write("#\n")
             
             # Write consensus data
@@ -3353,7 +3821,7 @@ def export_analyst_recommendations(recommendations: 'AnalystRecommendations',
         if recommendations.recommendations:
             recs_csv_path = output_dir / f"{base_filename}_individual.csv"
             
-            with open(recs_csv_path, 'w', newline='') as f:
+            with _open_csv(recs_csv_path) as f:
                 f.write(f"# Individual Analyst Recommendations for {recommendations.symbol}")
                 if recommendations.name:
                     f.write(f" ({recommendations.name})")
@@ -3361,15 +3829,18 @@ def export_analyst_recommendations(recommendations: 'AnalystRecommendations',
                 
                 if recommendations.last_updated:
                     f.write(f"# Last Updated: {recommendations.last_updated}\n")
-                f.write(f"# Generated: {datetime.now().isoformat()}\n")
+                f.write(f"# Generated: {generated_at.isoformat()}\n")
                 f.write("#\n")
                 
                 writer = csv.writer(f)
                 writer.writerow(["Firm", "Rating", "Action", "Target Price", "Date"])
                 
-                for rec in sorted(recommendations.recommendations, key=lambda r: r.date if r.date else "", reverse=True):
-                    target_price = f"{rec.target_price:.2f}" if rec.target_price is not None else "N/A"
-                    writer.writerow([rec.firm, rec.rating, rec.action, target_price, rec.date])
+                writer.writerows(
+                    [rec.firm, rec.rating, rec.action,
+                     f"{rec.target_price:.2f}" if rec.target_price is not None else "N/A", rec.date]
+                    for rec in sorted(recommendations.recommendations,
+                                      key=lambda r: r.date if r.date else "", reverse=True)
+                )
             
             result['csv_individual'] = str(recs_csv_path)
             
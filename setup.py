@@ -2,7 +2,9 @@ from setuptools import setup, find_packages
 
 
 with open("requirements.txt", "r") as f:
-    requirements = f.read().splitlines()
+    # Skip the editable self-install line, which is not a valid requirement
+    requirements = [line for line in f.read().splitlines()
+                    if line and not line.startswith("-e ")]
 
 setup(
     name="stockcli",
@@ -10,6 +12,14 @@ setup(
     packages=find_packages(),
     include_package_data=True,
     install_requires=requirements,
+    extras_require={
+        # Arrow IPC (.arrow) exports of income statement and balance sheet comparisons
+        "arrow": ["pyarrow>=7.0"],
+        # Parquet exports of quotes, time series and the splits calendar
+        "parquet": ["pyarrow>=7.0"],
+        # Faster JSON exports; see _dump_json for how the output differs from json
+        "orjson": ["orjson>=3.6"],
+    },
     entry_points={
         "console_scripts": [
             "stockcli=app.main:cli",
@@ -1,4 +1,5 @@
 import pytest
+import io
 import json
 import csv
 import os
@@ -7,8 +8,18 @@ from unittest.mock import patch, MagicMock, mock_open
 from datetime import datetime, timedelta
 from tempfile import TemporaryDirectory
 
-from app.models.stock import Quote
-from app.utils.export import export_quotes, get_default_export_dir, get_home_export_dir
+from app.models.stock import Quote, HistoricalBar, TimeSeries
+from app.models.dividend import Dividend, DividendHistory
+from app.models.analysts_estimates import AnalystEstimates, EpsEstimate
+from app.models.balance_sheet import BalanceSheet
+from app.models.income_statement import IncomeStatement
+from app.models.splits_calendar import SplitCalendarEvent, SplitsCalendar
+from app.utils.export import (export_quotes, export_quotes_to_csv, export_dividend_comparison,
+                              export_balance_sheet_summary,
+                              export_eps_comparison, export_income_statements,
+                              export_splits_calendar, export_time_series_to_parquet,
+                              _dump_json, _json_text, _write_parquet,
+                              generate_export_filename, get_default_export_dir, get_home_export_dir)
 
 
 # Sample quote objects for testing exports
@@ -322,4 +333,296 @@ class TestQuoteExports:
             assert year in filename
             # Either as separate components or together
             assert month in filename or f"{year}{month}" in filename
-            assert day in filename or f"{month}{day}" in filename
\ No newline at end of file
+            assert day in filename or f"{month}{day}" in filename
+
+    def test_generate_export_filename_additional_parts(self):
+        """Test that extra name parts are included and the extension is optional."""
+        base_name = generate_export_filename(
+            'balance_sheet', ['AAPL'], additional_parts=['annual', '2023-09-30'])
+
+        assert base_name.startswith('balance_sheet_AAPL_annual_2023-09-30_')
+        assert '.' not in base_name
+        assert generate_export_filename('quotes', ['AAPL'], 'csv').endswith('.csv')
+        assert generate_export_filename(
+            'quotes', ['AAPL'], 'csv', timestamp='20240101_120000') == 'quotes_AAPL_20240101_120000.csv'
+
+    def test_generate_export_filename_many_symbols_are_fingerprinted(self):
+        """Test that long symbol lists get short, distinct filenames."""
+        first = generate_export_filename('quotes', ['AAPL', 'MSFT', 'GOOGL', 'AMZN'], 'csv')
+        second = generate_export_filename('quotes', ['AAPL', 'MSFT', 'GOOGL', 'TSLA'], 'csv')
+
+        assert first.startswith('quotes_AAPL-and-3-more-')
+        assert second.startswith('quotes_AAPL-and-3-more-')
+        assert first.split('_')[1] != second.split('_')[1]
+
+    def test_export_quotes_to_csv_matches_dict_writer(self, sample_quotes):
+        """Test that the direct quote writer produces the same CSV as csv.DictWriter."""
+        with TemporaryDirectory() as temp_dir:
+            csv_path = Path(temp_dir) / "quotes.csv"
+            assert export_quotes_to_csv(sample_quotes, csv_path)
+
+            expected = io.StringIO(newline='')
+            writer = csv.DictWriter(expected, fieldnames=Quote.get_csv_header())
+            writer.writeheader()
+            for quote in sample_quotes:
+                writer.writerow(quote.to_csv_row())
+
+            with open(csv_path, 'r', newline='') as f:
+                assert f.read() == expected.getvalue()
+
+    def test_export_quotes_to_csv_quotes_text_fields(self, sample_quotes):
+        """Test that names containing commas are still quoted correctly."""
+        sample_quotes[0].name = 'Apple, Inc. "Common"'
+
+        with TemporaryDirectory() as temp_dir:
+            csv_path = Path(temp_dir) / "quotes.csv"
+            assert export_quotes_to_csv(sample_quotes, csv_path)
+
+            with open(csv_path, 'r', newline='') as f:
+                rows = list(csv.DictReader(f))
+                assert rows[0]['name'] == 'Apple, Inc. "Common"'
+                assert rows[1]['name'] == 'Microsoft Corporation'
+
+
+class TestDividendComparisonExports:
+    """Tests for exporting dividend comparisons."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 10])
+    def test_export_dividend_comparison_json_matches_json_dump(self, chunk_size):
+        """Test that the streamed JSON is identical to dumping the whole comparison."""
+        histories = [
+            DividendHistory(symbol, {'name': f"{symbol} Inc."}, [
+                Dividend(symbol=symbol, payment_date=datetime(2023, month, 15).date(),
+                         amount=0.25 * month)
+                for month in (3, 6, 9)
+            ])
+            for symbol in ("AAPL", "MSFT", "KO")
+        ]
+        histories.append(DividendHistory("NONE", {}, []))
+
+        with TemporaryDirectory() as temp_dir:
+            result = export_dividend_comparison(histories, ['json'], temp_dir,
+                                                chunk_size=chunk_size)
+
+            with open(result['json'], 'r') as f:
+                content = f.read()
+
+        data = json.loads(content)
+        expected = {
+            "timestamp": data["timestamp"],
+            "symbols": [history.symbol for history in histories],
+            "histories": [history.to_dict() for history in histories]
+        }
+        assert content == json.dumps(expected, indent=2, default=str)
+
+    @pytest.mark.parametrize("description", ["Regular", 'Special, "one-off"'])
+    def test_export_dividend_comparison_detail_csv_matches_dict_writer(self, description):
+        """Test that the per-symbol detail CSV is identical to csv.DictWriter output."""
+        dividends = [
+            Dividend(symbol="KO", payment_date=datetime(2023, month, 15), amount=0.46,
+                     frequency="Quarterly", description=description)
+            for month in (4, 7)
+        ]
+        history = DividendHistory("KO", {'name': "Coca-Cola"}, dividends)
+
+        with TemporaryDirectory() as temp_dir:
+            export_dividend_comparison([history], ['csv'], temp_dir)
+            detail_path = next(Path(temp_dir).glob("dividend_history_KO_*.csv"))
+            content = detail_path.read_bytes().decode()
+
+        expected = io.StringIO()
+        writer = csv.DictWriter(expected, fieldnames=Dividend.get_csv_header())
+        writer.writeheader()
+        writer.writerows(dividend.to_csv_row() for dividend in dividends)
+        assert content == expected.getvalue()
+
+
+class TestEpsComparisonExports:
+    """Tests for exporting EPS estimate comparisons."""
+
+    def test_export_eps_comparison_json_matches_json_dump(self):
+        """Test that the streamed JSON is identical to dumping the whole comparison."""
+        estimates_list = [
+            AnalystEstimates(symbol, f"{symbol} Inc.", "USD", [], [
+                EpsEstimate("FY 2023", "2023-12-31", base, 10, actual_value=base + 0.1),
+                EpsEstimate("FY 2024", "2024-12-31", base * 1.1, 8)
+            ])
+            for symbol, base in (("AAPL", 6.0), ("MSFT", -0.5))
+        ]
+        symbols = [estimates.symbol for estimates in estimates_list]
+
+        with TemporaryDirectory() as temp_dir:
+            result = export_eps_comparison(symbols, estimates_list, 'annual', ['json'],
+                                           Path(temp_dir))
+
+            with open(result['json'], 'r') as f:
+                content = f.read()
+
+        data = json.loads(content)
+        assert list(data) == ["symbols", "period_type", "comparisons", "all_periods", "growth_rates"]
+        assert data["all_periods"] == ["FY 2023", "FY 2024"]
+        assert [entry["symbol"] for entry in data["comparisons"]] == symbols
+        assert content == json.dumps(data, indent=2)
+
+
+class TestBalanceSheetSummaryExports:
+    """Tests for exporting balance sheet summaries."""
+
+    def test_export_balance_sheet_summary_json_items_are_objects(self):
+        """Test that each summary line item is an object keyed by name, value and percentage."""
+        balance_sheet = BalanceSheet.from_api_response({
+            "symbol": "aapl", "fiscal_date": "2023-09-30", "fiscal_period": "annual",
+            "total_assets": 1000.0, "cash_and_cash_equivalents": 300.0, "inventory": 100.0
+        })
+
+        with TemporaryDirectory() as temp_dir:
+            result = export_balance_sheet_summary(balance_sheet, ['json'], Path(temp_dir))
+
+            with open(result['json'], 'r') as f:
+                data = json.load(f)
+
+        items = data["structure"]["assets"]["current_assets"]["items"]
+        assert items
+        for item in items:
+            assert set(item) == {"name", "value", "percentage"}
+            assert item["percentage"] == item["value"] / 1000.0 * 100
+
+
+@pytest.fixture
+def sample_time_series():
+    start = datetime(2024, 1, 2, 9, 30)
+    bars = [
+        HistoricalBar(timestamp=start + timedelta(minutes=i), open=100.0 + i, high=101.0 + i,
+                      low=99.0 + i, close=100.5 + i, volume=1000 * (i + 1) if i else None)
+        for i in range(3)
+    ]
+    return TimeSeries(symbol="AAPL", interval="1min", bars=bars, currency="USD")
+
+
+class TestParquetAndArrowExports:
+    """Tests for the pyarrow-backed Parquet and Arrow exports."""
+
+    @pytest.fixture
+    def pq(self):
+        return pytest.importorskip("pyarrow.parquet")
+
+    def test_write_parquet_records_and_columns(self, pq, tmp_path):
+        """Test that both row dicts and column lists are written, with schema metadata."""
+        records_path = tmp_path / "records.parquet"
+        columns_path = tmp_path / "columns.parquet"
+
+        assert _write_parquet(records_path, [{"a": 1, "b": "x"}, {"a": 2, "b": "y"}])
+        assert _write_parquet(columns_path, {"a": [1, 2], "b": ["x", "y"]}, {"source": "test"})
+
+        assert pq.read_table(records_path).to_pydict() == {"a": [1, 2], "b": ["x", "y"]}
+        table = pq.read_table(columns_path)
+        assert table.to_pydict() == {"a": [1, 2], "b": ["x", "y"]}
+        assert table.schema.metadata[b"source"] == b"test"
+
+    def test_export_quotes_parquet(self, pq, sample_quotes, tmp_path):
+        """Test that export_quotes writes one Parquet row per quote."""
+        result = export_quotes(sample_quotes, ['parquet'], tmp_path)
+
+        table = pq.read_table(result['parquet'])
+        assert table.column("symbol").to_pylist() == ["AAPL", "MSFT"]
+
+    def test_export_time_series_to_parquet(self, pq, sample_time_series, tmp_path):
+        """Test that bars keep their column types and the series info is stored as metadata."""
+        filepath = tmp_path / "series.parquet"
+        assert export_time_series_to_parquet(sample_time_series, filepath)
+
+        table = pq.read_table(filepath)
+        assert table.column_names == HistoricalBar.get_csv_header()
+        assert table.to_pydict() == sample_time_series.columns()
+        assert table.schema.metadata[b"symbol"] == b"AAPL"
+        assert table.schema.metadata[b"interval"] == b"1min"
+
+    def test_export_time_series_to_parquet_directory_error(self, sample_time_series, tmp_path):
+        """Test that a failure to create the output directory is reported as False."""
+        with patch('app.utils.export.ensure_directory', side_effect=OSError("read-only")):
+            assert export_time_series_to_parquet(sample_time_series, tmp_path / "series.parquet") is False
+
+    def test_export_splits_calendar_parquet(self, pq, tmp_path):
+        """Test that the splits calendar writes one Parquet row per event."""
+        events = [
+            SplitCalendarEvent(symbol=symbol, date=datetime(2024, 1, day), from_factor=1,
+                               to_factor=4, ratio=4.0, name=f"{symbol} Inc.", status="announced")
+            for symbol, day in (("AAPL", 10), ("NVDA", 12))
+        ]
+        calendar = SplitsCalendar(datetime(2024, 1, 1), datetime(2024, 1, 31), events)
+
+        result = export_splits_calendar(calendar, ['parquet'], tmp_path)
+
+        table = pq.read_table(result['parquet'])
+        assert table.to_pylist() == [event.to_dict() for event in events]
+
+    def test_export_income_statements_arrow(self, tmp_path):
+        """Test that the 'arrow' format writes one row per statement."""
+        feather = pytest.importorskip("pyarrow.feather")
+        statements = [
+            IncomeStatement.from_api_response({
+                "symbol": "AAPL", "fiscal_date": fiscal_date, "fiscal_period": "annual",
+                "revenue": 1000.0, "cost_of_revenue": 600.0, "net_income": 150.0
+            })
+            for fiscal_date in ("2023-09-30", "2022-09-30")
+        ]
+
+        result = export_income_statements(statements, ['arrow'], tmp_path)
+
+        table = feather.read_table(result['arrow'])
+        assert table.num_rows == 2
+        assert table.column("fiscal_date").to_pylist() == ["2023-09-30", "2022-09-30"]
+
+    def test_export_income_statements_arrow_without_pyarrow(self, tmp_path):
+        """Test that the 'arrow' format is skipped when pyarrow is not installed."""
+        statement = IncomeStatement.from_api_response({
+            "symbol": "AAPL", "fiscal_date": "2023-09-30", "fiscal_period": "annual",
+            "revenue": 1000.0, "cost_of_revenue": 600.0, "net_income": 150.0
+        })
+
+        with patch('app.utils.export.pa', None):
+            result = export_income_statements([statement], ['json', 'arrow'], tmp_path)
+
+        assert 'json' in result
+        assert 'arrow' not in result
+
+
+class TestJsonEncoders:
+    """Tests that the orjson and json encoders behind the JSON exports agree."""
+
+    @pytest.fixture(autouse=True)
+    def orjson(self):
+        return pytest.importorskip("orjson")
+
+    def test_dump_json_same_output_with_and_without_orjson(self, sample_quotes, tmp_path):
+        """Test that a typical export payload is written identically by both encoders."""
+        payload = {
+            "timestamp": datetime(2024, 1, 2, 3, 4, 5),
+            "symbols": ["AAPL", "MSFT"],
+            "quotes": [quote.to_dict() for quote in sample_quotes],
+            "summary": {"count": 2, "ratio": 0.125, "missing": None, "complete": True},
+            2023: "non-string key",
+        }
+
+        _dump_json(payload, tmp_path / "orjson.json", default=str)
+        orjson_text = _json_text(payload, default=str)
+        with patch('app.utils.export.orjson', None):
+            _dump_json(payload, tmp_path / "json.json", default=str)
+            json_text = _json_text(payload, default=str)
+
+        assert (tmp_path / "orjson.json").read_bytes() == (tmp_path / "json.json").read_bytes()
+        assert orjson_text == json_text
+
+    def test_json_text_documented_encoder_differences(self):
+        """Test the differences between the encoders listed in the _dump_json docstring."""
+        payload = {"name": "Nestlé", "yield": float("nan")}
+
+        orjson_text = _json_text(payload, default=str)
+        with patch('app.utils.export.orjson', None):
+            json_text = _json_text(payload, default=str)
+
+        assert '"Nestlé"' in orjson_text
+        assert '"Nestl\\u00e9"' in json_text
+        assert '"yield": null' in orjson_text
+        assert '"yield": NaN' in json_text
+        assert json.loads(orjson_text)["name"] == json.loads(json_text)["name"]